@@ -0,0 +1,167 @@
+"""End-to-end benchmark of LinkedInConnector against the local mock site
+
+Starts benchmarks/mock_linkedin.py on 127.0.0.1, drives a real LinkedInConnector through
+login and a people search in headless Chrome and reports startup, login, per-page and
+per-request latency. Needs Chrome and a matching ChromeDriver, but no network access.
+
+Usage:
+    python benchmarks/e2e_benchmark.py
+    python benchmarks/e2e_benchmark.py --lang both --max-requests 20 --skip-sleeps
+    python benchmarks/e2e_benchmark.py --limit-after 5 --json e2e.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import linkedAuto
+from mock_linkedin import MockLinkedInServer, TEXTS
+from tests.fake_webdriver import NoSleepTime
+
+
+def _summary(values):
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": statistics.mean(values),
+        "median": statistics.median(values),
+        "max": max(values)
+    }
+
+
+def instrument(connector):
+    """Wrap the page and modal steps of a connector to timestamp them"""
+    marks = {"pages": [], "sends": [], "modals": []}
+
+    scroll = connector._scroll_to_bottom_of_page
+    def timed_scroll(*args, **kwargs):
+        # Every processed results page starts with exactly one scroll pass
+        marks["pages"].append(time.perf_counter())
+        return scroll(*args, **kwargs)
+    connector._scroll_to_bottom_of_page = timed_scroll
+
+    handle_modal = connector._handle_connection_modal
+    def timed_modal(*args, **kwargs):
+        start = time.perf_counter()
+        result = handle_modal(*args, **kwargs)
+        marks["modals"].append(time.perf_counter() - start)
+        if result:
+            marks["sends"].append(time.perf_counter())
+        return result
+    connector._handle_connection_modal = timed_modal
+
+    return marks
+
+
+def run_scenario(lang, args):
+    """Run one login + search against a fresh mock server and return the measurements"""
+    with MockLinkedInServer(lang=lang, pages=args.pages, cards_per_page=args.cards_per_page,
+                            limit_after=args.limit_after, latency_ms=args.latency_ms) as server:
+        connector = linkedAuto.LinkedInConnector(headless=not args.visible, base_url=server.url,
+                                                 block_resources=args.block_resources,
+                                                 max_browser_rss_mb=args.max_browser_rss_mb)
+        connector.email = "benchmark@example.com"
+        connector.password = "benchmark"
+        marks = instrument(connector)
+        try:
+            start = time.perf_counter()
+            connector.initialize_browser()
+            startup_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if not connector.login():
+                raise RuntimeError("Login against the mock server failed")
+            login_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            sent = connector.send_connection_requests_from_search("python developer", args.max_requests)
+            end = time.perf_counter()
+        finally:
+            connector.close()
+
+        page_times = [later - earlier for earlier, later in zip(marks["pages"], marks["pages"][1:] + [end])]
+        request_marks = [marks["pages"][0] if marks["pages"] else start] + marks["sends"]
+        request_times = [later - earlier for earlier, later in zip(request_marks, request_marks[1:])]
+
+        return {
+            "lang": lang,
+            "startup_s": startup_time,
+            "login_s": login_time,
+            "search_s": end - start,
+            "requests_sent": sent,
+            "server": server.state.stats(),
+            "limit_reported": connector._limit_reported,
+            "page_s": _summary(page_times),
+            "request_s": _summary(request_times),
+            "modal_s": _summary(marks["modals"]),
+            "resources": connector.resource_stats,
+            "memory": connector.memory_stats
+        }
+
+
+def print_result(result):
+    print(f"\n=== {result['lang']} ===")
+    print(f"  browser startup : {result['startup_s']:.2f} s")
+    print(f"  login           : {result['login_s']:.2f} s")
+    print(f"  search total    : {result['search_s']:.2f} s")
+    print(f"  requests sent   : {result['requests_sent']} (server accepted {result['server']['invitations']}, "
+          f"rejected {result['server']['rejected_invitations']}, limit reported: {result['limit_reported']})")
+    for label, key in [("per page", "page_s"), ("per request", "request_s"), ("modal", "modal_s")]:
+        summary = result[key]
+        if summary["count"]:
+            print(f"  {label:<15} : n={summary['count']:<3} mean {summary['mean']:.2f} s, "
+                  f"median {summary['median']:.2f} s, max {summary['max']:.2f} s")
+    memory = result["memory"]
+    if memory["samples"]:
+        print(f"  browser memory  : peak {memory['peak_mb']:.0f} MB, last {memory['last_mb']:.0f} MB, "
+              f"{memory['recycles']} tab recycles")
+    resources = result["resources"]
+    print(f"  page traffic    : {resources['bytes'] / 1024:.0f} KB in {resources['requests']} requests, blocked "
+          f"{resources['blocked_images']} images / {resources['blocked_fonts']} fonts / {resources['blocked_media']} media")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LinkedInConnector against the local mock site.")
+    parser.add_argument("--lang", choices=sorted(TEXTS) + ["both"], default="both")
+    parser.add_argument("--max-requests", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--cards-per-page", type=int, default=10)
+    parser.add_argument("--limit-after", type=int, help="Make the mock show the weekly limit after N invitations.")
+    parser.add_argument("--latency-ms", type=int, default=0, help="Extra mock server latency per request.")
+    parser.add_argument("--skip-sleeps", action="store_true",
+                        help="Turn linkedAuto's human-like pauses into no-ops to measure pure driver time.")
+    parser.add_argument("--block-resources", action="store_true",
+                        help="Run the connector with images, fonts and media blocked.")
+    parser.add_argument("--max-browser-rss-mb", type=int,
+                        help="Recycle the browser tab above this much Chrome memory.")
+    parser.add_argument("--visible", action="store_true", help="Show the browser instead of running headless.")
+    parser.add_argument("--verbose", action="store_true", help="Print the connector's log output.")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    if args.skip_sleeps:
+        linkedAuto.time = NoSleepTime()
+    if args.verbose:
+        linkedAuto.logger.addHandler(logging.StreamHandler())
+        linkedAuto.logger.setLevel(logging.INFO)
+
+    langs = sorted(TEXTS) if args.lang == "both" else [args.lang]
+    results = [run_scenario(lang, args) for lang in langs]
+    for result in results:
+        print_result(result)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
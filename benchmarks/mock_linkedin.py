@@ -0,0 +1,458 @@
+"""Local stand-in for the parts of LinkedIn that LinkedAuto talks to
+
+Serves the login form (with wrong-password and checkpoint/2FA variants), a feed page,
+people-search results with lazy-loaded cards and pagination, the connect / add-note /
+send-without-note modals, the weekly limit popup and profile pages. Markup follows the
+selectors used by linkedAuto.py, in English or Turkish.
+
+Everything runs offline on 127.0.0.1. Start it on its own to poke at it in a browser:
+
+    python benchmarks/mock_linkedin.py --lang tr --pages 3 --limit-after 20
+
+Login with any email; the password "wrong" shows a credential error and "checkpoint"
+goes through the security check page first.
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from html import escape
+
+TEXTS = {
+    "en": {
+        "connect": "Connect", "add_note": "Add a note", "send_without_note": "Send without a note",
+        "send": "Send", "send_invitation": "Send invitation", "next": "Next", "previous": "Previous",
+        "dismiss": "Dismiss", "got_it": "Got it", "pending": "Pending", "follow": "Follow", "message": "Message",
+        "sign_in": "Sign in", "verify": "Verify", "wrong_password": "Wrong password. Please try again.",
+        "limit": "You've reached the weekly invitation limit. Please try again next week.",
+        "no_results": "No results found", "first_degree": "1st degree connection",
+        "modal_title": "Add a note to your invitation?", "feed": "Home feed"
+    },
+    "tr": {
+        "connect": "Bağlantı kur", "add_note": "Not ekle", "send_without_note": "Not olmadan gönderin",
+        "send": "Gönder", "send_invitation": "Daveti Gönder", "next": "Sonraki", "previous": "Önceki",
+        "dismiss": "Kapat", "got_it": "Anladım", "pending": "Beklemede", "follow": "Takip et", "message": "Mesaj",
+        "sign_in": "Oturum aç", "verify": "Doğrula", "wrong_password": "Hatalı şifre. Lütfen tekrar deneyin.",
+        "limit": "Haftalık davet sınırına ulaştınız. Lütfen gelecek hafta tekrar deneyin.",
+        "no_results": "Sonuç bulunamadı", "first_degree": "1. derece bağlantı",
+        "modal_title": "Davetinize not eklemek ister misiniz?", "feed": "Ana sayfa"
+    }
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="__LANG__">
+<head><meta charset="utf-8"><title>__TITLE__</title>
+<style>
+  body { font-family: sans-serif; margin: 0; }
+  .artdeco-modal__overlay { position: fixed; inset: 0; background: rgba(0,0,0,.4); }
+  .artdeco-modal { position: fixed; top: 20%; left: 30%; width: 40%; background: #fff; padding: 16px; }
+  li.reusable-search__result-container { height: 180px; border-bottom: 1px solid #ddd; list-style: none; }
+</style>
+</head>
+<body>
+__BODY__
+</body>
+</html>
+"""
+
+# Shared client-side behaviour: the connection modal, invite submission and the limit popup
+MODAL_SCRIPT = """
+<script>
+var T = __TEXTS__;
+function closeModal() {
+  var overlay = document.getElementById('mock-modal');
+  if (overlay) overlay.remove();
+}
+function showLimitModal() {
+  closeModal();
+  var overlay = document.createElement('div');
+  overlay.id = 'mock-modal';
+  overlay.className = 'artdeco-modal__overlay artdeco-modal__overlay--is-current';
+  overlay.innerHTML =
+    '<div class="artdeco-modal artdeco-modal--layer-default" role="alertdialog">' +
+      '<div class="artdeco-modal__content"><p>' + T.limit + '</p>' +
+        '<button class="artdeco-modal__dismiss" aria-label="' + T.dismiss + '">&times;</button>' +
+        '<button class="artdeco-button">' + T.got_it + '</button>' +
+      '</div>' +
+    '</div>';
+  overlay.querySelectorAll('button').forEach(function (b) { b.addEventListener('click', closeModal); });
+  document.body.appendChild(overlay);
+}
+function sendInvite(button, urn, note) {
+  closeModal();
+  fetch('/api/invite', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                        body: JSON.stringify({urn: urn, note: note || ''})})
+    .then(function (r) { return r.json(); })
+    .then(function (result) {
+      if (!result.accepted) { showLimitModal(); return; }
+      button.disabled = true;
+      button.querySelector('span').textContent = T.pending;
+    });
+}
+function openConnectModal(button, urn) {
+  closeModal();
+  var overlay = document.createElement('div');
+  overlay.id = 'mock-modal';
+  overlay.className = 'artdeco-modal__overlay artdeco-modal__overlay--is-current';
+  overlay.innerHTML =
+    '<div class="artdeco-modal artdeco-modal--layer-default" role="dialog">' +
+      '<button class="artdeco-modal__dismiss" aria-label="' + T.dismiss + '">&times;</button>' +
+      '<div class="artdeco-modal__content"><h2>' + T.modal_title + '</h2></div>' +
+      '<div class="artdeco-modal__actionbar">' +
+        '<button class="artdeco-button--secondary" aria-label="' + T.add_note + '"><span>' + T.add_note + '</span></button>' +
+        '<button class="artdeco-button--primary" aria-label="' + T.send_without_note + '"><span>' + T.send_without_note + '</span></button>' +
+      '</div>' +
+    '</div>';
+  var buttons = overlay.querySelectorAll('.artdeco-modal__actionbar button');
+  overlay.querySelector('.artdeco-modal__dismiss').addEventListener('click', closeModal);
+  buttons[1].addEventListener('click', function () {
+    setTimeout(function () { sendInvite(button, urn, ''); }, __MODAL_DELAY__);
+  });
+  buttons[0].addEventListener('click', function () {
+    var actionbar = overlay.querySelector('.artdeco-modal__actionbar');
+    setTimeout(function () {
+      actionbar.innerHTML =
+        '<textarea id="custom-message" name="message" maxlength="300"></textarea>' +
+        '<button class="artdeco-button--primary" aria-label="' + T.send_invitation + '"><span>' + T.send + '</span></button>';
+      actionbar.querySelector('button').addEventListener('click', function () {
+        sendInvite(button, urn, actionbar.querySelector('textarea').value);
+      });
+    }, __MODAL_DELAY__);
+  });
+  document.body.appendChild(overlay);
+}
+</script>
+"""
+
+SEARCH_SCRIPT = """
+<script>
+var CARDS = __CARDS__;
+var BATCH = __BATCH__;
+var rendered = 0;
+var loading = false;
+function renderCard(card) {
+  var li = document.createElement('li');
+  li.className = 'reusable-search__result-container';
+  var action = card.kind === 'connect' ? T.connect : (card.kind === 'pending' ? T.pending :
+               (card.kind === 'follow' ? T.follow : T.message));
+  li.innerHTML =
+    '<div data-chameleon-result-urn="' + card.urn + '">' +
+      '<a class="app-aware-link" href="/in/' + card.slug + '/?miniProfileUrn=' + encodeURIComponent(card.urn) + '">' +
+        '<span class="entity-result__title-text">' + card.name + '</span></a>' +
+      '<div class="entity-result__primary-subtitle">' + card.headline + '</div>' +
+      '<div class="entity-result__secondary-subtitle">' + card.location + '</div>' +
+      '<button class="artdeco-button"' + (card.kind === 'pending' ? ' disabled' : '') + '><span>' + action + '</span></button>' +
+    '</div>';
+  if (card.kind === 'connect') {
+    var button = li.querySelector('button');
+    button.addEventListener('click', function () {
+      setTimeout(function () { openConnectModal(button, card.urn); }, __MODAL_DELAY__);
+    });
+  }
+  document.getElementById('results').appendChild(li);
+}
+function renderBatch() {
+  var end = Math.min(CARDS.length, rendered + BATCH);
+  for (; rendered < end; rendered++) renderCard(CARDS[rendered]);
+  loading = false;
+}
+window.addEventListener('scroll', function () {
+  if (loading || rendered >= CARDS.length) return;
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) {
+    loading = true;
+    setTimeout(renderBatch, __LAZY_DELAY__);
+  }
+});
+renderBatch();
+</script>
+"""
+
+
+class MockLinkedInState:
+    """Configuration and counters shared by all request handlers"""
+
+    def __init__(self, lang="en", pages=3, cards_per_page=10, batch_size=4, lazy_delay_ms=300,
+                 modal_delay_ms=150, limit_after=None, latency_ms=0):
+        self.lang = lang
+        self.texts = TEXTS[lang]
+        self.pages = pages
+        self.cards_per_page = cards_per_page
+        self.batch_size = batch_size
+        self.lazy_delay_ms = lazy_delay_ms
+        self.modal_delay_ms = modal_delay_ms
+        self.limit_after = limit_after
+        self.latency_ms = latency_ms
+        self.lock = threading.Lock()
+        self.invitations = []
+        self.rejected_invitations = 0
+        self.requests_served = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "invitations": len(self.invitations),
+                "rejected_invitations": self.rejected_invitations,
+                "requests_served": self.requests_served
+            }
+
+
+def _card_for(page, index):
+    """Deterministic result card: mostly Connect, with some Follow, Pending and 1st-degree ones"""
+    number = (page - 1) * 100 + index
+    if index % 7 == 3:
+        kind = "follow"
+    elif index % 11 == 5:
+        kind = "pending"
+    elif index % 13 == 8:
+        kind = "message"
+    else:
+        kind = "connect"
+    return {
+        "urn": f"urn:li:member:{number}",
+        "slug": f"mock-person-{number}",
+        "name": f"Mock Person {number}",
+        "headline": ["Python Developer", "Data Scientist", "Recruiter", "Security Engineer"][number % 4],
+        "location": ["Istanbul, Türkiye", "Berlin, Germany", "Remote", "London, United Kingdom"][number % 4],
+        "kind": kind
+    }
+
+
+class MockLinkedInHandler(BaseHTTPRequestHandler):
+    """Routes requests to the login, feed, search and profile pages"""
+
+    server_version = "MockLinkedIn/1.0"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def _count_request(self):
+        with self.state.lock:
+            self.state.requests_served += 1
+        if self.state.latency_ms:
+            time.sleep(self.state.latency_ms / 1000)
+
+    def _logged_in(self):
+        return "li_at=mock" in (self.headers.get("Cookie") or "")
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location, headers=None):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _page(self, title, body, scripts=""):
+        html = PAGE_TEMPLATE.replace("__LANG__", self.state.lang).replace("__TITLE__", escape(title))
+        shared = MODAL_SCRIPT.replace("__TEXTS__", json.dumps(self.state.texts, ensure_ascii=False))
+        shared = shared.replace("__MODAL_DELAY__", str(self.state.modal_delay_ms))
+        return html.replace("__BODY__", body + shared + scripts)
+
+    def do_GET(self):
+        self._count_request()
+        url = urlparse(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = parse_qs(url.query)
+
+        if path == "/login":
+            return self._send(200, self._login_page())
+        if path.startswith("/checkpoint"):
+            return self._send(200, self._checkpoint_page())
+        if path == "/api/stats":
+            return self._send(200, json.dumps(self.state.stats()), "application/json")
+        if not self._logged_in():
+            return self._redirect("/login")
+        if path == "/feed":
+            return self._send(200, self._page("Feed", f"<main><h1>{self.state.texts['feed']}</h1></main>"))
+        if path == "/search/results/people":
+            keywords = query.get("keywords", [""])[0]
+            page = int(query.get("page", ["1"])[0] or 1)
+            return self._send(200, self._search_page(keywords, page))
+        if path.startswith("/in/"):
+            return self._send(200, self._profile_page(path.split("/")[2]))
+        return self._send(404, self._page("Not found", "<h1>404</h1>"))
+
+    def do_POST(self):
+        self._count_request()
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        path = urlparse(self.path).path.rstrip("/")
+
+        if path == "/login":
+            form = parse_qs(body)
+            password = form.get("session_password", [""])[0]
+            if password == "wrong":
+                return self._send(200, self._login_page(error=True))
+            if password == "checkpoint":
+                return self._redirect("/checkpoint/challenge/")
+            return self._redirect("/feed/", {"Set-Cookie": "li_at=mock; Path=/"})
+        if path.startswith("/checkpoint"):
+            return self._redirect("/feed/", {"Set-Cookie": "li_at=mock; Path=/"})
+        if path == "/api/invite":
+            invite = json.loads(body or "{}")
+            with self.state.lock:
+                accepted = self.state.limit_after is None or len(self.state.invitations) < self.state.limit_after
+                if accepted:
+                    self.state.invitations.append(invite)
+                else:
+                    self.state.rejected_invitations += 1
+            return self._send(200, json.dumps({"accepted": accepted}), "application/json")
+        if path == "/api/reset":
+            with self.state.lock:
+                self.state.invitations = []
+                self.state.rejected_invitations = 0
+                self.state.requests_served = 0
+            return self._send(200, "{}", "application/json")
+        return self._send(404, "{}", "application/json")
+
+    def _login_page(self, error=False):
+        texts = self.state.texts
+        error_html = f'<div id="error-for-password" role="alert">{texts["wrong_password"]}</div>' if error else ""
+        body = f"""
+<form method="post" action="/login">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  {error_html}
+  <button type="submit" class="btn__primary--large">{texts["sign_in"]}</button>
+</form>"""
+        return self._page("Login", body)
+
+    def _checkpoint_page(self):
+        body = f"""
+<form method="post" action="/checkpoint/challenge/">
+  <input id="input__email_verification_pin" name="pin" type="text">
+  <button type="submit">{self.state.texts["verify"]}</button>
+</form>"""
+        return self._page("Security Verification", body)
+
+    def _search_page(self, keywords, page):
+        texts = self.state.texts
+        if "zzz-none" in keywords or page > self.state.pages:
+            return self._page("Search", f'<main><h2>{texts["no_results"]}</h2></main>')
+
+        cards = [_card_for(page, index) for index in range(self.state.cards_per_page)]
+        pages = "".join(
+            f'<li class="artdeco-pagination__indicator{" active selected" if number == page else ""}">'
+            f'<button aria-label="{number}" onclick="goToPage({number})"><span>{number}</span></button></li>'
+            for number in range(1, self.state.pages + 1)
+        )
+        next_disabled = " disabled" if page >= self.state.pages else ""
+        body = f"""
+<main>
+  <h1>{escape(keywords)}</h1>
+  <ul id="results" class="reusable-search__entity-result-list"></ul>
+  <div class="artdeco-pagination">
+    <button aria-label="{texts["previous"]}" onclick="goToPage({page - 1})"{" disabled" if page == 1 else ""}><span>{texts["previous"]}</span></button>
+    <ul>{pages}</ul>
+    <button aria-label="{texts["next"]}" onclick="goToPage({page + 1})"{next_disabled}><span>{texts["next"]}</span></button>
+  </div>
+</main>
+<script>
+function goToPage(number) {{
+  var url = new URL(window.location.href);
+  url.searchParams.set('page', number);
+  window.location.href = url.toString();
+}}
+</script>"""
+        scripts = SEARCH_SCRIPT.replace("__CARDS__", json.dumps(cards, ensure_ascii=False))
+        scripts = scripts.replace("__BATCH__", str(self.state.batch_size))
+        scripts = scripts.replace("__LAZY_DELAY__", str(self.state.lazy_delay_ms))
+        scripts = scripts.replace("__MODAL_DELAY__", str(self.state.modal_delay_ms))
+        return self._page("Search", body, scripts)
+
+    def _profile_page(self, slug):
+        texts = self.state.texts
+        if slug.endswith("-pending"):
+            actions = f'<button class="artdeco-button--primary" disabled><span>{texts["pending"]}</span></button>'
+        elif slug.endswith("-connected"):
+            actions = (f'<span class="dist-value">{texts["first_degree"]}</span>'
+                       f'<button class="artdeco-button--primary"><span>{texts["message"]}</span></button>')
+        else:
+            actions = f'<button class="artdeco-button artdeco-button--primary"><span>{texts["connect"]}</span></button>'
+        body = f"""
+<main>
+  <h1>{escape(slug)}</h1>
+  <div class="pvs-profile-actions">{actions}</div>
+</main>
+<script>
+document.querySelectorAll('.pvs-profile-actions button:not([disabled])').forEach(function (button) {{
+  if (button.textContent.trim() !== T.connect) return;
+  button.addEventListener('click', function () {{
+    setTimeout(function () {{ openConnectModal(button, 'urn:li:member:{escape(slug)}'); }}, {self.state.modal_delay_ms});
+  }});
+}});
+</script>"""
+        return self._page("Profile", body)
+
+
+class MockLinkedInServer:
+    """Runs the mock site on a background thread; use as a context manager"""
+
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.state = MockLinkedInState(**options)
+        self.httpd = ThreadingHTTPServer((host, port), MockLinkedInHandler)
+        self.httpd.state = self.state
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for LinkedIn.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--lang", choices=sorted(TEXTS), default="en")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--cards-per-page", type=int, default=10)
+    parser.add_argument("--limit-after", type=int, help="Show the weekly limit popup after this many invitations.")
+    parser.add_argument("--latency-ms", type=int, default=0, help="Extra server latency per request.")
+    args = parser.parse_args()
+
+    server = MockLinkedInServer(port=args.port, lang=args.lang, pages=args.pages,
+                                cards_per_page=args.cards_per_page, limit_after=args.limit_after,
+                                latency_ms=args.latency_ms)
+    print(f"Mock LinkedIn ({args.lang}) listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
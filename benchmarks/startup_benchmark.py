@@ -0,0 +1,111 @@
+"""Startup benchmark for LinkedAuto
+
+Measures how long it takes to import linkedAuto (via python -X importtime) and to
+print the --help screen, so regressions in startup cost are easy to spot.
+
+Usage:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --runs 10 --max-import-ms 150 --max-help-ms 400
+    python benchmarks/startup_benchmark.py --json startup.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Lines look like: "import time:       123 |       4567 |   linkedAuto"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_import(top=10):
+    """Run one -X importtime import of linkedAuto and return (total_ms, heaviest modules)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import linkedAuto"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    modules = []
+    pending = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        # Nested imports are printed before their parent, so everything collected since the
+        # previous top-level entry belongs to the one closing it. Interpreter startup
+        # (site, encodings, ...) is discarded this way.
+        if len(indent) > 1:
+            pending.append((name, int(self_us), int(cumulative_us)))
+            continue
+        if name == "linkedAuto":
+            total_us = int(cumulative_us)
+            modules = pending
+        pending = []
+    heaviest = sorted(modules, key=lambda module: module[2], reverse=True)[:top]
+    return total_us / 1000, heaviest
+
+
+def measure_help():
+    """Return the wall time in ms of `python linkedAuto.py --help`"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "linkedAuto.py", "--help"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure LinkedAuto import and --help latency.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per measurement (default: 5).")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if the median import time exceeds this.")
+    parser.add_argument("--max-help-ms", type=float, help="Fail if the median --help time exceeds this.")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    import_times = []
+    heaviest = []
+    for _ in range(args.runs):
+        total_ms, heaviest = measure_import()
+        import_times.append(total_ms)
+    help_times = [measure_help() for _ in range(args.runs)]
+
+    results = {
+        "runs": args.runs,
+        "import_ms": {"median": statistics.median(import_times), "min": min(import_times)},
+        "help_ms": {"median": statistics.median(help_times), "min": min(help_times)},
+        "heaviest_imports": [
+            {"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+            for name, self_us, cumulative_us in heaviest
+        ]
+    }
+
+    print(f"import linkedAuto : median {results['import_ms']['median']:.1f} ms, min {results['import_ms']['min']:.1f} ms")
+    print(f"linkedAuto --help : median {results['help_ms']['median']:.1f} ms, min {results['help_ms']['min']:.1f} ms")
+    print("\nHeaviest imports (cumulative):")
+    for module in results["heaviest_imports"]:
+        print(f"  {module['cumulative_ms']:8.1f} ms  {module['module']}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    failed = False
+    if args.max_import_ms is not None and results["import_ms"]["median"] > args.max_import_ms:
+        print(f"\nFAIL: import time above {args.max_import_ms} ms")
+        failed = True
+    if args.max_help_ms is not None and results["help_ms"]["median"] > args.max_help_ms:
+        print(f"\nFAIL: --help time above {args.max_help_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,22 +5,46 @@ import sys
 import time
 import random
 import logging
+import logging.handlers
+import queue
+import atexit
 import argparse
 import getpass
+import re
+import json
+import csv
+import sqlite3
+import hashlib
+import base64
+import binascii
+import functools
+import contextlib
+from datetime import datetime, timezone
+from urllib.parse import urlparse, unquote, urlencode, quote
 from colorama import init, Fore, Style
-from pyfiglet import Figlet
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from webdriver_manager.chrome import ChromeDriverManager
-
-# Initialize colorama
-init()
+
+# Selenium is imported lazily by _load_selenium() so that --help and plain imports of
+# this module stay fast; these names are filled in on first use.
+webdriver = By = Keys = Service = Options = WebDriverWait = EC = None
+TimeoutException = NoSuchElementException = ElementClickInterceptedException = ElementNotInteractableException = None
+
+logger = logging.getLogger("linkedauto")
+
+def _load_selenium():
+    """Import selenium on first use and publish its names at module level."""
+    global webdriver, By, Keys, Service, Options, WebDriverWait, EC
+    global TimeoutException, NoSuchElementException, ElementClickInterceptedException, ElementNotInteractableException
+    if webdriver is not None:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import (TimeoutException, NoSuchElementException,
+                                            ElementClickInterceptedException, ElementNotInteractableException)
 
 # Custom formatter for colored logging
 class ColoredFormatter(logging.Formatter):
@@ -35,24 +59,75 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
-        # Add color to the level name
+        # Color the level name on a copy; the record is shared with the file handler
         if record.levelname in self.COLORS:
+            record = logging.makeLogRecord(record.__dict__)
             record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{Style.RESET_ALL}"
         return super().format(record)
 
-# Set up logging with colors
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('linkedin_bot.log', mode='a', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object, including the structured fields passed via extra="""
+
+    FIELDS = ('phase', 'keyword', 'page', 'card_id', 'profile_url', 'duration', 'requests_sent')
 
-# Apply colored formatter to console handler
-console_handler = logging.getLogger().handlers[1]
-console_handler.setFormatter(ColoredFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        for field in self.FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a listener running in the same process.
+
+    The stock prepare() formats the whole record, traceback included, into the message and
+    drops exc_info so the record can be pickled. Here it only merges the arguments into the
+    message and keeps exc_info, so each handler formats the traceback itself (the JSON
+    formatter puts it in its "exception" field).
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def setup_logging(log_file='linkedin_bot.log', log_format='text', max_bytes=5 * 1024 * 1024, backup_count=5):
+    """Attach the file and colored console handlers; called by main(), never on import.
+
+    Log calls only put the record on a queue. A background listener thread formats it and
+    writes it to the console and to a size-rotated log file, so the bot never waits on disk.
+
+    Args:
+        log_file (str): Path of the log file
+        log_format (str): 'text' for the classic format or 'json' for JSON lines in the file
+        max_bytes (int): Rotate the log file once it reaches this size
+        backup_count (int): Number of rotated files to keep
+    """
+    text_format = '%(asctime)s - %(levelname)s - %(message)s'
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    file_handler = logging.handlers.RotatingFileHandler(log_file, mode='a', maxBytes=max_bytes,
+                                                        backupCount=backup_count, encoding='utf-8')
+    file_handler.setFormatter(JsonLinesFormatter() if log_format == 'json' else logging.Formatter(text_format))
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(ColoredFormatter(text_format))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued when the interpreter exits, including via sys.exit()
+    atexit.register(listener.stop)
+
+    logger.handlers = [LocalQueueHandler(log_queue)]
+    return listener
 
 # Add colored print functions
 def print_success(message):
@@ -70,25 +145,1107 @@ def print_info(message):
 def print_highlight(message):
     print(f"{Style.BRIGHT}{message}{Style.RESET_ALL}")
 
+# Locale packs (<language code>.json) holding the page phrases the bot reacts to and the
+# selector candidates that depend on UI text, one file per LinkedIn interface language.
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+
+# Language-neutral selector candidates for every element the bot clicks or types into, one
+# entry per logical target. Candidates are (kind, query) pairs with kind "css" or "xpath",
+# cheapest first; the active locale pack appends its text-based candidates after these.
+# XPaths starting with "." are evaluated relative to the lookup scope (usually the open modal).
+SELECTORS = {
+    "login_button": [("css", "button[type='submit']")],
+    "modal": [
+        ("css", "div.artdeco-modal--layer-default"),
+        ("css", "div.artdeco-modal[role='dialog']")
+    ],
+    "note_field": [
+        ("css", "textarea#custom-message"),
+        ("css", "textarea[name='message']"),
+        ("css", "textarea[class*='message']")
+    ],
+    "send": [("css", ".artdeco-modal__actionbar button.artdeco-button--primary")],
+    "next_page": [("css", "li.active + li > button:not([disabled]), li.selected + li > button:not([disabled])")],
+    "dismiss": [("css", "button.artdeco-modal__dismiss")],
+    "error_toast": [("css", ".artdeco-toast-item--error, [data-test-artdeco-toast-item-type='error']")],
+    "modal_overlay": [("css", ".artdeco-modal__overlay--is-current")]
+}
+
+def load_locale_packs(directory=LOCALES_DIR):
+    """Read every locale pack in directory
+    
+    Returns:
+        dict: Mapping of language code to pack, each with "phrases" and "selectors" sections
+    """
+    packs = {}
+    for name in sorted(os.listdir(directory)):
+        code, extension = os.path.splitext(name)
+        if extension == '.json':
+            with open(os.path.join(directory, name), encoding='utf-8') as pack_file:
+                packs[code.lower()] = json.load(pack_file)
+    return packs
+
+def merge_locale_packs(packs):
+    """Combine locale packs into a generic pack matching any of their languages"""
+    merged = {'phrases': {}, 'selectors': {}}
+    for pack in packs.values():
+        for section, entries in merged.items():
+            for key, values in pack.get(section, {}).items():
+                bucket = entries.setdefault(key, [])
+                bucket.extend(value for value in values if value not in bucket)
+    return merged
+
+class PhraseMatcher:
+    """Finds every phrase category present in a text with a single regex pass.
+
+    Text is folded with fold() before matching so that the Turkish dotted/dotless
+    i (İ, I, ı, i) compare equal regardless of the case the page renders them in.
+    The pattern also runs in the browser on text folded by toLowerCase(), so fold()
+    lowercases the same way instead of casefolding (which turns ß into ss).
+    """
+
+    _FOLD_TABLE = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+
+    def __init__(self, registry):
+        """Compile the registry into one alternation regex
+        
+        Args:
+            registry (dict): Mapping of category name to a list of phrases
+        """
+        phrase_categories = {}
+        for category, phrases in registry.items():
+            for phrase in phrases:
+                phrase_categories.setdefault(self.fold(phrase), set()).add(category)
+
+        # A hit on a long phrase also counts for every shorter phrase it contains, since
+        # the regex consumes the longest alternative and never reports the inner one.
+        self.lookup = {}
+        for phrase in phrase_categories:
+            categories = set()
+            for other, other_categories in phrase_categories.items():
+                if other in phrase:
+                    categories |= other_categories
+            self.lookup[phrase] = sorted(categories)
+
+        self.pattern = "|".join(re.escape(p) for p in sorted(self.lookup, key=len, reverse=True))
+        self._regex = re.compile(self.pattern)
+
+    @classmethod
+    def fold(cls, text):
+        """Lowercase text like JavaScript's toLowerCase(), treating the Turkish dotted and dotless i as a plain i."""
+        return (text or "").translate(cls._FOLD_TABLE).lower()
+
+    def match(self, text):
+        """Return the set of categories with at least one phrase in text."""
+        hits = set()
+        for found in self._regex.finditer(self.fold(text)):
+            hits.update(self.lookup[found.group(0)])
+        return hits
+
+def normalize_profile_url(profile_url):
+    """Return the canonical https://www.linkedin.com/in/<slug>/ form of a profile URL, or None"""
+    if not profile_url:
+        return None
+    parsed = urlparse(profile_url.strip())
+    parts = [part for part in parsed.path.split('/') if part]
+    if len(parts) < 2 or parts[0] != 'in':
+        return None
+    return f"https://www.linkedin.com/in/{unquote(parts[1]).lower()}/"
+
+def process_tree_rss(root_pid):
+    """Return the summed resident memory in bytes of every descendant of root_pid.
+
+    Reads /proc, so it only works on Linux; returns None elsewhere or if root_pid is gone.
+    Pages shared between the processes are counted once per process, so the total is an
+    upper bound, which is the safe side for an out-of-memory guard.
+    """
+    try:
+        pids = [int(name) for name in os.listdir('/proc') if name.isdigit()]
+    except OSError:
+        return None
+    children = {}
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat', encoding='utf-8') as stat_file:
+                # The command name may contain spaces and parentheses, so split after its closing one
+                parent = int(stat_file.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(pid)
+    if root_pid not in pids:
+        return None
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/statm', encoding='utf-8') as statm_file:
+                total += int(statm_file.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+class EncryptedCookieJar:
+    """Browser cookies kept between runs in a file encrypted with a passphrase.
+
+    The key is derived from the passphrase with scrypt and a random salt stored with the
+    Fernet token (AES-128-CBC plus HMAC-SHA256), so the file is useless without the
+    passphrase. Needs the cryptography package, imported only when a jar is used.
+    """
+
+    def __init__(self, path, passphrase):
+        """Prepare (but do not read) the cookie file
+        
+        Args:
+            path (str): File the encrypted cookies are read from and written to
+            passphrase (str): Secret the encryption key is derived from
+            
+        Raises:
+            ValueError: The passphrase is empty or cryptography is not installed
+        """
+        if not passphrase:
+            raise ValueError("An encrypted session file needs a key (LINKEDAUTO_SESSION_KEY).")
+        try:
+            import cryptography.fernet  # noqa: F401
+        except ImportError:
+            raise ValueError("An encrypted session file needs the cryptography package "
+                             "(pip install cryptography).") from None
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.passphrase = passphrase
+
+    def _fernet(self, salt):
+        from cryptography.fernet import Fernet
+        key = hashlib.scrypt(self.passphrase.encode('utf-8'), salt=salt, n=2 ** 14, r=8, p=1, dklen=32)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def load(self):
+        """Return the saved cookies, or None when nothing has been saved yet
+        
+        Raises:
+            ValueError: The file is damaged or was encrypted with another key
+        """
+        from cryptography.fernet import InvalidToken
+        try:
+            with open(self.path, encoding='utf-8') as jar_file:
+                data = json.load(jar_file)
+        except FileNotFoundError:
+            return None
+        try:
+            payload = self._fernet(base64.b64decode(data['salt'])).decrypt(data['token'].encode('ascii'))
+        except (InvalidToken, KeyError, TypeError, AttributeError, binascii.Error):
+            raise ValueError(f"Session file {self.path} cannot be decrypted with this key.") from None
+        return json.loads(payload)
+
+    def save(self, cookies):
+        """Encrypt and write the cookies atomically to a file readable by the owner only"""
+        salt = os.urandom(16)
+        token = self._fernet(salt).encrypt(json.dumps(cookies).encode('utf-8'))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as jar_file:
+            json.dump({'version': 1, 'salt': base64.b64encode(salt).decode('ascii'),
+                       'token': token.decode('ascii')}, jar_file)
+        os.replace(temp_path, self.path)
+
+class InvitationLedger:
+    """SQLite record of the profiles already contacted, shared across runs.
+
+    Rows are keyed by the normalized profile URL (the primary key doubles as the lookup
+    index) and every write is its own transaction, so an interrupted run never leaves
+    a half-written entry behind.
+    """
+
+    # Statuses that mean there is nothing left to do for a profile
+    DONE_STATUSES = ('sent', 'pending', 'connected')
+
+    def __init__(self, path):
+        """Open (and create if needed) the ledger database
+        
+        Args:
+            path (str): Path of the SQLite database file
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS invitations ("
+                "profile_url TEXT PRIMARY KEY, "
+                "status TEXT NOT NULL, "
+                "keyword TEXT, "
+                "updated_at TEXT NOT NULL)"
+            )
+
+    def status(self, profile_url):
+        """Return the recorded status of a profile, or None if it was never seen"""
+        key = normalize_profile_url(profile_url)
+        if not key:
+            return None
+        row = self.connection.execute("SELECT status FROM invitations WHERE profile_url = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, profile_url):
+        """Return True if a request was already sent or the profile needs none"""
+        return self.status(profile_url) in self.DONE_STATUSES
+
+    def record(self, profile_url, status, keyword=None):
+        """Insert or update the status of a profile"""
+        key = normalize_profile_url(profile_url)
+        if not key:
+            return
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO invitations (profile_url, status, keyword, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(profile_url) DO UPDATE SET status = excluded.status, "
+                "keyword = COALESCE(excluded.keyword, invitations.keyword), updated_at = excluded.updated_at",
+                (key, status, keyword, datetime.now(timezone.utc).isoformat(timespec='seconds'))
+            )
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+# Connection degrees accepted by --network, mapped to LinkedIn's network facet values
+NETWORK_DEGREES = {'1': 'F', '1st': 'F', 'f': 'F', '2': 'S', '2nd': 'S', 's': 'S',
+                   '3': 'O', '3rd': 'O', '3rd+': 'O', 'o': 'O'}
+
+def parse_search_filters(network=None, geo_urn=None, current_company=None):
+    """Turn comma separated facet options into the filters build_search_url encodes
+    
+    Args:
+        network (str, optional): Connection degrees, e.g. "2,3"
+        geo_urn (str, optional): LinkedIn location ids, e.g. "103644278,102299470"
+        current_company (str, optional): LinkedIn company ids
+        
+    Returns:
+        dict: Facet name to list of values, only for the facets given
+        
+    Raises:
+        ValueError: A degree is unknown or an id is not numeric
+    """
+    def split(value):
+        return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+    filters = {}
+    degrees = []
+    for degree in split(network):
+        if degree.lower() not in NETWORK_DEGREES:
+            raise ValueError(f"unknown network degree '{degree}' (use 1, 2 or 3)")
+        if NETWORK_DEGREES[degree.lower()] not in degrees:
+            degrees.append(NETWORK_DEGREES[degree.lower()])
+    if degrees:
+        filters['network'] = degrees
+    for facet, value in (('geoUrn', geo_urn), ('currentCompany', current_company)):
+        ids = split(value)
+        for item in ids:
+            if not item.isdigit():
+                raise ValueError(f"{facet} ids must be numeric, not '{item}'")
+        if ids:
+            filters[facet] = ids
+    return filters
+
+def build_search_url(base_url, keywords, page=1, filters=None):
+    """Return the URL of a people search results page
+    
+    Args:
+        base_url (str): Site root without a trailing slash
+        keywords (str): Search keywords, encoded as UTF-8 with every reserved character escaped
+        page (int): Results page to open directly (1-based)
+        filters (dict, optional): Search facets from parse_search_filters, applied server-side
+    """
+    params = [('keywords', keywords)]
+    for facet, values in (filters or {}).items():
+        # LinkedIn takes facet values as a JSON list, e.g. network=["S","O"]
+        params.append((facet, json.dumps(values, separators=(',', ':'))))
+    if filters:
+        params.append(('origin', 'FACETED_SEARCH'))
+    if page > 1:
+        params.append(('page', page))
+    return f"{base_url}/search/results/people/?{urlencode(params, quote_via=quote)}"
+
+def iter_profile_urls(path):
+    """Yield the normalized, deduplicated profile URLs of a CSV or plain text file, row by row.
+
+    The first cell of each row that links to a /in/ profile is used, so header rows, extra
+    columns and blank lines need no configuration.
+    """
+    seen = set()
+    with open(path, encoding='utf-8-sig', newline='') as urls_file:
+        for row in csv.reader(urls_file):
+            for cell in row:
+                if '/in/' not in cell:
+                    continue
+                profile_url = normalize_profile_url(cell[cell.index('/in/'):])
+                if profile_url and profile_url not in seen:
+                    seen.add(profile_url)
+                    yield profile_url
+                break
+
+class ProfileResults:
+    """Append-only CSV with the outcome of every profile handled in --profiles-file mode.
+
+    Each row is flushed as soon as it is written, so after an interruption the file lists
+    exactly the profiles that are done and a restart can skip them. Failed profiles are
+    logged too but tried again on the next run.
+    """
+
+    FIELDS = ('profile_url', 'status', 'processed_at')
+
+    def __init__(self, path):
+        """Prepare (but do not read) the results file
+        
+        Args:
+            path (str): CSV file the results are appended to
+        """
+        self.path = path
+        self.processed = set()
+        self._file = None
+        self._writer = None
+
+    def load(self):
+        """Read the profiles finished by earlier runs; returns how many there are"""
+        try:
+            with open(self.path, encoding='utf-8', newline='') as results_file:
+                for row in csv.DictReader(results_file):
+                    if row.get('profile_url') and row.get('status') != 'failed':
+                        self.processed.add(row['profile_url'])
+        except OSError:
+            pass
+        return len(self.processed)
+
+    def record(self, profile_url, status):
+        """Append the outcome of one profile"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._file = open(self.path, 'a', encoding='utf-8', newline='')
+            self._writer = csv.writer(self._file)
+            if write_header:
+                self._writer.writerow(self.FIELDS)
+        self._writer.writerow((profile_url, status, datetime.now(timezone.utc).isoformat(timespec='seconds')))
+        self._file.flush()
+        if status != 'failed':
+            self.processed.add(profile_url)
+
+    def close(self):
+        """Close the results file"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+class CardRules:
+    """Include/exclude rules on the name, headline and location of search result cards.
+
+    A rules file holds an "include" and an "exclude" list; every rule names a field and
+    either a "regex" or a list of "keywords". A card is kept when no exclude rule matches
+    it and, if there are include rules, at least one of them does. The rules are checked
+    and turned into JavaScript regex sources once, here; SEARCH_CARDS_SNAPSHOT_JS then
+    evaluates all of them against every card in the same call that collects the buttons.
+
+    Card text is folded like PhraseMatcher phrases, so keywords and regexes match the
+    Turkish dotted and dotless i in any case; regexes are also case-insensitive.
+    """
+
+    FIELDS = ('name', 'headline', 'location')
+
+    # Compiles every rule with the browser's own RegExp and returns [[index, error], ...]
+    # for the ones it rejects
+    VALIDATE_JS = """
+        var errors = [];
+        for (var i = 0; i < arguments[0].length; i++) {
+            try {
+                new RegExp(arguments[0][i][2], 'i');
+            } catch (e) {
+                errors.push([i, String(e.message || e)]);
+            }
+        }
+        return errors;
+    """
+
+    def __init__(self, path):
+        """Load and compile a rules file
+
+        Args:
+            path (str): JSON file with "include" and/or "exclude" rule lists
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file or one of its rules is invalid
+        """
+        with open(path, encoding='utf-8') as rules_file:
+            data = json.load(rules_file)
+        if not isinstance(data, dict):
+            raise ValueError("the rules file must contain a JSON object")
+        unknown = set(data) - {'include', 'exclude'}
+        if unknown:
+            raise ValueError(f"unknown rule lists: {', '.join(sorted(unknown))}")
+
+        self.rules = []
+        for kind in ('include', 'exclude'):
+            for index, rule in enumerate(data.get(kind, [])):
+                self.rules.append(self._compile(kind, index, rule))
+        self.hits = [0] * len(self.rules)
+        self.cards_seen = 0
+        self.cards_skipped = 0
+
+    def _compile(self, kind, index, rule):
+        """Validate one rule and return it as a dict with its JavaScript regex source"""
+        label = f"{kind} rule #{index + 1}"
+        if not isinstance(rule, dict) or rule.get('field') not in self.FIELDS:
+            raise ValueError(f"{label}: 'field' must be one of {', '.join(self.FIELDS)}")
+        if ('regex' in rule) == ('keywords' in rule):
+            raise ValueError(f"{label}: give either 'regex' or 'keywords'")
+
+        if 'regex' in rule:
+            source = rule['regex']
+            if not isinstance(source, str) or not source:
+                raise ValueError(f"{label}: regex must be a non-empty pattern")
+            python_only = self._python_only_syntax(source)
+            if python_only:
+                raise ValueError(f"{label}: {python_only} is not supported by the browser's regex engine")
+            try:
+                re.compile(source, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"{label}: invalid regex: {e}") from None
+            # Only the i variants are folded; lowercasing would turn escapes like \S into \s
+            source = source.translate(PhraseMatcher._FOLD_TABLE)
+        else:
+            keywords = rule['keywords']
+            if isinstance(keywords, str):
+                keywords = [keywords]
+            keywords = [PhraseMatcher.fold(keyword).strip() for keyword in keywords if isinstance(keyword, str)]
+            keywords = [keyword for keyword in keywords if keyword]
+            if not keywords:
+                raise ValueError(f"{label}: 'keywords' must list at least one keyword")
+            source = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+
+        return {
+            'name': rule.get('name') or f"{label} ({rule['field']})",
+            'kind': kind,
+            'field': rule['field'],
+            'source': source
+        }
+
+    @staticmethod
+    def _python_only_syntax(source):
+        """Return a description of the first Python-only construct in a regex, or None
+
+        These are valid for re but make JavaScript's RegExp constructor throw.
+        """
+        in_class = False
+        index = 0
+        while index < len(source):
+            char = source[index]
+            if char == '\\':
+                if source[index + 1:index + 2] in ('A', 'Z'):
+                    return f"'\\{source[index + 1]}'"
+                index += 2
+                continue
+            if in_class:
+                in_class = char != ']'
+            elif char == '[':
+                in_class = True
+                # A ']' right after '[' or '[^' is a literal, not the end of the class
+                if source[index + 1:index + 2] == '^':
+                    index += 1
+                if source[index + 1:index + 2] == ']':
+                    index += 1
+            elif source.startswith('(?', index):
+                marker = source[index + 2:index + 3]
+                if marker == 'P' or marker == '>' or marker == '#' or marker == '(':
+                    return f"'(?{marker}'"
+                if marker and marker in 'aiLmsux-':
+                    return "inline flags"
+                index += 2
+                continue
+            elif char in '*+?}' and source[index + 1:index + 2] == '+':
+                return "a possessive quantifier"
+            index += 1
+        return None
+
+    def script_rules(self):
+        """Return the rules as the [include, field, source] lists the snapshot script takes"""
+        return [[rule['kind'] == 'include', rule['field'], rule['source']] for rule in self.rules]
+
+    def record(self, cards):
+        """Add the rule hits of one snapshot of result cards to the totals"""
+        for card in cards:
+            self.cards_seen += 1
+            for index in card.get('rule_hits') or []:
+                self.hits[index] += 1
+            if not card.get('allowed', True):
+                self.cards_skipped += 1
+
+    def report(self):
+        """Return (name, kind, hits) for every rule, in file order"""
+        return [(rule['name'], rule['kind'], hits) for rule, hits in zip(self.rules, self.hits)]
+
+class SearchCheckpoint:
+    """Progress of one keyword search for one account, saved after every results page.
+
+    Holds the last fully processed page and the ids of the result cards already handled,
+    so an interrupted search can continue where it stopped.
+    """
+
+    def __init__(self, directory, keywords, account, filters=None):
+        """Prepare (but do not load) the checkpoint for a search
+        
+        Args:
+            directory (str): Directory holding the checkpoint files
+            keywords (str): Search keywords
+            account (str): Account the search runs under
+            filters (dict, optional): Search facets; a filtered search has its own checkpoint
+        """
+        self.keywords = keywords
+        self.account = account
+        identity = f"{account}|{keywords.strip().lower()}"
+        if filters:
+            identity += f"|{json.dumps(filters, sort_keys=True)}"
+        key = hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(directory, f"search_{key}.json")
+        self.last_page = 0
+        self.handled = set()
+        self.requests_sent = 0
+
+    def load(self):
+        """Load a previous checkpoint; returns False if there is none"""
+        try:
+            with open(self.path, encoding='utf-8') as checkpoint_file:
+                data = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return False
+        self.last_page = data.get('last_page', 0)
+        self.handled = set(data.get('handled', []))
+        self.requests_sent = data.get('requests_sent', 0)
+        return True
+
+    def save(self):
+        """Write the checkpoint atomically so a crash never leaves a truncated file"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {
+            'keywords': self.keywords,
+            'account': self.account,
+            'last_page': self.last_page,
+            'handled': sorted(self.handled),
+            'requests_sent': self.requests_sent,
+            'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds')
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(data, checkpoint_file, indent=2)
+        os.replace(temp_path, self.path)
+
+class DriverProfiler:
+    """Records count, wall time and payload size of every WebDriver command, grouped by phase.
+
+    Phases nest (a limit check inside the search loop); time is attributed to the
+    innermost active phase only, so phase totals add up to the whole run. The part of a
+    phase's wall time not spent in commands is idle time: sleeps and wait polling.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.commands = {}
+        self.phase_wall = {}
+        self._stack = [["other", self.started]]
+
+    def attach(self, driver):
+        """Route every command of driver through the profiler"""
+        send = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = send(driver_command, params)
+                return response
+            finally:
+                value = response.get('value') if isinstance(response, dict) else None
+                payload = len(json.dumps(params, default=str)) if params else 0
+                if value is not None:
+                    payload += len(json.dumps(value, default=str, ensure_ascii=False).encode('utf-8'))
+                self._record(driver_command, time.perf_counter() - start, payload)
+
+        # Element commands go through the parent driver's execute as well
+        driver.execute = execute
+
+    def _record(self, command, seconds, payload):
+        stats = self.commands.setdefault((self._stack[-1][0], command), [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += payload
+
+    def _charge_current_phase(self, now):
+        name, since = self._stack[-1]
+        self.phase_wall[name] = self.phase_wall.get(name, 0.0) + (now - since)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Attribute everything inside the block to the given phase"""
+        now = time.perf_counter()
+        self._charge_current_phase(now)
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._charge_current_phase(now)
+            self._stack.pop()
+            self._stack[-1][1] = now
+
+    def report(self):
+        """Return the collected numbers as a JSON-serializable dict"""
+        self._charge_current_phase(time.perf_counter())
+        self._stack[-1][1] = time.perf_counter()
+        phases = {}
+        for name, wall in self.phase_wall.items():
+            phases[name] = {"wall_s": wall, "command_s": 0.0, "commands": 0, "bytes": 0, "by_command": {}}
+        for (name, command), (count, seconds, payload) in self.commands.items():
+            phase = phases.setdefault(name, {"wall_s": 0.0, "command_s": 0.0, "commands": 0, "bytes": 0, "by_command": {}})
+            phase["command_s"] += seconds
+            phase["commands"] += count
+            phase["bytes"] += payload
+            phase["by_command"][command] = {"count": count, "seconds": seconds, "bytes": payload}
+        for phase in phases.values():
+            phase["idle_s"] = max(phase["wall_s"] - phase["command_s"], 0.0)
+        return {"total_s": time.perf_counter() - self.started, "phases": phases}
+
+    def print_summary(self):
+        """Print a per-phase table, most expensive phase first"""
+        report = self.report()
+        print_highlight(f"\n=== WebDriver profile ({report['total_s']:.1f}s total) ===")
+        print(f"{'phase':<18}{'wall s':>9}{'cmd s':>9}{'idle s':>9}{'cmds':>7}{'KB':>10}  top command")
+        for name, phase in sorted(report["phases"].items(), key=lambda item: item[1]["wall_s"], reverse=True):
+            top = max(phase["by_command"].items(), key=lambda item: item[1]["seconds"], default=None)
+            top_text = f"{top[0]} x{top[1]['count']} ({top[1]['seconds']:.2f}s)" if top else "-"
+            print(f"{name:<18}{phase['wall_s']:>9.2f}{phase['command_s']:>9.2f}{phase['idle_s']:>9.2f}"
+                  f"{phase['commands']:>7}{phase['bytes'] / 1024:>10.1f}  {top_text}")
+
+    def write_report(self, path):
+        """Write the report as JSON"""
+        with open(path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.report(), report_file, indent=2)
+
+def profiled_phase(name):
+    """Method decorator that runs the method inside a DriverProfiler phase, if profiling"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+class SelectorRegistry:
+    """Resolves logical targets ("send", "next_page", ...) to page elements and learns which
+    of their selector candidates actually match.
+
+    A lookup evaluates the candidates in order inside one script call per poll and stops at
+    the first usable match. Hits and lookup times are counted per candidate, so the one that
+    matched most often is tried first from then on, and across runs when a stats file is given.
+    """
+
+    # lookup([[kind, query], ...], root, clickable) returns [candidate index, element] or null
+    _LOOKUP_FUNCTION_JS = """
+        var lookup = function (selectorCandidates, root, clickable) {
+            for (var i = 0; i < selectorCandidates.length; i++) {
+                var kind = selectorCandidates[i][0], query = selectorCandidates[i][1], nodes = [];
+                if (kind === 'css') {
+                    nodes = root.querySelectorAll(query);
+                } else {
+                    var found = document.evaluate(query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (var j = 0; j < found.snapshotLength; j++) nodes.push(found.snapshotItem(j));
+                }
+                for (var k = 0; k < nodes.length; k++) {
+                    var node = nodes[k];
+                    if (!clickable) return [i, node];
+                    if (node.getClientRects().length > 0 && !node.disabled &&
+                        node.getAttribute('aria-disabled') !== 'true') return [i, node];
+                }
+            }
+            return null;
+        };
+    """
+
+    # arguments: [[kind, query], ...], scope element (or null for the whole document) and
+    # whether the match must be clickable. Returns [candidate index, element] or null.
+    LOOKUP_JS = _LOOKUP_FUNCTION_JS + """
+        return lookup(arguments[0], arguments[1] || document, arguments[2]);
+    """
+
+    # arguments: watches as [candidates, scoped, clickable] in priority order and the
+    # candidates of the scope target (or null). Scoped watches only match inside the scope
+    # element, so they wait for it to appear. Returns [watch index, candidate index,
+    # element, scope element] for the first watch that matches, or null.
+    LOOKUP_FIRST_JS = _LOOKUP_FUNCTION_JS + """
+        var watches = arguments[0], scope = null;
+        if (arguments[1]) {
+            var scopeHit = lookup(arguments[1], document, false);
+            scope = scopeHit ? scopeHit[1] : null;
+        }
+        for (var w = 0; w < watches.length; w++) {
+            var scoped = watches[w][1];
+            if (scoped && arguments[1] && !scope) continue;
+            var hit = lookup(watches[w][0], scoped && scope ? scope : document, watches[w][2]);
+            if (hit) return [w, hit[0], hit[1], scope];
+        }
+        return null;
+    """
+
+    def __init__(self, targets, stats_path=None):
+        """Set up the registry and load the stats of earlier runs
+        
+        Args:
+            targets (dict): Mapping of target name to its ordered (kind, query) candidates
+            stats_path (str, optional): JSON file the hit statistics are read from and saved to
+        """
+        self.targets = targets
+        self.stats_path = stats_path
+        self.stats = {}
+        if stats_path:
+            try:
+                with open(stats_path, encoding='utf-8') as stats_file:
+                    self.stats = json.load(stats_file)
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _key(candidate):
+        return f"{candidate[0]}:{candidate[1]}"
+
+    def candidates(self, target):
+        """Return the candidates of a target, the most frequent winner first"""
+        hits = self.stats.get(target, {}).get('hits', {})
+        return sorted(self.targets.get(target, []), key=lambda candidate: -hits.get(self._key(candidate), {}).get('count', 0))
+
+    def xpath_union(self, target):
+        """Return the XPath candidates of a target as one union expression for in-page scripts"""
+        return " | ".join(query for kind, query in self.candidates(target) if kind == 'xpath')
+
+    def find(self, wait, target, scope=None, clickable=True):
+        """Wait until any candidate of target matches and return the element
+        
+        Args:
+            wait (WebDriverWait): Wait whose timeout bounds the lookup
+            target (str): Name of the target in the registry
+            scope (WebElement, optional): Element to search under instead of the whole document
+            clickable (bool): Only accept displayed, enabled elements
+            
+        Raises:
+            TimeoutException: No candidate matched before the wait ran out
+        """
+        candidates = self.candidates(target)
+        started = time.perf_counter()
+        try:
+            index, element = wait.until(
+                lambda driver: driver.execute_script(self.LOOKUP_JS, candidates, scope, clickable)
+            )
+        except TimeoutException:
+            self._record(target, None, time.perf_counter() - started)
+            raise
+        self._record(target, candidates[index], time.perf_counter() - started)
+        return element
+
+    def find_first(self, wait, targets, scope_target=None, page_targets=()):
+        """Wait until any of several targets matches and report which one came first
+
+        All targets are looked up in the same script call on every poll, so a page that
+        shows an unexpected variant ends the wait as soon as it renders instead of after
+        one timeout per target.
+
+        Args:
+            wait (WebDriverWait): Wait whose timeout bounds the lookup
+            targets (list): Clickable targets to find inside the scope, in priority order
+            scope_target (str, optional): Target (e.g. "modal") the targets must be inside of
+            page_targets (iterable): Targets found anywhere on the page, clickable or not;
+                they take priority over targets
+
+        Returns:
+            tuple: (target name, element, scope element or None)
+
+        Raises:
+            TimeoutException: None of the targets matched before the wait ran out
+        """
+        watched = [(target, False) for target in page_targets] + [(target, True) for target in targets]
+        watches = [[self.candidates(target), scoped, scoped] for target, scoped in watched]
+        scope_candidates = self.candidates(scope_target) if scope_target else None
+        started = time.perf_counter()
+        try:
+            index, candidate_index, element, scope = wait.until(
+                lambda driver: driver.execute_script(self.LOOKUP_FIRST_JS, watches, scope_candidates)
+            )
+        except TimeoutException:
+            for target, _ in watched:
+                self._record(target, None, time.perf_counter() - started)
+            raise
+        target = watched[index][0]
+        self._record(target, watches[index][0][candidate_index], time.perf_counter() - started)
+        return target, element, scope
+
+    def find_now(self, driver, target, scope=None, clickable=True):
+        """Look target up once without waiting; returns the element or None"""
+        candidates = self.candidates(target)
+        started = time.perf_counter()
+        found = driver.execute_script(self.LOOKUP_JS, candidates, scope, clickable)
+        if not found:
+            return None
+        index, element = found
+        self._record(target, candidates[index], time.perf_counter() - started)
+        return element
+
+    def _record(self, target, candidate, seconds):
+        entry = self.stats.setdefault(target, {})
+        if candidate is None:
+            entry['misses'] = entry.get('misses', 0) + 1
+            entry['miss_ms'] = round(entry.get('miss_ms', 0) + seconds * 1000, 1)
+            return
+        hit = entry.setdefault('hits', {}).setdefault(self._key(candidate), {'count': 0, 'total_ms': 0})
+        hit['count'] += 1
+        hit['total_ms'] = round(hit['total_ms'] + seconds * 1000, 1)
+
+    def save(self):
+        """Write the stats atomically; does nothing without a stats path"""
+        if not self.stats_path:
+            return
+        os.makedirs(os.path.dirname(self.stats_path) or '.', exist_ok=True)
+        temp_path = f"{self.stats_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as stats_file:
+            json.dump(self.stats, stats_file, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.stats_path)
+
 class LinkedInConnector:
+    BASE_URL = "https://www.linkedin.com"
+
     # Define some common XPaths as constants for clarity, though many are method-specific
     LOGIN_EMAIL_ID = 'username'
     LOGIN_PASSWORD_ID = 'password'
-    LOGIN_BUTTON_XPATH = '//button[contains(text(), "Sign in") or contains(text(), "Oturum aç")]|//button[@type="submit"]'
     TWO_FA_INPUT_XPATH = '//input[@id="input__email_verification_pin" or @id="verification-code"]'
-    SEARCH_RESULTS_CONNECT_BUTTON_XPATH = '//button[.//span[text()="Bağlantı kur" or text()="Connect"]]'
-    MODAL_ADD_NOTE_BUTTON_XPATH = '//button[contains(@aria-label, "Add a note") or contains(@aria-label, "Not ekle")] | //button[.//span[text()="Not ekle" or text()="Add a note"]]'
-    MODAL_CUSTOM_MESSAGE_ID = 'custom-message'
-    MODAL_SEND_BUTTON_XPATH = '//button[contains(@aria-label, "Send invitation") or contains(@aria-label, "Send now") or contains(@aria-label, "Send") or contains(@aria-label, "Gönder")] | //button[.//span[text()="Gönder" or text()="Send"]]'
+    LOGGED_IN_URL_MARKERS = ["/feed", "/dashboard", "/mynetwork", "/jobs", "/messaging", "/notifications", "ana-sayfa", "akis"]
+    SECURITY_CHECK_URL_MARKERS = ["checkpoint/challenge", "security/challenge", "checkpoint/"]
+    SEARCH_RESULT_CARD_SELECTOR = 'li.reusable-search__result-container, [data-chameleon-result-urn], [data-view-name="search-entity-result-universal-template"]'
+    SCROLL_SETTLE_TIMEOUT = 3
+    # URL patterns DevTools blocks in --block-resources mode; images are off via content settings
+    BLOCKED_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+                            "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.m4a", "*.ogg", "*.wav"]
+    # Page-wide states a Connect click can end in instead of the connection modal
+    MODAL_PAGE_OUTCOMES = ("limit_modal", "error_toast")
+    DRIVER_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'linkedauto', 'driver_cache.json')
+
+    # Resolves once the login form has been answered in any way: logged in, redirected to a
+    # security check, asked for a 2FA code or shown a visible credential error.
+    LOGIN_SETTLED_JS = """
+        if (new RegExp(arguments[0]).test(window.location.href)) return true;
+        if (document.evaluate(arguments[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) return true;
+        var errorIds = ['error-for-password', 'error-for-username'];
+        for (var i = 0; i < errorIds.length; i++) {
+            var error = document.getElementById(errorIds[i]);
+            if (error && error.getClientRects().length > 0 && (error.innerText || '').trim()) return true;
+        }
+        return false;
+    """
+
+    # Optionally scrolls to the bottom, then reports how much of the results page is loaded
+    SCROLL_PROBE_JS = """
+        if (arguments[2]) window.scrollTo(0, document.body.scrollHeight);
+        return {
+            cards: document.querySelectorAll(arguments[0]).length,
+            actionable: document.evaluate(arguments[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength,
+            height: document.body.scrollHeight
+        };
+    """
+
+    # In-page counterpart of PhraseMatcher. arguments[0] is PhraseMatcher.pattern and
+    # arguments[1] its phrase -> categories lookup; text is folded the same way as fold().
+    _PHRASE_MATCH_JS = """
+        var phraseRegex = new RegExp(arguments[0], 'g');
+        var phraseLookup = arguments[1];
+        var matchPhrases = function (text) {
+            var hits = {}, found;
+            text = (text || '').replace(/[İIı]/g, 'i').toLowerCase();
+            phraseRegex.lastIndex = 0;
+            while ((found = phraseRegex.exec(text)) !== null) {
+                var categories = phraseLookup[found[0]];
+                for (var i = 0; i < categories.length; i++) hits[categories[i]] = true;
+            }
+            return hits;
+        };
+    """
+
+    # Installs (once per document) a MutationObserver that flips a flag as soon as a limit
+    # banner, modal or toast is added to the page. Later calls only read the flag back.
+    LIMIT_PROBE_JS = _PHRASE_MATCH_JS + """
+        var state = window.__linkedautoState;
+        if (!state) {
+            state = window.__linkedautoState = {limit: false};
+            var skipped = {SCRIPT: true, STYLE: true, CODE: true, NOSCRIPT: true};
+            state.limit = !!matchPhrases(document.body ? document.body.innerText : '').limit;
+            new MutationObserver(function (mutations) {
+                if (state.limit) return;
+                for (var m = 0; m < mutations.length && !state.limit; m++) {
+                    var mutation = mutations[m];
+                    var nodes = mutation.type === 'characterData' ? [mutation.target] : mutation.addedNodes;
+                    for (var n = 0; n < nodes.length; n++) {
+                        var node = nodes[n];
+                        var parent = node.nodeType === 1 ? node : node.parentNode;
+                        if (parent && skipped[parent.nodeName]) continue;
+                        if (matchPhrases(node.textContent).limit) { state.limit = true; break; }
+                    }
+                }
+            }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        }
+        return state.limit;
+    """
+
+    # One-off scan of the rendered page text; returns only the names of the matching categories.
+    PAGE_TEXT_PROBE_JS = _PHRASE_MATCH_JS + """
+        return Object.keys(matchPhrases(document.body ? document.body.innerText : ''));
+    """
+
+    # Installed in every new document of the tab through DevTools, before any page script runs,
+    # so the Resource Timing buffer holds a whole page instead of the default 250 entries.
+    RESOURCE_TIMING_BUFFER_JS = """
+        if (window.performance && performance.setResourceTimingBufferSize) {
+            performance.setResourceTimingBufferSize(5000);
+        }
+    """
+
+    # Adds up the network traffic of the current document since the previous call, from the
+    # Resource Timing entries, and counts images, fonts and media that failed to load (which
+    # is what blocked ones do). Counted elements are marked so a later call skips them. The
+    # buffer size is set again here for drivers without DevTools, where it may come too late.
+    RESOURCE_STATS_JS = """
+        var state = window.__linkedautoResources;
+        if (!state) {
+            state = window.__linkedautoResources = {seen: 0};
+            if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+        }
+        var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+        var stats = {requests: 0, bytes: 0, blocked_images: 0, blocked_fonts: 0, blocked_media: 0};
+        for (var i = state.seen; i < entries.length; i++) {
+            stats.requests += 1;
+            stats.bytes += entries[i].transferSize || 0;
+        }
+        state.seen = entries.length;
+        var images = document.images;
+        for (var j = 0; j < images.length; j++) {
+            var image = images[j];
+            if (!image.__linkedautoCounted && image.currentSrc && image.complete && image.naturalWidth === 0) {
+                image.__linkedautoCounted = true;
+                stats.blocked_images += 1;
+            }
+        }
+        var media = document.querySelectorAll('video, audio');
+        for (var k = 0; k < media.length; k++) {
+            if (!media[k].__linkedautoCounted && media[k].error) {
+                media[k].__linkedautoCounted = true;
+                stats.blocked_media += 1;
+            }
+        }
+        if (document.fonts) {
+            document.fonts.forEach(function (font) {
+                if (!font.__linkedautoCounted && font.status === 'error') {
+                    font.__linkedautoCounted = true;
+                    stats.blocked_fonts += 1;
+                }
+            });
+        }
+        return stats;
+    """
+
+    # Where the fields CardRules match on live inside a search result card
+    CARD_FIELD_SELECTORS = {
+        'name': '.entity-result__title-text',
+        'headline': '.entity-result__primary-subtitle',
+        'location': '.entity-result__secondary-subtitle'
+    }
 
-    def __init__(self, headless=False, connection_note=None, use_notes=False):
+    # Collects every Connect button on a results page in a single round trip. Each entry
+    # carries the button element itself so the caller only talks to the browser to click.
+    SEARCH_CARDS_SNAPSHOT_JS = """
+        var found = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var fieldSelectors = arguments[2] || {};
+        var rules = (arguments[1] || []).map(function (rule) {
+            // A rule the browser cannot compile never matches instead of failing the snapshot
+            try {
+                return {include: rule[0], field: rule[1], regex: new RegExp(rule[2], 'i')};
+            } catch (e) {
+                return {include: rule[0], field: rule[1], regex: null};
+            }
+        });
+        var hasInclude = rules.some(function (rule) { return rule.include; });
+        var cards = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var button = found.snapshotItem(i);
+            var card = button.closest('li') || button.parentElement;
+            var link = card ? card.querySelector('a[href*="/in/"]') : null;
+            var href = link ? link.href.split('?')[0] : null;
+            var urnHolder = button.closest('[data-chameleon-result-urn]') ||
+                            (card ? card.querySelector('[data-chameleon-result-urn]') : null);
+            var style = window.getComputedStyle(button);
+            var ruleHits = [], included = false, excluded = false;
+            if (rules.length) {
+                var fields = {};
+                for (var field in fieldSelectors) {
+                    var holder = card ? card.querySelector(fieldSelectors[field]) : null;
+                    var text = holder ? (holder.innerText || holder.textContent || '').trim() : '';
+                    fields[field] = text.replace(/[İIı]/g, 'i').toLowerCase();
+                }
+                for (var r = 0; r < rules.length; r++) {
+                    if (rules[r].regex && rules[r].regex.test(fields[rules[r].field] || '')) {
+                        ruleHits.push(r);
+                        if (rules[r].include) { included = true; } else { excluded = true; }
+                    }
+                }
+            }
+            cards.push({
+                id: urnHolder ? urnHolder.getAttribute('data-chameleon-result-urn') : (href || ('index-' + i)),
+                href: href,
+                label: (button.innerText || '').trim(),
+                visible: button.getClientRects().length > 0 && style.visibility !== 'hidden',
+                enabled: !button.disabled && button.getAttribute('aria-disabled') !== 'true',
+                rule_hits: ruleHits,
+                allowed: !excluded && (included || !hasInclude),
+                element: button
+            });
+        }
+        return cards;
+    """
+
+    def __init__(self, headless=False, connection_note=None, use_notes=False, session_dir=None, ledger_path=None,
+                 checkpoint_dir=None, base_url=BASE_URL, driver=None, profiler=None, selector_stats_path=None,
+                 block_resources=False, max_browser_rss_mb=None, search_filters=None, card_rules=None, cookie_jar=None):
         """Initialize the LinkedIn connector
         
         Args:
             headless (bool): Run browser in headless mode
             connection_note (str, optional): Custom connection note to include with requests
             use_notes (bool): Whether to send connection requests with notes (default: False)
+            session_dir (str, optional): Chrome profile directory kept between runs so a
+                logged-in session can be reused instead of logging in again; not encrypted
+                beyond what Chrome's own cookie store does
+            ledger_path (str, optional): SQLite file recording contacted profiles across runs
+            checkpoint_dir (str, optional): Directory where search progress is saved after every page
+            base_url (str): Site root, overridable to point the bot at a local stand-in server
+            driver (WebDriver, optional): Already started driver to use instead of launching
+                Chrome, e.g. a fake driver in tests
+            profiler (DriverProfiler, optional): Records every WebDriver command by phase
+            selector_stats_path (str, optional): JSON file where the selector registry keeps
+                which candidates matched, so later runs try them first
+            block_resources (bool): Do not load images, fonts and media
+            max_browser_rss_mb (int, optional): Replace the tab with a fresh one when the Chrome
+                process tree uses more memory than this between pages
+            search_filters (dict, optional): Search facets (see parse_search_filters) added to
+                every search URL
+            card_rules (CardRules, optional): Include/exclude rules deciding which search result
+                cards are clicked at all
+            cookie_jar (EncryptedCookieJar, optional): Encrypted file the session cookies are
+                saved to after login and restored from on the next run
         """
+        _load_selenium()
         self.use_notes = use_notes
         
         # Validate connection note if provided
@@ -101,52 +1258,310 @@ class LinkedInConnector:
             self.connection_note = None
         
         self._limit_reported = False
+        self.selectors = SelectorRegistry(SELECTORS, selector_stats_path)
+        # Until the UI language is known, match the phrases and selectors of every language
+        self.locale = None
+        self.locale_packs = load_locale_packs()
+        self._use_locale_pack(merge_locale_packs(self.locale_packs))
         self.driver = None
         self.wait = None
         self.short_wait = None
         self.email = None
         self.password = None
         self.headless = headless
+        self.session_dir = os.path.abspath(os.path.expanduser(session_dir)) if session_dir else None
+        self.cookie_jar = cookie_jar
+        self.session_established = False
+        self.ledger = InvitationLedger(ledger_path) if ledger_path else None
+        self.checkpoint_dir = checkpoint_dir
+        self.base_url = base_url.rstrip('/')
+        self.profiler = profiler
+        self.block_resources = block_resources
+        self.resource_stats = {'pages': 0, 'requests': 0, 'bytes': 0,
+                               'blocked_images': 0, 'blocked_fonts': 0, 'blocked_media': 0}
+        self.max_browser_rss_mb = max_browser_rss_mb
+        self.search_filters = search_filters or {}
+        self.card_rules = card_rules
+        self.memory_stats = {'samples': 0, 'last_mb': 0.0, 'peak_mb': 0.0, 'recycles': 0}
+        if driver is not None:
+            self._attach_driver(driver)
 
     def initialize_browser(self):
         """Initialize the browser after user chooses login method"""
-        self.driver = self.setup_driver(self.headless)
+        if self.driver:
+            return
+        with self._phase("startup"):
+            self._attach_driver(self.setup_driver(self.headless))
+
+    def _phase(self, name):
+        """Context manager attributing the enclosed driver commands to a profiler phase"""
+        return self.profiler.phase(name) if self.profiler else contextlib.nullcontext()
+
+    def _attach_driver(self, driver):
+        """Use the given driver for all browser interaction"""
+        if self.profiler:
+            self.profiler.attach(driver)
+        self.driver = driver
         self.wait = WebDriverWait(self.driver, 20)
         self.short_wait = WebDriverWait(self.driver, 5)
+        self._enlarge_resource_timing_buffer()
+        if self.block_resources:
+            self._block_resource_urls()
+        if self.card_rules:
+            self._check_card_rules()
+
+    def _check_card_rules(self):
+        """Compile the card rules in the browser once and reject any its regex engine refuses
+
+        Raises:
+            ValueError: A rule is valid for Python's re but not for the browser
+        """
+        errors = self.driver.execute_script(CardRules.VALIDATE_JS, self.card_rules.script_rules()) or []
+        if errors:
+            details = "; ".join(f"{self.card_rules.rules[index]['name']}: {message}" for index, message in errors)
+            raise ValueError(f"Invalid card rules: {details}")
+
+    def _enlarge_resource_timing_buffer(self):
+        """Have every new document of the current tab keep up to 5000 Resource Timing entries"""
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                        {'source': self.RESOURCE_TIMING_BUFFER_JS})
+        except Exception as e:
+            logger.debug(f"Could not enlarge the resource timing buffer: {e}")
+
+    def _block_resource_urls(self):
+        """Block font and media downloads of the current tab through DevTools"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block fonts and media: {str(e)}")
+
+    def _browser_pid(self):
+        """Return the pid of the ChromeDriver process, whose descendants are the browser"""
+        process = getattr(getattr(self.driver, 'service', None), 'process', None)
+        return getattr(process, 'pid', None)
+
+    def _sample_browser_memory(self):
+        """Record the memory of the Chrome process tree in memory_stats and return it in MB"""
+        pid = self._browser_pid()
+        rss = process_tree_rss(pid) if pid else None
+        if rss is None:
+            return None
+        rss_mb = round(rss / (1024 * 1024), 1)
+        self.memory_stats['samples'] += 1
+        self.memory_stats['last_mb'] = rss_mb
+        self.memory_stats['peak_mb'] = max(self.memory_stats['peak_mb'], rss_mb)
+        logger.debug(f"Browser memory: {rss_mb:.0f} MB")
+        return rss_mb
+
+    def _check_browser_memory(self, reload=True):
+        """Sample the browser's memory and recycle the tab once it passes max_browser_rss_mb
+        
+        Args:
+            reload (bool): Load the current page again in the new tab; pass False when the
+                caller navigates somewhere else right afterwards
+        """
+        rss_mb = self._sample_browser_memory()
+        if rss_mb and self.max_browser_rss_mb and rss_mb > self.max_browser_rss_mb:
+            logger.info(f"Browser memory at {rss_mb:.0f} MB (limit {self.max_browser_rss_mb} MB), switching to a fresh tab.")
+            self._recycle_tab(reload)
+
+    @profiled_phase("recycle")
+    def _recycle_tab(self, reload=True):
+        """Replace the current tab with a new one at the same URL, freeing the old renderer"""
+        try:
+            url = self.driver.current_url
+            old_handle = self.driver.current_window_handle
+            # Open the new tab before closing the old one; closing the last tab ends the session
+            self.driver.switch_to.new_window('tab')
+            new_handle = self.driver.current_window_handle
+            self.driver.switch_to.window(old_handle)
+            self.driver.close()
+            self.driver.switch_to.window(new_handle)
+            self._enlarge_resource_timing_buffer()
+            if self.block_resources:
+                self._block_resource_urls()
+            if reload:
+                self.driver.get(url)
+                time.sleep(random.uniform(2, 4))
+            self.memory_stats['recycles'] += 1
+        except Exception as e:
+            logger.warning(f"Could not recycle the browser tab: {str(e)}")
+
+    def _sample_resources(self):
+        """Add the traffic of the current page since the last sample to resource_stats"""
+        try:
+            sample = self.driver.execute_script(self.RESOURCE_STATS_JS)
+        except Exception as e:
+            logger.debug(f"Could not read resource timing: {e}")
+            return
+        if not sample:
+            return
+        self.resource_stats['pages'] += 1
+        for key, value in sample.items():
+            self.resource_stats[key] = self.resource_stats.get(key, 0) + value
+
+    def _use_locale_pack(self, pack):
+        """Rebuild the phrase matcher and selector candidates from a locale pack"""
+        self.phrase_matcher = PhraseMatcher(pack['phrases'])
+        pack_selectors = pack['selectors']
+        self.selectors.targets = {
+            target: list(SELECTORS.get(target, [])) + [tuple(candidate) for candidate in pack_selectors.get(target, [])]
+            for target in set(SELECTORS) | set(pack_selectors)
+        }
+
+    def detect_locale(self):
+        """Switch to the locale pack of the interface language, read once from html[lang].
+        
+        Returns:
+            str: Language code of the pack in use, or None if the generic pack stays active
+        """
+        if self.locale:
+            return self.locale
+        try:
+            lang = self.driver.execute_script("return document.documentElement.lang || '';") or ''
+        except Exception as e:
+            logger.debug(f"Could not read the page language: {e}")
+            return None
+        code = lang.split('-')[0].strip().lower()
+        if code not in self.locale_packs:
+            logger.info(f"No locale pack for interface language '{lang}', matching all known languages.")
+            return None
+        self.locale = code
+        self._use_locale_pack(self.locale_packs[code])
+        logger.info(f"Interface language: {self.locale_packs[code].get('name', code)}")
+        return code
+
+    @profiled_phase("login")
+    def restore_session(self):
+        """Reuse the logged-in session stored in session_dir or the session file, if it is still valid.
+        
+        A missing or unreadable session file does not rule out a profile directory that is
+        still logged in, so with both given the profile is checked on its own.
+        
+        Returns:
+            bool: True if the stored session is logged in and the login flow can be skipped
+        """
+        if not self.session_dir and not self.cookie_jar:
+            return False
+
+        self.initialize_browser()
+        start_time = time.time()
+        cookies_restored = bool(self.cookie_jar) and self._restore_session_cookies()
+        if not cookies_restored and not self.session_dir:
+            return False
+        self.driver.get(f"{self.base_url}/feed/")
+        if self._is_logged_in():
+            source = self.cookie_jar.path if cookies_restored else self.session_dir
+            logger.info(f"Reused saved session from {source} ({time.time() - start_time:.1f}s).")
+            self._session_established()
+            print_success("\nLogged in with saved session.")
+            return True
+
+        logger.info("Saved session is missing or expired. Falling back to normal login.")
+        return False
+
+    def _restore_session_cookies(self):
+        """Load the cookies of the encrypted session file into the browser
+        
+        Returns:
+            bool: True if there were cookies to restore
+        """
+        try:
+            cookies = self.cookie_jar.load()
+        except ValueError as e:
+            logger.warning(f"{e} Falling back to normal login.")
+            return False
+        if not cookies:
+            return False
+        # Cookies can only be set for the site that is open; robots.txt is its cheapest page
+        self.driver.get(f"{self.base_url}/robots.txt")
+        restored = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                logger.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+        logger.info(f"Restored {restored} of {len(cookies)} session cookies from {self.cookie_jar.path}.")
+        return restored > 0
+
+    def _save_session_cookies(self):
+        """Write the current cookies to the encrypted session file, if one is used"""
+        if not self.cookie_jar or not self.session_established:
+            return
+        try:
+            self.cookie_jar.save(self.driver.get_cookies())
+            logger.debug(f"Session cookies saved to {self.cookie_jar.path}.")
+        except Exception as e:
+            logger.warning(f"Could not save the session cookies: {str(e)}")
+
+    def _session_established(self):
+        """Finish a successful login: detect the interface language and store the session"""
+        self.session_established = True
+        self.detect_locale()
+        self._save_session_cookies()
+
+    def setup_login(self, method=None, email=None, password=None, interactive=True):
+        """Setup login method and credentials
+        
+        Args:
+            method (str, optional): 'console' to log in with email and password, 'browser' to
+                log in by hand in the opened browser; asked for when not given
+            email (str, optional): LinkedIn email, asked for when needed and not given
+            password (str, optional): LinkedIn password, asked for when needed and not given
+            interactive (bool): Allow prompting; otherwise missing or invalid values raise ValueError.
+                Without prompting, browser login must be asked for explicitly, since nobody is
+                there to log in by hand
+        """
+        if not method and not interactive:
+            method = 'console'
 
-    def setup_login(self):
-        """Setup login method and credentials"""
         # Ask user for login preference
-        while True:
+        while not method:
             login_choice = input("How would you like to login?\n1. Enter credentials in console\n2. Login through browser\nEnter your choice (1 or 2): ").strip()
             if login_choice in ['1', '2']:
+                method = 'console' if login_choice == '1' else 'browser'
                 break
             print_warning("Please enter either 1 or 2")
         
-        if login_choice == '1':
-            # Get credentials from console
+        if method == 'console':
+            self.email = (email or '').strip()
+            self.password = (password or '').strip()
+            if not interactive:
+                if not self.email or '@' not in self.email or '.' not in self.email:
+                    raise ValueError("Missing or invalid LinkedIn email (LINKEDAUTO_EMAIL).")
+                if len(self.password) < 6:
+                    raise ValueError("Missing or too short LinkedIn password (LINKEDAUTO_PASSWORD).")
+
+            # Get credentials from console unless they were given
             while True:
-                self.email = input("Enter your LinkedIn email: ").strip()
+                if not self.email:
+                    self.email = input("Enter your LinkedIn email: ").strip()
                 if not self.email:
                     print_warning("Email cannot be empty. Please try again.")
                     continue
                 if '@' not in self.email or '.' not in self.email:
                     print_warning("Please enter a valid email address.")
+                    self.email = ''
                     continue
                 break
 
             while True:
-                self.password = getpass.getpass("Enter your LinkedIn password: ").strip()
+                if not self.password:
+                    self.password = getpass.getpass("Enter your LinkedIn password: ").strip()
                 if not self.password:
                     print_warning("Password cannot be empty. Please try again.")
                     continue
                 if len(self.password) < 6:
                     print_warning("Password must be at least 6 characters long.")
+                    self.password = ''
                     continue
                 break
 
             if not all([self.email, self.password]):
-                logging.error("Email and password fields cannot be empty.")
+                logger.error("Email and password fields cannot be empty.")
                 raise ValueError("Missing LinkedIn credentials.")
             
             # Initialize browser after getting credentials
@@ -155,7 +1570,7 @@ class LinkedInConnector:
             # Initialize browser first for manual login
             self.initialize_browser()
             print_info("Opening LinkedIn login page. Please login manually in the browser.")
-            self.driver.get("https://www.linkedin.com/login")
+            self.driver.get(f"{self.base_url}/login")
             self.email = None
             self.password = None
 
@@ -165,13 +1580,29 @@ class LinkedInConnector:
         
         # Configure headless mode if requested
         if headless_mode:
-            logging.info("Browser will run in background (headless mode).")
+            logger.info("Browser will run in background (headless mode).")
             chrome_options.add_argument('--headless=new')
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--disable-gpu')
         else:
-            logging.info("Browser will run in visible mode. (Tip: You can run in background using --headless argument)")
+            logger.info("Browser will run in visible mode. (Tip: You can run in background using --headless argument)")
         
+        # Keep cookies and local storage between runs when a session directory is configured.
+        # The directory holds live session cookies, so only the current user may read it.
+        if self.session_dir:
+            os.makedirs(self.session_dir, mode=0o700, exist_ok=True)
+            if os.name != 'nt':
+                os.chmod(self.session_dir, 0o700)
+            chrome_options.add_argument(f'--user-data-dir={self.session_dir}')
+            logger.info(f"Using persistent browser session: {self.session_dir}")
+
+        if self.block_resources:
+            # Images are switched off for the whole profile; fonts and media are blocked by URL
+            # through DevTools once the driver is up (see _block_resource_urls)
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            logger.info("Images, fonts and media will not be loaded.")
+
         # Common settings for all operating systems
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -188,28 +1619,80 @@ class LinkedInConnector:
 
         # Try different methods to initialize the WebDriver
         attempts = [
-            self._init_webdriver_with_auto_install,
-            self._init_webdriver_from_path,
-            self._init_webdriver_direct
+            ("auto_install", self._init_webdriver_with_auto_install),
+            ("path", self._init_webdriver_from_path),
+            ("direct", self._init_webdriver_direct)
         ]
+
+        # Reuse what worked last time for this Chrome version; full discovery only runs
+        # again when the cached driver fails or Chrome has been updated.
+        chrome_version = self._detect_chrome_version()
+        cached = self._load_driver_cache(chrome_version)
+        if cached:
+            cached_path = cached.get("driver_path")
+            if cached_path and os.path.exists(cached_path):
+                logger.info(f"Using cached ChromeDriver for Chrome {chrome_version}: {cached_path}")
+                attempts.insert(0, ("cached", lambda options: self._init_webdriver_from_binary(options, cached_path)))
+            else:
+                attempts.sort(key=lambda attempt: attempt[0] != cached.get("strategy"))
         
         last_error = None
-        for attempt in attempts:
+        for strategy, attempt in attempts:
             try:
                 driver = attempt(chrome_options)
                 if driver:
                     # Additional configurations after driver initialization
                     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                    if strategy != "cached":
+                        self._save_driver_cache(chrome_version, strategy, driver)
                     return driver
             except Exception as e:
                 last_error = e
-                logging.warning(f"WebDriver initialization attempt failed: {str(e)}")
+                logger.warning(f"WebDriver initialization attempt failed: {str(e)}")
         
         raise Exception(f"All WebDriver initialization methods failed. Last error: {str(last_error)}")
+
+    def _detect_chrome_version(self):
+        """Return the installed Chrome version from the local binary, without network access"""
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception as e:
+            logger.debug(f"Could not detect Chrome version: {str(e)}")
+            return None
+
+    def _load_driver_cache(self, chrome_version):
+        """Return the cached driver resolution for this Chrome version, if any"""
+        if not chrome_version:
+            return None
+        try:
+            with open(self.DRIVER_CACHE_PATH, encoding='utf-8') as cache_file:
+                return json.load(cache_file).get(chrome_version)
+        except (OSError, ValueError):
+            return None
+
+    def _save_driver_cache(self, chrome_version, strategy, driver):
+        """Remember which strategy started the driver and the binary it resolved to"""
+        if not chrome_version:
+            return
+        service = getattr(driver, 'service', None)
+        entry = {
+            "strategy": strategy,
+            "driver_path": getattr(service, 'path', None)
+        }
+        try:
+            os.makedirs(os.path.dirname(self.DRIVER_CACHE_PATH), exist_ok=True)
+            # Only the current Chrome version is kept; an update invalidates the cache
+            with open(self.DRIVER_CACHE_PATH, 'w', encoding='utf-8') as cache_file:
+                json.dump({chrome_version: entry}, cache_file, indent=2)
+        except OSError as e:
+            logger.debug(f"Could not write driver cache: {str(e)}")
     
     def _init_webdriver_with_auto_install(self, chrome_options):
         """Initialize WebDriver with automatic ChromeDriver installation"""
         try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
             # Initialize ChromeDriverManager with default settings
             driver_manager = ChromeDriverManager()
             driver_path = driver_manager.install()
@@ -222,24 +1705,28 @@ class LinkedInConnector:
                 if os.path.exists(chromedriver_bin):
                     driver_path = chromedriver_bin
             
-            # Set execution permissions (for Unix systems)
-            if os.name != 'nt':
-                os.chmod(driver_path, 0o755)
-            
-            # Create service with the correct binary path
-            service = Service(executable_path=driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Set a reasonable window size for headless mode
-            if '--headless=new' in chrome_options.arguments:
-                driver.set_window_size(1920, 1080)
-                
-            return driver
+            return self._init_webdriver_from_binary(chrome_options, driver_path)
             
         except Exception as e:
-            logging.warning(f"Auto-install method failed: {str(e)}")
-            logging.warning(f"Driver path attempted: {driver_path}" if 'driver_path' in locals() else "")
+            logger.warning(f"Auto-install method failed: {str(e)}")
+            logger.warning(f"Driver path attempted: {driver_path}" if 'driver_path' in locals() else "")
             return None
+
+    def _init_webdriver_from_binary(self, chrome_options, driver_path):
+        """Initialize WebDriver from a known ChromeDriver binary"""
+        # Set execution permissions (for Unix systems) only when they are missing
+        if os.name != 'nt' and not os.access(driver_path, os.X_OK):
+            os.chmod(driver_path, 0o755)
+        
+        # Create service with the correct binary path
+        service = Service(executable_path=driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Set a reasonable window size for headless mode
+        if '--headless=new' in chrome_options.arguments:
+            driver.set_window_size(1920, 1080)
+            
+        return driver
     
     def _init_webdriver_from_path(self, chrome_options):
         """Initialize WebDriver using ChromeDriver from system PATH"""
@@ -247,7 +1734,7 @@ class LinkedInConnector:
             service = Service()
             return webdriver.Chrome(service=service, options=chrome_options)
         except Exception as e:
-            logging.warning(f"System PATH method failed: {str(e)}")
+            logger.warning(f"System PATH method failed: {str(e)}")
             return None
     
     def _init_webdriver_direct(self, chrome_options):
@@ -255,40 +1742,53 @@ class LinkedInConnector:
         try:
             return webdriver.Chrome(options=chrome_options)
         except Exception as e:
-            logging.warning(f"Direct initialization failed: {str(e)}")
+            logger.warning(f"Direct initialization failed: {str(e)}")
             return None
 
     def _is_logged_in(self):
         """Checks if the user is currently logged in by looking for feed indicators."""
         current_url = self.driver.current_url
-        return any(x in current_url for x in ["/feed", "/dashboard", "/mynetwork", "/jobs", "/messaging", "/notifications", "ana-sayfa", "akis"])
+        return any(x in current_url for x in self.LOGGED_IN_URL_MARKERS)
 
+    def _wait_for_login(self, timeout):
+        """Block until the browser reaches a logged-in page, returning as soon as it does.
+        
+        Args:
+            timeout (float): Maximum number of seconds to wait
+            
+        Returns:
+            float: Seconds it took to reach the logged-in state, or None on timeout
+        """
+        start_time = time.time()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.5).until(lambda driver: self._is_logged_in())
+        except TimeoutException:
+            return None
+        elapsed = time.time() - start_time
+        logger.info(f"Logged in after {elapsed:.1f}s.", extra={'phase': 'login', 'duration': round(elapsed, 3)})
+        self._session_established()
+        return elapsed
 
+    @profiled_phase("login")
     def wait_for_2fa(self, max_wait_minutes=15):
         """Wait for user to complete 2FA verification"""
-        logging.info("2FA verification required. Please check your authentication app or email...")
-        start_time = time.time()
-        max_wait_seconds = max_wait_minutes * 60
+        logger.info("2FA verification required. Please check your authentication app or email...")
 
-        while time.time() - start_time < max_wait_seconds:
-            if self._is_logged_in():
-                logging.info("2FA verification successful!")
-                return True
-
-            try:
-                verification_input_elements = self.driver.find_elements(By.XPATH, self.TWO_FA_INPUT_XPATH)
-                if verification_input_elements and verification_input_elements[0].is_displayed():
-                    logging.info("Please enter your verification code in the browser and press 'Submit' or 'Verify'...")
-            except NoSuchElementException:
-                pass
-            except Exception as e:
-                logging.debug(f"Error checking 2FA input: {str(e)}")
+        try:
+            verification_input_elements = self.driver.find_elements(By.XPATH, self.TWO_FA_INPUT_XPATH)
+            if verification_input_elements and verification_input_elements[0].is_displayed():
+                logger.info("Please enter your verification code in the browser and press 'Submit' or 'Verify'...")
+        except Exception as e:
+            logger.debug(f"Error checking 2FA input: {str(e)}")
 
-            time.sleep(5)
+        if self._wait_for_login(max_wait_minutes * 60) is not None:
+            logger.info("2FA verification successful!")
+            return True
 
-        logging.error("2FA verification timed out or could not be completed.")
+        logger.error("2FA verification timed out or could not be completed.")
         return False
 
+    @profiled_phase("login")
     def login(self):
         """Login to LinkedIn with manual security check and 2FA handling"""
         try:
@@ -296,8 +1796,7 @@ class LinkedInConnector:
                 # Console login
                 print_info("\n=== ATTENTION ===")
                 print_info("Starting login process. Please be ready to complete any security checks.")
-                self.driver.get("https://www.linkedin.com/login")
-                time.sleep(2)
+                self.driver.get(f"{self.base_url}/login")
                 
                 # Enter email
                 email_field = self.wait.until(EC.presence_of_element_located((By.ID, self.LOGIN_EMAIL_ID)))
@@ -310,39 +1809,39 @@ class LinkedInConnector:
                 password_field.send_keys(self.password)
                 
                 # Click login button
-                login_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, self.LOGIN_BUTTON_XPATH)))
+                login_button = self.selectors.find(self.wait, "login_button")
                 login_button.click()
                 
-                # Add a small delay to allow error messages to appear
-                time.sleep(2)
+                # Wait until the page reacts to the submit instead of sleeping a fixed time
+                settled_markers = "|".join(re.escape(marker) for marker in self.LOGGED_IN_URL_MARKERS + self.SECURITY_CHECK_URL_MARKERS)
+                try:
+                    WebDriverWait(self.driver, 10, poll_frequency=0.25).until(
+                        lambda driver: driver.execute_script(self.LOGIN_SETTLED_JS, settled_markers, self.TWO_FA_INPUT_XPATH)
+                    )
+                except TimeoutException:
+                    logger.debug("Login page did not settle within 10 seconds.")
                 
-                # Check for login errors first - check both English and Turkish error messages
-                error_messages = [
-                    {"id": "error-for-password", "en": "Wrong password. Please try again.", "tr": "Hatalı şifre. Lütfen tekrar deneyin."},
-                    {"id": "error-for-username", "en": "Invalid email address. Please try again.", "tr": "Geçersiz e-posta adresi. Lütfen tekrar deneyin."},
-                    {"id": "error-for-password", "en": "Incorrect email or password.", "tr": "Hatalı e-posta veya şifre."},
-                    {"id": "error-for-username", "en": "Incorrect email or password.", "tr": "Hatalı e-posta veya şifre."}
-                ]
-
-                for error in error_messages:
+                # Check for login errors first - the language is not known yet, so every pack's messages match
+                error_messages = {
+                    "wrong_password": "Wrong password. Please try again.",
+                    "invalid_email": "Invalid email address. Please try again.",
+                    "incorrect_credentials": "Incorrect email or password."
+                }
+
+                for error_id in ["error-for-password", "error-for-username"]:
                     try:
-                        error_element = self.driver.find_element(By.ID, error["id"])
+                        error_element = self.driver.find_element(By.ID, error_id)
                         if error_element and error_element.is_displayed():
-                            error_text = error_element.text
-                            if error["en"].lower() in error_text.lower() or error["tr"] in error_text:
-                                print_error(f"\n{error['en']}")
-                                return False
+                            error_hits = self.phrase_matcher.match(error_element.text)
+                            for category, message in error_messages.items():
+                                if category in error_hits:
+                                    print_error(f"\n{message}")
+                                    return False
                     except NoSuchElementException:
                         continue
 
                 # Check for security check or 2FA only if no login errors
-                security_check_phrases = [
-                    "checkpoint/challenge", 
-                    "security/challenge",
-                    "checkpoint/"
-                ]
-                
-                if any(phrase in self.driver.current_url for phrase in security_check_phrases) or \
+                if any(phrase in self.driver.current_url for phrase in self.SECURITY_CHECK_URL_MARKERS) or \
                    self.driver.find_elements(By.XPATH, self.TWO_FA_INPUT_XPATH):
                     
                     print_info("\n=== SECURITY CHECK OR 2FA REQUIRED ===")
@@ -355,19 +1854,16 @@ class LinkedInConnector:
                     
                     # Wait for user to complete the verification
                     max_wait_minutes = 5
-                    start_time = time.time()
-                    
-                    while time.time() - start_time < (max_wait_minutes * 60):
-                        if self._is_logged_in():
-                            print_success("\nSecurity check completed successfully!")
-                            return True
-                        time.sleep(5)
+                    if self._wait_for_login(max_wait_minutes * 60) is not None:
+                        print_success("\nSecurity check completed successfully!")
+                        return True
                     
                     print_warning("\nSecurity check timed out. Please try again.")
                     return False
 
                 # If we're logged in, return success
                 if self._is_logged_in():
+                    self._session_established()
                     print_success("\nLogin successful!")
                     return True
 
@@ -380,17 +1876,13 @@ class LinkedInConnector:
                 print_info("3. The bot will continue automatically once you're logged in")
                 print_info("Time limit: 5 minutes\n")
                 
-                self.driver.get("https://www.linkedin.com/login")
+                self.driver.get(f"{self.base_url}/login")
                 
                 # Wait for user to complete login
                 max_wait_minutes = 5
-                start_time = time.time()
-                
-                while time.time() - start_time < (max_wait_minutes * 60):
-                    if self._is_logged_in():
-                        print_success("\nLogin successful!")
-                        return True
-                    time.sleep(5)
+                if self._wait_for_login(max_wait_minutes * 60) is not None:
+                    print_success("\nLogin successful!")
+                    return True
                 
                 print_warning("\nLogin timed out. Please try again.")
                 return False
@@ -400,7 +1892,7 @@ class LinkedInConnector:
 
         except Exception as e:
             print_error(f"\nLogin failed: {str(e)}")
-            logging.error(f"Login error: {str(e)}")
+            logger.error(f"Login error: {str(e)}")
             return False
 
     def send_connection_request_on_profile_page(self, profile_url, message=None):
@@ -409,127 +1901,169 @@ class LinkedInConnector:
         Args:
             profile_url (str): URL of the profile to connect with
             message (str, optional): Custom message to include with the connection request
+            
+        Returns:
+            bool: True if a request was sent or none is needed (pending, connected, in the ledger)
+        """
+        return self.connect_on_profile_page(profile_url, message) != 'failed'
+
+    @profiled_phase("profile_page")
+    def connect_on_profile_page(self, profile_url, message=None):
+        """Send a connection request from a profile page and report what happened
+        
+        Args:
+            profile_url (str): URL of the profile to connect with
+            message (str, optional): Custom message to include with the connection request
+            
+        Returns:
+            str: 'sent', 'pending', 'connected', 'already_contacted' (per the ledger) or 'failed'
         """
+        if self.ledger and self.ledger.is_done(profile_url):
+            logger.info(f"Already contacted according to ledger ({self.ledger.status(profile_url)}): {profile_url}")
+            return 'already_contacted'
+
         try:
-            logging.info(f"Navigating to profile: {profile_url}")
+            logger.info(f"Navigating to profile: {profile_url}")
+            self._sample_resources()
+            self._check_browser_memory(reload=False)
             self.driver.get(profile_url)
             time.sleep(random.uniform(3, 6))
 
-            connect_button_xpath = (
-                '//div[contains(@class, "pvs-profile-actions")]//button[.//span[text()="Connect" or text()="Bağlantı kur"]] | '
-                '//button[contains(@class, "artdeco-button--primary") and (.//span[text()="Connect"] or .//span[text()="Bağlantı kur"])]'
-            )
-            connect_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, connect_button_xpath)))
+            connect_button = self.selectors.find(self.wait, "profile_connect")
             self.driver.execute_script("arguments[0].scrollIntoView(true);", connect_button)
             time.sleep(0.5)
             connect_button.click()
-            logging.info("Connect button clicked on profile page.")
+            logger.info("Connect button clicked on profile page.")
             time.sleep(random.uniform(1, 3))
 
             # Only pass the message if notes are enabled
             custom_message = message if self.use_notes else None
-            self._handle_connection_modal(custom_message=custom_message)
+            if not self._handle_connection_modal(custom_message=custom_message):
+                logger.warning(f"Connection modal could not be handled on profile page: {profile_url}")
+                return 'failed'
 
-            logging.info(f"Connection request sent (profile page): {profile_url}")
+            logger.info(f"Connection request sent (profile page): {profile_url}",
+                        extra={'phase': 'profile_page', 'profile_url': profile_url})
+            self._record_in_ledger(profile_url, 'sent')
             time.sleep(random.uniform(2, 4))
-            return True
+            return 'sent'
 
         except TimeoutException:
-            logging.warning(f"Connect button not found or timed out: {profile_url}")
-            page_content = self.driver.page_source.lower()
-            if "pending" in page_content or "beklemede" in page_content:
-                 logging.info(f"Connection request already pending: {profile_url}")
-                 return True
-            if "1st degree connection" in page_content or "1. derece bağlantı" in page_content:
-                 logging.info(f"Already connected: {profile_url}")
-                 return True
-            return False
+            logger.warning(f"Connect button not found or timed out: {profile_url}")
+            page_state = self._probe_page_text()
+            if "pending" in page_state:
+                 logger.info(f"Connection request already pending: {profile_url}")
+                 self._record_in_ledger(profile_url, 'pending')
+                 return 'pending'
+            if "connected" in page_state:
+                 logger.info(f"Already connected: {profile_url}")
+                 self._record_in_ledger(profile_url, 'connected')
+                 return 'connected'
+            return 'failed'
         except Exception as e:
-            logging.error(f"Error sending connection request on profile page {profile_url}: {str(e)}", exc_info=True)
-            return False
+            logger.error(f"Error sending connection request on profile page {profile_url}: {str(e)}", exc_info=True)
+            return 'failed'
 
+    @profiled_phase("limit_check")
     def check_weekly_limit_popups(self):
         """Checks for known weekly limit pop-up modals and attempts to close them."""
         try:
-            limit_modal_xpath = '//div[contains(@class, "artdeco-modal__content") and (contains(., "limit") or contains(., "sınır"))]'
-            limit_modals_found = self.driver.find_elements(By.XPATH, limit_modal_xpath)
+            limit_modals_found = self.driver.find_elements(By.XPATH, self.selectors.xpath_union("limit_modal"))
 
             if limit_modals_found:
-                logging.warning("Potential limit modal detected.")
-                dismiss_button_xpaths = [
-                    './/button[contains(@class, "artdeco-modal__dismiss")]',
-                    './/button[contains(text(), "Got it") or contains(text(), "Anladım")]',
-                    './/button[contains(@aria-label, "Dismiss") or contains(@aria-label, "Kapat")]'
-                ]
+                logger.warning("Potential limit modal detected.")
                 for modal_element in limit_modals_found:
-                    modal_text_lower = modal_element.text.lower()
-                    if "haftalık davet sınırına ulaştınız" in modal_text_lower or \
-                       "weekly invitation limit" in modal_text_lower:
+                    if "weekly_limit" in self.phrase_matcher.match(modal_element.text):
                         if not self._limit_reported:
-                            logging.error("\n" + "="*70 +
+                            logger.error("\n" + "="*70 +
                                         "\nERROR: Weekly connection limit reached (Detected via modal)!" +
                                         "\nPlease try again next week." +
                                         "\n" + "="*70)
                             self._limit_reported = True
-                        for xpath in dismiss_button_xpaths:
-                            try:
-                                close_button = modal_element.find_element(By.XPATH, xpath)
-                                close_button.click()
-                                logging.info("Limit modal closed.")
-                                time.sleep(1)
-                                return True # Limit reached
-                            except NoSuchElementException:
-                                continue
-                        return True
+                        close_button = self.selectors.find_now(self.driver, "dismiss", scope=modal_element)
+                        if close_button:
+                            close_button.click()
+                            logger.info("Limit modal closed.")
+                            time.sleep(1)
+                        return True # Limit reached
 
         except Exception as e:
-            logging.debug(f"Error checking limit modal: {str(e)}")
+            logger.debug(f"Error checking limit modal: {str(e)}")
         return False
 
-    def send_connection_requests_from_search(self, keywords, max_requests=30):
-        """Send connection requests to people in search results"""
+    @profiled_phase("search")
+    def send_connection_requests_from_search(self, keywords, max_requests=30, resume=False):
+        """Send connection requests to people in search results
+        
+        Args:
+            keywords (str): Search keywords
+            max_requests (int): Maximum number of requests to send
+            resume (bool): Continue after the last page recorded in the search checkpoint
+        """
+        checkpoint = None
+        if self.checkpoint_dir:
+            checkpoint = SearchCheckpoint(self.checkpoint_dir, keywords, self.email or "default", self.search_filters)
+            if resume and checkpoint.load():
+                logger.info(f"Resuming '{keywords}' after page {checkpoint.last_page} "
+                            f"({len(checkpoint.handled)} cards already handled).")
+            elif resume:
+                logger.info(f"No checkpoint found for '{keywords}', starting from page 1.")
+
+        request_count = 0
         try:
-            search_url = f"https://www.linkedin.com/search/results/people/?keywords={keywords.replace(' ', '%20')}"
-            logging.info(f"Searching: {keywords} - URL: {search_url}")
-            self.driver.get(search_url)
-            time.sleep(random.uniform(3, 5))
-
-            if self.check_invitation_limit(silent=False) or self.check_weekly_limit_popups():
+            # A resumed search opens the first unfinished page directly
+            page = checkpoint.last_page + 1 if checkpoint and checkpoint.last_page else 1
+            search_url = build_search_url(self.base_url, keywords, page, self.search_filters)
+            logger.info(f"Searching: {keywords} - URL: {search_url}")
+            with self._phase("search_page_load"):
+                self._sample_resources()
+                self.driver.get(search_url)
+                time.sleep(random.uniform(3, 5))
+
+            if self._limit_reached(silent=False):
                 return 0
 
-            request_count = 0
-            page = 1
-
             while request_count < max_requests:
-                logging.info(f"Processing page {page}. Requests sent: {request_count}/{max_requests}")
-                self._scroll_to_bottom_of_page()
-
-                connect_buttons_found = self.driver.find_elements(By.XPATH, self.SEARCH_RESULTS_CONNECT_BUTTON_XPATH)
+                logger.info(f"Processing page {page}. Requests sent: {request_count}/{max_requests}",
+                            extra={'phase': 'search', 'keyword': keywords, 'page': page, 'requests_sent': request_count})
+                # The scroll probe counts every Connect button, including the ones skipped below,
+                # so with skips possible the early stop is confirmed against the cards acted on
+                actionable = None
+                if self.card_rules or self.ledger or (checkpoint and checkpoint.handled):
+                    actionable = functools.partial(self._count_actionable_cards, checkpoint)
+                self._scroll_to_bottom_of_page(needed=max_requests - request_count, actionable=actionable)
+
+                cards = self._snapshot_search_cards()
                 
-                if not connect_buttons_found:
-                    logging.info("No 'Connect' buttons found on this page.")
-                    page_content = self.driver.page_source.lower()
-                    if "no results found" in page_content or "sonuç bulunamadı" in page_content:
-                        logging.info("No search results found.")
+                if not cards:
+                    logger.info("No 'Connect' buttons found on this page.")
+                    if "no_results" in self._probe_page_text():
+                        logger.info("No search results found.")
                         break
+                    self._save_checkpoint(checkpoint, page)
                     if not self._go_to_next_search_page():
-                        logging.info("No more pages found or reached the end.")
+                        logger.info("No more pages found or reached the end.")
                         break
                     page += 1
                     time.sleep(random.uniform(3, 5))
                     continue
 
-                logging.info(f"Found {len(connect_buttons_found)} potential connect buttons on the page.")
+                logger.info(f"Found {len(cards)} potential connect buttons on the page.")
                 
-                for i, button in enumerate(connect_buttons_found):
+                for i, card in enumerate(cards):
                     if request_count >= max_requests:
-                        logging.info("Maximum request count reached.")
+                        logger.info("Maximum request count reached.")
                         break
 
+                    skip_reason = self._skip_reason(card, checkpoint)
+                    if skip_reason:
+                        logger.info(f"Button #{i+1} skipped, {skip_reason}: {card['href']}")
+                        continue
+
                     # Check for weekly limit before processing each button
-                    if self.check_invitation_limit(silent=True) or self.check_weekly_limit_popups():
+                    if self._limit_reached():
                         if not self._limit_reported:
-                            logging.error("\n" + "="*70 +
+                            logger.error("\n" + "="*70 +
                                       "\nERROR: Weekly connection request limit reached!" +
                                       "\nPlease try again next week." +
                                       "\n" + "="*70)
@@ -537,44 +2071,53 @@ class LinkedInConnector:
                         return request_count
 
                     try:
-                        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-                        time.sleep(random.uniform(0.5, 1.5))
-
-                        if button.is_displayed() and button.is_enabled():
-                            button_text = button.text.strip()
-                            logging.info(f"Processing button #{i+1} ({button_text})...")
+                        if card['visible'] and card['enabled']:
+                            time.sleep(random.uniform(0.5, 1.5))
+                            logger.info(f"Processing button #{i+1} ({card['label']})...")
+                            request_start = time.time()
                             
-                            button.click()
-                            time.sleep(random.uniform(1, 2))
+                            # WebDriver scrolls the element into view as part of the click
+                            with self._phase("click"):
+                                card['element'].click()
+                                time.sleep(random.uniform(1, 2))
 
                             modal_handled = self._handle_connection_modal()
+                            # Cards without a URN or profile link only have a position as id
+                            # ("index-N"), which would match card N of every later page on resume
+                            if checkpoint and not card['id'].startswith('index-'):
+                                checkpoint.handled.add(card['id'])
                             
                             if modal_handled:
                                 request_count += 1
-                                logging.info(f"Connection request sent: {request_count}/{max_requests}")
+                                self._record_in_ledger(card['href'], 'sent', keywords)
+                                logger.info(f"Connection request sent: {request_count}/{max_requests}",
+                                            extra={'phase': 'search', 'keyword': keywords, 'page': page,
+                                                   'card_id': card['id'], 'profile_url': card['href'],
+                                                   'duration': round(time.time() - request_start, 3),
+                                                   'requests_sent': request_count})
                             else:
-                                logging.warning("Connection modal could not be handled or request could not be sent.")
+                                logger.warning("Connection modal could not be handled or request could not be sent.")
                                 self._close_any_generic_modal()
 
                             wait_time = 1
-                            logging.info(f"Waiting {wait_time} seconds for next request...")
+                            logger.info(f"Waiting {wait_time} seconds for next request...")
                             time.sleep(wait_time)
                         else:
-                            logging.warning(f"Button #{i+1} not visible or not enabled, skipping.")
+                            logger.warning(f"Button #{i+1} not visible or not enabled, skipping.")
 
                     except ElementClickInterceptedException:
-                        logging.warning("Button click intercepted. Probably an overlay/popup. Attempting to close...")
+                        logger.warning("Button click intercepted. Probably an overlay/popup. Attempting to close...")
                         self._close_any_generic_modal()
                         time.sleep(1)
                     except Exception as e:
-                        logging.warning(f"Error sending a connection request: {str(e)}")
+                        logger.warning(f"Error sending a connection request: {str(e)}")
                         if "message type unsupported" in str(e).lower():
-                            logging.warning("There might be a temporary issue with browser communication. Continuing.")
+                            logger.warning("There might be a temporary issue with browser communication. Continuing.")
                         
                         # Check for limit after an error occurs
-                        if self.check_invitation_limit(silent=True) or self.check_weekly_limit_popups():
+                        if self._limit_reached():
                             if not self._limit_reported:
-                                logging.error("\n" + "="*70 +
+                                logger.error("\n" + "="*70 +
                                           "\nERROR: Weekly connection request limit reached!" +
                                           "\nPlease try again next week." +
                                           "\n" + "="*70)
@@ -582,260 +2125,393 @@ class LinkedInConnector:
                             return request_count
 
                 if request_count < max_requests:
+                    self._save_checkpoint(checkpoint, page)
                     if not self._go_to_next_search_page():
-                        logging.info("No more pages found.")
+                        logger.info("No more pages found.")
                         break
                     page += 1
-                    logging.info(f"Moving to page {page}...")
+                    logger.info(f"Moving to page {page}...")
                     time.sleep(random.uniform(3, 5))
 
             return request_count
 
         except Exception as e:
-            logging.error(f"General error while sending connection requests: {str(e)}", exc_info=True)
-            return locals().get('request_count', 0)
+            logger.error(f"General error while sending connection requests: {str(e)}", exc_info=True)
+            return request_count
+        finally:
+            # Keep the cards handled on a partially processed page, even on Ctrl+C or a crash
+            if checkpoint:
+                checkpoint.requests_sent += request_count
+                self._save_checkpoint(checkpoint)
+
+    def send_connection_requests_for_keywords(self, keywords_list, max_requests=30, resume=False):
+        """Run several searches one after another in the same browser session
+        
+        Args:
+            keywords_list (list): Search keywords, processed in order
+            max_requests (int): Request budget shared by all searches
+            resume (bool): Continue each search after its last checkpointed page
+            
+        Returns:
+            list: One dict per keyword with the keywords, requests sent, duration and outcome
+                ('exhausted', 'budget', 'limit' or 'skipped' when it never ran)
+        """
+        results = []
+        total = 0
+        for index, keywords in enumerate(keywords_list):
+            remaining = max_requests - total
+            if remaining <= 0 or self._limit_reported:
+                results.append({'keywords': keywords, 'sent': 0, 'duration': 0.0, 'outcome': 'skipped'})
+                continue
+            if index:
+                time.sleep(random.uniform(3, 5))
+
+            print_highlight(f"\n=== [{index + 1}/{len(keywords_list)}] '{keywords}' (remaining budget: {remaining}) ===")
+            started = time.time()
+            sent = self.send_connection_requests_from_search(keywords, remaining, resume=resume)
+            total += sent
+            if self._limit_reported:
+                outcome = 'limit'
+            elif sent >= remaining:
+                outcome = 'budget'
+            else:
+                outcome = 'exhausted'
+            results.append({'keywords': keywords, 'sent': sent, 'duration': round(time.time() - started, 1),
+                            'outcome': outcome})
+            logger.info(f"Keyword '{keywords}' finished: {sent} requests sent ({outcome}).",
+                        extra={'phase': 'search', 'keyword': keywords, 'requests_sent': sent})
+            if self._limit_reported:
+                logger.warning("Weekly limit reached, skipping the remaining keywords.")
+        return results
+
+    def send_connection_requests_from_profiles(self, profile_urls, max_requests=30, results=None):
+        """Visit profile pages one after another and send a connection request on each
+        
+        Args:
+            profile_urls (iterable): Normalized profile URLs, consumed lazily
+            max_requests (int): Maximum number of requests to send
+            results (ProfileResults, optional): Outcome log; profiles it lists as done are skipped
+            
+        Returns:
+            dict: Number of profiles per outcome ('sent', 'pending', 'connected',
+                'already_contacted', 'failed' and 'skipped' for those done in an earlier run)
+        """
+        counts = {}
+        for profile_url in profile_urls:
+            if counts.get('sent', 0) >= max_requests:
+                logger.info("Maximum request count reached.")
+                break
+            if results and profile_url in results.processed:
+                counts['skipped'] = counts.get('skipped', 0) + 1
+                continue
 
+            status = self.connect_on_profile_page(profile_url, self.connection_note)
+            limit_reached = self._limit_reached(silent=False)
+            if limit_reached and status == 'failed':
+                # Refused because of the limit; leave the profile for the next run
+                break
+            counts[status] = counts.get(status, 0) + 1
+            if results:
+                results.record(profile_url, status)
+            logger.info(f"Profile {profile_url}: {status}. Requests sent: {counts.get('sent', 0)}/{max_requests}",
+                        extra={'phase': 'profile_page', 'profile_url': profile_url,
+                               'requests_sent': counts.get('sent', 0)})
+            if limit_reached:
+                break
+        return counts
 
-    def _scroll_to_bottom_of_page(self):
-        """Scrolls to the bottom of the page to load all dynamic content."""
-        logging.info("Scrolling to bottom of page...")
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+    def _save_checkpoint(self, checkpoint, completed_page=None):
+        """Save search progress, optionally marking a page as fully processed"""
+        if not checkpoint:
+            return
+        if completed_page is not None:
+            checkpoint.last_page = max(checkpoint.last_page, completed_page)
+        try:
+            checkpoint.save()
+        except OSError as e:
+            logger.warning(f"Could not save search checkpoint: {str(e)}")
+
+
+    def _snapshot_search_cards(self, record=True):
+        """Return the Connect buttons of the current results page as card dicts (one round trip).
+
+        With card rules set, the same script call also evaluates them against every card.
+
+        Args:
+            record (bool): Count the rule hits in the card rules' report
+        """
+        rules = self.card_rules.script_rules() if self.card_rules else []
+        cards = self.driver.execute_script(self.SEARCH_CARDS_SNAPSHOT_JS, self.selectors.xpath_union("search_connect"),
+                                           rules, self.CARD_FIELD_SELECTORS) or []
+        if self.card_rules and record:
+            self.card_rules.record(cards)
+        return cards
+
+    def _skip_reason(self, card, checkpoint=None):
+        """Return why the search loop passes over a card without clicking it, or None"""
+        if not card.get('allowed', True):
+            return "the card does not match the rules"
+        if checkpoint and card['id'] in checkpoint.handled:
+            return "already handled before the interruption"
+        if self.ledger and card['href'] and self.ledger.is_done(card['href']):
+            return "already contacted according to ledger"
+        return None
+
+    def _count_actionable_cards(self, checkpoint=None):
+        """Count the loaded Connect buttons the search loop would click (one round trip)"""
+        return sum(1 for card in self._snapshot_search_cards(record=False)
+                   if card['visible'] and card['enabled'] and not self._skip_reason(card, checkpoint))
+
+    @profiled_phase("scroll")
+    def _scroll_to_bottom_of_page(self, needed=None, actionable=None):
+        """Scrolls until no more results lazy-load, or until enough Connect buttons are present.
+        
+        Args:
+            needed (int, optional): Stop early once this many Connect buttons are on the page
+            actionable (callable, optional): Returns how many loaded buttons will be acted on;
+                checked only once the probe's button count alone would stop the scroll
+            
+        Returns:
+            float: Seconds the page took to settle
+        """
+        logger.info("Scrolling to bottom of page...")
+        start_time = time.time()
+        state = self._probe_scroll_state(scroll=False)
         scroll_attempts = 0
-        max_scroll_attempts = 5
+        max_scroll_attempts = 10
 
         while scroll_attempts < max_scroll_attempts:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(2, 4))
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                logging.debug("Reached bottom of page.")
+            if needed and state['actionable'] >= needed and (actionable is None or actionable() >= needed):
+                logger.debug(f"{state['actionable']} connect buttons loaded, enough for the remaining {needed} requests.")
+                break
+
+            previous = state
+            state = self._probe_scroll_state(scroll=True)
+
+            def loaded_more(driver):
+                current = self._probe_scroll_state(scroll=False)
+                if (current['cards'], current['height']) != (previous['cards'], previous['height']):
+                    return current
+                return False
+
+            # Wait for the lazy loader to add cards instead of sleeping a fixed time
+            try:
+                state = WebDriverWait(self.driver, self.SCROLL_SETTLE_TIMEOUT, poll_frequency=0.25).until(loaded_more)
+            except TimeoutException:
+                logger.debug("Reached bottom of page.")
                 break
-            last_height = new_height
             scroll_attempts += 1
         if scroll_attempts == max_scroll_attempts:
-            logging.warning("Maximum scroll attempts reached. Some content might not be loaded.")
+            logger.warning("Maximum scroll attempts reached. Some content might not be loaded.")
 
+        settle_time = time.time() - start_time
+        logger.info(f"Page settled in {settle_time:.1f}s ({state['cards']} result cards, {state['actionable']} connect buttons).",
+                    extra={'phase': 'scroll', 'duration': round(settle_time, 3)})
+        return settle_time
 
+    def _probe_scroll_state(self, scroll):
+        """Return the loaded card count, Connect button count and page height in one round trip"""
+        return self.driver.execute_script(self.SCROLL_PROBE_JS, self.SEARCH_RESULT_CARD_SELECTOR,
+                                          self.selectors.xpath_union("search_connect"), scroll)
+
+    @profiled_phase("modal")
     def _handle_connection_modal(self, custom_message=None):
         """Handle the connection modal and send the connection request.
         
+        A single wait watches for every state the Connect click can lead to (a limit popup,
+        an error toast or one of the modal's buttons) and the handler continues from
+        whichever appears first.
+        
         Args:
             custom_message (str, optional): Custom message to include with the connection request
             
         Returns:
             bool: True if the connection request was sent successfully, False otherwise
         """
+        # Only add a note if notes are explicitly enabled and we have a message to send
+        message_to_send = (custom_message or self.connection_note) if self.use_notes else None
+        if message_to_send:
+            outcomes = ["note_field", "add_note", "send", "send_without_note"]
+        else:
+            outcomes = ["send_without_note", "send"]
+
+        modal = None
+        outcome = None
         try:
-            # Wait for the modal to appear
-            self.short_wait.until(EC.presence_of_element_located(
-                (By.XPATH, '//div[contains(@class, "artdeco-modal--layer-default")]')
-            ))
-            
-            # Only add a note if notes are explicitly enabled and we have a message to send
-            if self.use_notes and (custom_message or self.connection_note):
-                message_to_send = custom_message or self.connection_note
-                try:
-                    # Try to find and click the "Add a note" button if it exists
-                    add_note_button = self.short_wait.until(
-                        EC.element_to_be_clickable((By.XPATH, self.MODAL_ADD_NOTE_BUTTON_XPATH))
-                    )
-                    logging.info("Add note button found, clicking...")
-                    add_note_button.click()
-                    time.sleep(random.uniform(0.5, 1.5))
-
-                    # Find the note field and enter the message
-                    note_field = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, 
-                            f"//textarea[@id='{self.MODAL_CUSTOM_MESSAGE_ID}' or @name='message' or contains(@class, 'message')]"))
-                    )
-                    logging.info(f"Adding note: '{message_to_send[:30]}...'")
-                    note_field.clear()
-                    note_field.send_keys(message_to_send)
-                    time.sleep(random.uniform(0.5, 1))
-                except TimeoutException:
-                    logging.info("Add note button not found. Looking for direct message field...")
-                    try:
-                        # Some modals might have the note field directly visible
-                        note_field_elements = self.driver.find_elements(
-                            By.XPATH, 
-                            f"//textarea[@id='{self.MODAL_CUSTOM_MESSAGE_ID}' or @name='message' or contains(@class, 'message')]"
-                        )
-                        if note_field_elements and note_field_elements[0].is_displayed():
-                            logging.info(f"Adding note directly: '{message_to_send[:30]}...'")
-                            note_field_elements[0].clear()
-                            note_field_elements[0].send_keys(message_to_send)
-                            time.sleep(random.uniform(0.5, 1))
-                    except NoSuchElementException:
-                        logging.info("Note field not found. Sending without a note.")
-            else:
-                # In default mode, we want to click the 'Not olmadan gönderin' button
-                logging.info("Sending connection request without a note (default mode).")
-                
-                # Try to find and click the 'Not olmadan gönderin' button
-                try:
-                    # First try the exact Turkish text
-                    send_without_note = self.short_wait.until(
-                        EC.element_to_be_clickable((By.XPATH, 
-                            '//button[.//span[text()="Not olmadan gönderin"]] | '
-                            '//button[text()="Not olmadan gönderin"] | '
-                            '//button[contains(@aria-label, "Not olmadan gönderin")] | '
-                            # Fallback for English UI
-                            '//button[.//span[text()="Send without a note"]] | '
-                            '//button[text()="Send without a note"] | '
-                            '//button[contains(@aria-label, "Send without a note")] | '
-                            # More generic fallbacks
-                            '//button[contains(., "Not olmadan")] | '
-                            '//button[contains(., "without a note")] | '
-                            '//button[contains(., "Send") and not(contains(., "Add")) and not(contains(., "Note"))] | '
-                            '//button[contains(., "Gönder") and not(contains(., "Not"))]'))
-                    )
-                    logging.info("Found 'Not olmadan gönderin' button, clicking...")
-                    send_without_note.click()
-                    time.sleep(random.uniform(1, 2))
-                    return True
-                except (TimeoutException, NoSuchElementException) as e:
-                    logging.info(f"Could not find 'Not olmadan gönderin' button: {str(e)}, trying default send button...")
-            
-            # Find and click the send button
-            # First try to find a button that's not the cancel button
-            try:
-                send_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, 
-                        f"{self.MODAL_SEND_BUTTON_XPATH}["
-                        "not(contains(@aria-label, 'Cancel') or contains(@aria-label, 'İptal')) "
-                        "and not(contains(@class, 'cancel'))]"
-                    ))
-                )
-                logging.info("Send button found, clicking...")
-                send_button.click()
-                time.sleep(random.uniform(1, 2))
-            except TimeoutException:
-                # If we can't find the main send button, try to find any button that says 'Send' or 'Gönder'
-                try:
-                    send_button = self.driver.find_element(
-                        By.XPATH,
-                        '//button[contains(., "Send") or contains(., "Gönder")] | '
-                        '//button[contains(@aria-label, "Send") or contains(@aria-label, "Gönder")] | '
-                        '//button[.//span[text()="Send" or text()="Gönder"]]'
-                    )
-                    if send_button.is_displayed() and send_button.is_enabled():
-                        logging.info("Alternative send button found, clicking...")
-                        send_button.click()
-                        time.sleep(random.uniform(1, 2))
-                    else:
-                        raise NoSuchElementException("Send button not clickable")
-                except (NoSuchElementException, ElementNotInteractableException) as e:
-                    logging.error(f"Could not find or click send button: {str(e)}")
-                    self._close_any_generic_modal()
+            # Every button lookup is scoped to the modal; the popups are looked for page-wide
+            outcome, element, modal = self.selectors.find_first(self.short_wait, outcomes, scope_target="modal",
+                                                               page_targets=self.MODAL_PAGE_OUTCOMES)
+
+            if outcome == "limit_modal":
+                # The popup selector only prefilters on "limit"; a known phrase confirms it
+                if self.phrase_matcher.match(element.text) & {"weekly_limit", "limit"}:
+                    logger.warning("Limit popup shown instead of the connection modal.")
+                    if not self.check_weekly_limit_popups():
+                        self._close_any_generic_modal()
                     return False
+                logger.debug("Popup text mentions a limit but no limit phrase; continuing with the modal.")
+                outcome, element, modal = self.selectors.find_first(self.short_wait, outcomes, scope_target="modal",
+                                                                   page_targets=("error_toast",))
+            if outcome == "error_toast":
+                logger.warning(f"Error shown instead of the connection modal: {element.text.strip()}")
+                self._close_any_generic_modal(modal)
+                return False
+
+            if outcome == "add_note":
+                logger.info("Add note button found, clicking...")
+                element.click()
+                time.sleep(random.uniform(0.5, 1.5))
+                element = self.selectors.find(self.wait, "note_field", scope=modal, clickable=False)
+                outcome = "note_field"
+
+            if outcome == "note_field":
+                logger.info(f"Adding note: '{message_to_send[:30]}...'")
+                element.clear()
+                element.send_keys(message_to_send)
+                time.sleep(random.uniform(0.5, 1))
+                # The send button's candidates never match a cancel button
+                element = self.selectors.find(self.wait, "send", scope=modal)
+                outcome = "send"
+            elif message_to_send:
+                logger.info("Note field not found. Sending without a note.")
+
+            if outcome == "send_without_note":
+                logger.info("Found 'Not olmadan gönderin' button, clicking...")
+            else:
+                logger.info("Send button found, clicking...")
+            element.click()
+            time.sleep(random.uniform(1, 2))
             return True
 
         except TimeoutException:
-            logging.warning("Send button not found or timed out in connection modal.")
-            self._close_any_generic_modal(specific_modal_xpath='//div[contains(@class, "artdeco-modal--layer-default")]')
+            if outcome:
+                logger.warning(f"Connection modal timed out after the {outcome} step.")
+            else:
+                logger.warning("Neither the connection modal nor a limit or error popup appeared in time.")
+            self._close_any_generic_modal(modal)
+            return False
+        except ElementNotInteractableException as e:
+            logger.error(f"Could not click the {outcome} button: {str(e)}")
+            self._close_any_generic_modal(modal)
             return False
         except Exception as e:
-            logging.error(f"Error handling connection modal: {str(e)}", exc_info=True)
-            self._close_any_generic_modal(specific_modal_xpath='//div[contains(@class, "artdeco-modal--layer-default")]')
+            logger.error(f"Error handling connection modal: {str(e)}", exc_info=True)
+            self._close_any_generic_modal(modal)
             return False
 
-    def _close_any_generic_modal(self, specific_modal_xpath=None):
-        """Attempts to close any visible modal."""
+    @profiled_phase("modal")
+    def _close_any_generic_modal(self, modal=None):
+        """Attempts to close any visible modal.
+        
+        Args:
+            modal (WebElement, optional): Modal to close; by default the open modal is looked up
+        """
         try:
-            if specific_modal_xpath:
-                modals = self.driver.find_elements(By.XPATH, specific_modal_xpath)
-                if modals and modals[0].is_displayed():
-                    logging.debug(f"Attempting to close specific modal: {specific_modal_xpath}")
-                    common_close_xpaths = [
-                        './/button[contains(@aria-label, "Dismiss") or contains(@aria-label, "Kapat")]',
-                        './/button[contains(@class, "artdeco-modal__dismiss")]',
-                        './/button[contains(@aria-label, "Cancel") or contains(@aria-label, "İptal")]'
-                    ]
-                    for xpath in common_close_xpaths:
-                        try:
-                            close_button = modals[0].find_element(By.XPATH, xpath)
-                            if close_button.is_displayed() and close_button.is_enabled():
-                                close_button.click()
-                                logging.info("Specific modal closed.")
-                                time.sleep(0.5)
-                                return True
-                        except: pass
-            
-            active_modals_close_buttons = self.driver.find_elements(By.XPATH, '//div[contains(@class, "artdeco-modal__header") and preceding-sibling::div[contains(@class, "artdeco-modal__overlay")]]/following-sibling::button[contains(@class, "artdeco-modal__dismiss")] | //button[@aria-label="Dismiss"]')
-            if active_modals_close_buttons:
-                for btn in active_modals_close_buttons:
-                    if btn.is_displayed() and btn.is_enabled():
-                        logging.info("Closing a generic modal...")
-                        btn.click()
-                        time.sleep(0.5)
-                        return True
+            if modal is None:
+                modal = self.selectors.find_now(self.driver, "modal", clickable=False)
+            # Scoped to the modal when there is one, otherwise any dismiss button on the page
+            close_button = self.selectors.find_now(self.driver, "dismiss", scope=modal)
+            if close_button:
+                logger.info("Closing a modal...")
+                close_button.click()
+                time.sleep(0.5)
+                return True
 
-            overlay = self.driver.find_elements(By.XPATH, '//div[contains(@class, "artdeco-modal__overlay--is-current")]')
-            if overlay and overlay[0].is_displayed():
-                logging.info("Pressing Escape to close a generic modal.")
+            if self.selectors.find_now(self.driver, "modal_overlay"):
+                logger.info("Pressing Escape to close a generic modal.")
                 webdriver.ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
                 time.sleep(1)
                 return True
             
         except Exception as e:
-            logging.debug(f"Error closing modal: {e}")
+            logger.debug(f"Error closing modal: {e}")
         return False
 
 
+    @profiled_phase("pagination")
     def _go_to_next_search_page(self):
         """Navigate to the next page of search results"""
+        self._sample_resources()
         try:
-            next_button_xpath = (
-                '//button[@aria-label="Sonraki" and not(@disabled)] | '
-                '//button[@aria-label="Next" and not(@disabled)] | '
-                '//li[contains(@class, "active") or contains(@class, "selected")]/following-sibling::li[1]/button[not(@disabled)]'
-            )
-            next_button = self.short_wait.until(EC.element_to_be_clickable((By.XPATH, next_button_xpath)))
+            next_button = self.selectors.find(self.short_wait, "next_page")
             
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", next_button)
             time.sleep(0.5)
             next_button.click()
             time.sleep(random.uniform(2, 4))
+            self._check_browser_memory()
             return True
         except TimeoutException:
-            logging.info("Next page button not found or not clickable. Probably the last page.")
+            logger.info("Next page button not found or not clickable. Probably the last page.")
         except Exception as e:
-            logging.warning(f"Could not navigate to next page: {str(e)}")
+            logger.warning(f"Could not navigate to next page: {str(e)}")
         return False
 
+    @profiled_phase("limit_check")
     def check_invitation_limit(self, silent=False):
         """Check if LinkedIn's weekly invitation limit has been hit."""
         try:
-            limit_messages = [
-                "haftalık davet sınırına ulaştınız", "weekly invitation limit",
-                "bağlantı isteği gönderemezsiniz", "you cannot send connection requests",
-                "sınırı aşıldı", "limit has been reached",
-                "too many invitations", "çok fazla davet",
-                "you're out of invitations for now", "şimdilik davet hakkınız kalmadı"
-            ]
-            page_source = self.driver.page_source.lower()
-            for msg in limit_messages:
-                if msg in page_source:
-                    if not silent and not self._limit_reported:
-                        logging.error("\n" + "="*70 +
-                                      "\nERROR: Weekly connection request limit reached (Detected in page source)!" +
-                                      "\nPlease try again next week." +
-                                      "\n" + "="*70)
-                        self._limit_reported = True
-                    return True
+            # The probe returns a single boolean; the page text never leaves the browser
+            if self.driver.execute_script(self.LIMIT_PROBE_JS, self.phrase_matcher.pattern, self.phrase_matcher.lookup):
+                if not silent and not self._limit_reported:
+                    logger.error("\n" + "="*70 +
+                                  "\nERROR: Weekly connection request limit reached (Detected on page)!" +
+                                  "\nPlease try again next week." +
+                                  "\n" + "="*70)
+                    self._limit_reported = True
+                return True
         except Exception as e:
             if not silent:
-                logging.warning(f"Error checking limit: {str(e)}")
+                logger.warning(f"Error checking limit: {str(e)}")
         return False
 
+    def _limit_reached(self, silent=True):
+        """Probe for the invitation limit and close the limit popup once the probe finds it.
+
+        The popup lookup costs a document-wide XPath scan, so it only runs after the probe
+        (whose observer also sees the popup's text) has reported the limit.
+        """
+        if not self.check_invitation_limit(silent=silent):
+            return False
+        self.check_weekly_limit_popups()
+        return True
+
+    def _probe_page_text(self):
+        """Return the names of the phrase categories found in the rendered page text."""
+        try:
+            return self.driver.execute_script(self.PAGE_TEXT_PROBE_JS, self.phrase_matcher.pattern, self.phrase_matcher.lookup) or []
+        except Exception as e:
+            logger.debug(f"Error probing page text: {str(e)}")
+            return []
+
+    def _record_in_ledger(self, profile_url, status, keyword=None):
+        """Record a profile's status in the ledger; failures never interrupt the run"""
+        if not self.ledger or not profile_url:
+            return
+        try:
+            self.ledger.record(profile_url, status, keyword)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update invitation ledger: {str(e)}")
+
     def close(self):
         """Close the browser"""
+        try:
+            self.selectors.save()
+        except OSError as e:
+            logger.warning(f"Could not save selector statistics: {str(e)}")
+        if self.ledger:
+            self.ledger.close()
+            self.ledger = None
         if self.driver:
+            self._sample_resources()
+            self._sample_browser_memory()
+            # Saved again on the way out, so cookies LinkedIn refreshed during the run are kept
+            self._save_session_cookies()
             try:
                 self.driver.quit()
-                logging.info("Browser closed")
+                logger.info("Browser closed")
             except Exception as e:
-                logging.error(f"Error closing browser: {e}")
+                logger.error(f"Error closing browser: {e}")
 
 def get_user_input(prompt, default_value, type_converter=str):
     """Generic function to get user input with a default value and type."""
@@ -879,6 +2555,155 @@ def get_user_input(prompt, default_value, type_converter=str):
             sys.exit(0)
 
 
+def _config_flag(value):
+    """Parse a yes/no setting such as 1, true, yes or on"""
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+def _login_method(value):
+    """Parse the login method setting"""
+    method = value.strip().lower()
+    if method not in ('console', 'browser'):
+        raise ValueError(f"login method must be 'console' or 'browser', not '{value}'")
+    return method
+
+# Settings read from the environment or a --config file (dotenv format), applied to every
+# option the command line leaves unset: variable -> (argparse destination, converter)
+CONFIG_OPTIONS = {
+    'LINKEDAUTO_LOGIN_METHOD': ('login_method', _login_method),
+    'LINKEDAUTO_EMAIL': ('email', str),
+    'LINKEDAUTO_PASSWORD': ('password', str),
+    'LINKEDAUTO_KEYWORDS': ('keywords', str),
+    'LINKEDAUTO_KEYWORDS_FILE': ('keywords_file', str),
+    'LINKEDAUTO_PROFILES_FILE': ('profiles_file', str),
+    'LINKEDAUTO_MAX_REQUESTS': ('max_requests', int),
+    'LINKEDAUTO_NETWORK': ('network', str),
+    'LINKEDAUTO_GEO_URN': ('geo_urn', str),
+    'LINKEDAUTO_CURRENT_COMPANY': ('current_company', str),
+    'LINKEDAUTO_RULES': ('rules', str),
+    'LINKEDAUTO_NOTE': ('note', str),
+    'LINKEDAUTO_USE_NOTES': ('use_notes', _config_flag),
+    'LINKEDAUTO_HEADLESS': ('headless', _config_flag),
+    'LINKEDAUTO_SESSION_DIR': ('session_dir', str),
+    'LINKEDAUTO_SESSION_FILE': ('session_file', str),
+    'LINKEDAUTO_SESSION_KEY': ('session_key', str),
+    'LINKEDAUTO_BLOCK_RESOURCES': ('block_resources', _config_flag),
+    'LINKEDAUTO_MAX_BROWSER_RSS_MB': ('max_browser_rss_mb', int),
+    'LINKEDAUTO_NON_INTERACTIVE': ('non_interactive', _config_flag)
+}
+
+def load_config(path=None):
+    """Collect LINKEDAUTO_* settings from a dotenv file and the environment
+    
+    Args:
+        path (str, optional): Config file; defaults to .env in the working directory if present
+        
+    Returns:
+        dict: Setting name to value, environment variables taking precedence over the file
+    """
+    values = {}
+    if path and not os.path.isfile(path):
+        raise OSError(f"Config file not found: {path}")
+    path = path or ('.env' if os.path.isfile('.env') else None)
+    if path:
+        # Imported here so runs without a config file do not pay for it at startup
+        from dotenv import dotenv_values
+        values.update({key: value for key, value in dotenv_values(path).items() if value is not None})
+    values.update({key: value for key, value in os.environ.items() if key.startswith('LINKEDAUTO_')})
+    return values
+
+def apply_config(args, config):
+    """Fill the options left unset on the command line from config settings
+    
+    Raises:
+        ValueError: A setting has an invalid value
+    """
+    # What to work on (search terms or a profiles file) given on the command line replaces
+    # all of those settings, since only one of them can be used per run
+    targets = ('keywords', 'keywords_file', 'profiles_file')
+    targets_given = any(getattr(args, dest) for dest in targets)
+    for name, (dest, converter) in CONFIG_OPTIONS.items():
+        value = config.get(name, '')
+        if not value.strip():
+            continue
+        if dest in targets and targets_given:
+            continue
+        current = getattr(args, dest)
+        if current is None or current is False:
+            try:
+                setattr(args, dest, converter(value))
+            except ValueError as e:
+                raise ValueError(f"Invalid {name}: {e}") from None
+
+def read_keywords_file(path):
+    """Read one search term per line, skipping blank lines, # comments and duplicates"""
+    keywords_list = []
+    with open(path, encoding='utf-8') as keywords_file:
+        for line in keywords_file:
+            keywords = line.strip()
+            if keywords and not keywords.startswith('#') and keywords not in keywords_list:
+                keywords_list.append(keywords)
+    return keywords_list
+
+def print_keyword_summary(results):
+    """Print one line per keyword of a batch run"""
+    outcomes = {
+        'exhausted': "results exhausted",
+        'budget': "request budget used up",
+        'limit': "weekly limit reached",
+        'skipped': "not run"
+    }
+    print_highlight("\n=== Keyword Summary ===")
+    for result in results:
+        line = f"  {result['keywords'][:40]:<40} {result['sent']:>4} sent  {result['duration']:>7.1f}s  {outcomes[result['outcome']]}"
+        if result['outcome'] == 'limit':
+            print_warning(line)
+        elif result['outcome'] == 'skipped':
+            print(Fore.WHITE + Style.DIM + line + Style.RESET_ALL)
+        else:
+            print_info(line)
+
+def print_profile_summary(counts, results_path):
+    """Print how many profiles ended in each outcome in --profiles-file mode"""
+    print_highlight("\n=== Profile Summary ===")
+    for status in ('sent', 'pending', 'connected', 'already_contacted', 'failed', 'skipped'):
+        if counts.get(status):
+            print_info(f"  {status.replace('_', ' '):<18} {counts[status]:>6}")
+    print_info(f"Per-profile results: {results_path}")
+
+def print_resource_summary(connector):
+    """Print the page traffic and browser memory of the run"""
+    memory = connector.memory_stats
+    if memory['samples']:
+        message = f"Browser memory: peak {memory['peak_mb']:.0f} MB, last {memory['last_mb']:.0f} MB"
+        if memory['recycles']:
+            message += f", tab recycled {memory['recycles']} times"
+        print_info(message)
+        logger.info(message, extra={'phase': 'summary'})
+
+    stats = connector.resource_stats
+    if not stats['pages']:
+        return
+    message = (f"Page traffic: {stats['bytes'] / (1024 * 1024):.1f} MB in {stats['requests']} requests "
+               f"over {stats['pages']} pages")
+    if connector.block_resources:
+        message += (f"; blocked {stats['blocked_images']} images, {stats['blocked_fonts']} fonts "
+                    f"and {stats['blocked_media']} media files")
+    print_info(message)
+    logger.info(message, extra={'phase': 'summary'})
+
+def print_rule_summary(card_rules):
+    """Print how many result cards each card rule matched and how many were skipped"""
+    if not card_rules.cards_seen:
+        return
+    print_highlight("\n=== Card Rules ===")
+    for name, kind, hits in card_rules.report():
+        message = f"{name} [{kind}]: matched {hits} cards"
+        print_info(message)
+        logger.info(f"Card rule {message}", extra={'phase': 'summary'})
+    message = f"{card_rules.cards_skipped} of {card_rules.cards_seen} result cards skipped by the rules"
+    print_info(message)
+    logger.info(message, extra={'phase': 'summary'})
+
 def show_help():
     """Display usage instructions for the tool"""
     print_highlight("\nLINKEDAUTO - KULLANIM KILAVUZU")
@@ -888,10 +2713,31 @@ def show_help():
     print(Fore.CYAN + "  python linkedin_connector.py" + Style.RESET_ALL + " - Varsayılan ayarlarla başlat")
     
     print_info("\nSEÇENEKLER:")
+    print(Fore.YELLOW + "  --config" + Style.RESET_ALL + "           LINKEDAUTO_* ayarlarını içeren .env dosyası (Varsayılan: çalışma klasöründeki .env)")
+    print(Fore.YELLOW + "  --non-interactive" + Style.RESET_ALL + "  Hiçbir şey sorma; tüm ayarları komut satırı, ortam değişkenleri veya config dosyasından al")
+    print(Fore.YELLOW + "  --login-method" + Style.RESET_ALL + "     Giriş yöntemi: console (e-posta/şifre) veya browser (tarayıcıda elle)")
+    print(Fore.YELLOW + "  --email" + Style.RESET_ALL + "            Konsol girişi için e-posta (şifre LINKEDAUTO_PASSWORD ile verilir)")
     print(Fore.YELLOW + "  --headless" + Style.RESET_ALL + "        Tarayıcıyı arka planda çalıştır")
     print(Fore.YELLOW + "  -k, --keywords" + Style.RESET_ALL + "     Arama anahtar kelimeleri (örn: 'yazılım mühendisi')")
-    print(Fore.YELLOW + "  -m, --max_requests" + Style.RESET_ALL + "  Gönderilecek maksimum bağlantı isteği sayısı")
+    print(Fore.YELLOW + "  --keywords-file" + Style.RESET_ALL + "    Satır başına bir arama terimi içeren dosya; hepsi aynı oturumda sırayla aranır")
+    print(Fore.YELLOW + "  --network" + Style.RESET_ALL + "          Yalnızca bu bağlantı derecelerini ara, virgülle ayrılmış (örn: '2,3')")
+    print(Fore.YELLOW + "  --geo-urn" + Style.RESET_ALL + "          Yalnızca bu LinkedIn konum kimliklerindeki kişileri ara")
+    print(Fore.YELLOW + "  --current-company" + Style.RESET_ALL + "  Yalnızca bu LinkedIn şirket kimliklerinde çalışan kişileri ara")
+    print(Fore.YELLOW + "  --rules" + Style.RESET_ALL + "            Arama sonuçlarını isim, başlık ve konuma göre süzen JSON kural dosyası")
+    print(Fore.YELLOW + "  --profiles-file" + Style.RESET_ALL + "    Arama yerine bu CSV/metin dosyasındaki profil adreslerine istek gönder")
+    print(Fore.YELLOW + "  --profiles-results" + Style.RESET_ALL + " Her profilin sonucunun yazıldığı CSV; yeniden başlatınca işlenenler atlanır")
+    print(Fore.YELLOW + "  -m, --max_requests" + Style.RESET_ALL + "  Gönderilecek maksimum bağlantı isteği sayısı (toplu aramada tüm terimler için toplam)")
     print(Fore.YELLOW + "  -n, --note" + Style.RESET_ALL + "           Bağlantı isteğine eklenecek özel not")
+    print(Fore.YELLOW + "  --session-dir" + Style.RESET_ALL + "      Oturumu bu klasörde sakla, sonraki çalıştırmalarda girişi atla (şifrelenmez)")
+    print(Fore.YELLOW + "  --session-file" + Style.RESET_ALL + "     Oturum çerezlerini bu dosyada şifreli sakla (anahtar LINKEDAUTO_SESSION_KEY ile verilir)")
+    print(Fore.YELLOW + "  --ledger" + Style.RESET_ALL + "           Davet gönderilen profillerin kaydı (Varsayılan: linkedin_ledger.db)")
+    print(Fore.YELLOW + "  --no-ledger" + Style.RESET_ALL + "        Davet kaydını kullanma")
+    print(Fore.YELLOW + "  --resume" + Style.RESET_ALL + "           Yarıda kalan aramaya kaldığı sayfadan devam et")
+    print(Fore.YELLOW + "  --block-resources" + Style.RESET_ALL + "  Resim, yazı tipi ve medya dosyalarını yükleme (daha hızlı sayfa, daha az trafik)")
+    print(Fore.YELLOW + "  --max-browser-rss-mb" + Style.RESET_ALL + " Chrome belleği bu değeri (MB) aşınca yeni bir sekmeye geç (yalnızca Linux)")
+    print(Fore.YELLOW + "  --selector-stats" + Style.RESET_ALL + "   Hangi seçicinin eşleştiğini kaydeden dosya (Varsayılan: linkedin_selectors.json)")
+    print(Fore.YELLOW + "  --profile" + Style.RESET_ALL + "          WebDriver komutlarının süre ve boyut dökümünü çıkar")
+    print(Fore.YELLOW + "  --log-format" + Style.RESET_ALL + "       Log dosyası biçimi: text veya json (satır başına bir JSON kaydı)")
     
     print_info("\nÖRNEKLER:")
     print("  " + Fore.CYAN + "python linkedin_connector.py --headless" + Style.RESET_ALL)
@@ -904,11 +2750,14 @@ def show_help():
 
 
 def main():
+    init()
+
     # Check for --help or -h flag before anything else
     if '--help' in sys.argv or '-h' in sys.argv:
         show_help()
     
     # ASCII Art Title
+    from pyfiglet import Figlet
     f = Figlet(font='slant')
     title = f.renderText('LinkedAuto')
     print_highlight(Fore.CYAN + title + Style.RESET_ALL)
@@ -928,43 +2777,82 @@ def main():
     print_highlight("-"*80 + "\n")
     # --- LEGAL DISCLAIMER END ---
 
-    # Quick Start Option
-    print_highlight("\n=== QUICK START OPTION ===")
-    print_info("1. Start with default settings (Recommended)")
-    print_info("2. Customize settings")
-    while True:
-        try:
-            quick_choice = input("\nYour choice (1/2, Default: 1): ").strip()
-            if not quick_choice:
-                quick_choice = '1'
-            if quick_choice not in ['1', '2']:
-                print_warning("Please enter either 1 or 2.")
-                continue
-            break
-        except KeyboardInterrupt:
-            print_warning("\nOperation cancelled by user.")
-            sys.exit(0)
-    
     parser = argparse.ArgumentParser(description="LinkedIn Connection Bot - Professional Networking Automation Tool", add_help=False)
     parser.add_argument(
         "--help", "-h",
         action="store_true",
         help="Show this help message and exit."
     )
+    parser.add_argument(
+        "--config",
+        type=str,
+        help="dotenv file with LINKEDAUTO_* settings (default: .env in the working directory, if present)."
+    )
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Never prompt; take every setting from the command line, environment or config file."
+    )
+    parser.add_argument(
+        "--login-method",
+        choices=["console", "browser"],
+        help="Log in with email and password ('console') or by hand in the browser ('browser')."
+    )
+    parser.add_argument(
+        "--email",
+        type=str,
+        help="LinkedIn email for console login; the password is read from LINKEDAUTO_PASSWORD."
+    )
     parser.add_argument(
         "--headless",
         action="store_true",
         help="Run browser in background (headless mode)."
     )
-    parser.add_argument(
+    keywords_group = parser.add_mutually_exclusive_group()
+    keywords_group.add_argument(
         "-k", "--keywords",
         type=str,
         help="Search keywords (e.g., 'cybersecurity expert')."
     )
+    keywords_group.add_argument(
+        "--keywords-file",
+        type=str,
+        help="File with one search term per line, all searched in the same browser session."
+    )
+    keywords_group.add_argument(
+        "--profiles-file",
+        type=str,
+        help="CSV or text file of profile URLs to send requests to, instead of searching."
+    )
+    parser.add_argument(
+        "--profiles-results",
+        type=str,
+        help="CSV the outcome of every profile is appended to (default: <profiles file>_results.csv)."
+    )
+    parser.add_argument(
+        "--network",
+        type=str,
+        help="Only search these connection degrees, comma separated (e.g. '2,3')."
+    )
+    parser.add_argument(
+        "--geo-urn",
+        type=str,
+        help="Only search people in these LinkedIn location ids, comma separated."
+    )
+    parser.add_argument(
+        "--current-company",
+        type=str,
+        help="Only search people currently at these LinkedIn company ids, comma separated."
+    )
+    parser.add_argument(
+        "--rules",
+        type=str,
+        help="JSON file with include/exclude rules on the name, headline and location of search results."
+    )
     parser.add_argument(
         "-m", "--max_requests",
         type=int,
-        help="Maximum number of connection requests to send."
+        help="Maximum number of connection requests to send (shared by all searches of a batch)."
     )
     parser.add_argument(
         "-n", "--note",
@@ -976,14 +2864,142 @@ def main():
         action="store_true",
         help="Send connection requests with notes (default: False)."
     )
-    parser.set_defaults(headless=False, use_notes=False)
+    parser.add_argument(
+        "--session-dir",
+        type=str,
+        help="Keep the browser session in this directory and reuse it on later runs (not encrypted)."
+    )
+    parser.add_argument(
+        "--session-file",
+        type=str,
+        help="Keep the session cookies in this file, encrypted with LINKEDAUTO_SESSION_KEY, and reuse them on later runs."
+    )
+    parser.add_argument(
+        "--ledger",
+        type=str,
+        default="linkedin_ledger.db",
+        help="SQLite file recording contacted profiles across runs (default: linkedin_ledger.db)."
+    )
+    parser.add_argument(
+        "--no-ledger",
+        action="store_true",
+        help="Do not read or write the invitation ledger."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted search after its last fully processed page."
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default="linkedin_checkpoints",
+        help="Directory for search progress checkpoints (default: linkedin_checkpoints)."
+    )
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Do not load images, fonts and media, for faster page loads and less traffic."
+    )
+    parser.add_argument(
+        "--max-browser-rss-mb",
+        type=int,
+        help="Move to a fresh browser tab when Chrome's memory passes this many MB (Linux only)."
+    )
+    parser.add_argument(
+        "--selector-stats",
+        type=str,
+        default="linkedin_selectors.json",
+        help="JSON file recording which selector candidates matched (default: linkedin_selectors.json)."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record every WebDriver command by phase and print a summary at exit."
+    )
+    parser.add_argument(
+        "--profile-report",
+        type=str,
+        default="linkedin_profile.json",
+        help="JSON file for the --profile report (default: linkedin_profile.json)."
+    )
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        default="linkedin_bot.log",
+        help="Log file, rotated by size (default: linkedin_bot.log)."
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["text", "json"],
+        default="text",
+        help="Log file format; 'json' writes one JSON object per line with structured fields."
+    )
+    parser.add_argument(
+        "--log-max-mb",
+        type=int,
+        default=5,
+        help="Rotate the log file at this size in MB, keeping 5 old files (default: 5)."
+    )
+    parser.set_defaults(headless=False, use_notes=False, password=None, session_key=None)
     
     args = parser.parse_args()
+    setup_logging(log_file=args.log_file, log_format=args.log_format, max_bytes=args.log_max_mb * 1024 * 1024)
     
     # Show help if requested
     if args.help:
         show_help()
 
+    # Options not given on the command line come from the environment or the config file
+    try:
+        apply_config(args, load_config(args.config))
+        search_filters = parse_search_filters(args.network, args.geo_urn, args.current_company)
+        card_rules = CardRules(args.rules) if args.rules else None
+        cookie_jar = None
+        if args.session_file:
+            # The key never comes from the command line, where other users could see it
+            if not args.session_key and not args.non_interactive:
+                args.session_key = getpass.getpass("Enter the key of the session file: ")
+            cookie_jar = EncryptedCookieJar(args.session_file, args.session_key)
+    except (OSError, ValueError) as e:
+        print_error(f"Configuration error: {e}")
+        return
+
+    # Quick Start Option, skipped for unattended runs
+    quick_choice = None
+    if not args.non_interactive:
+        print_highlight("\n=== QUICK START OPTION ===")
+        print_info("1. Start with default settings (Recommended)")
+        print_info("2. Customize settings")
+        while True:
+            try:
+                quick_choice = input("\nYour choice (1/2, Default: 1): ").strip()
+                if not quick_choice:
+                    quick_choice = '1'
+                if quick_choice not in ['1', '2']:
+                    print_warning("Please enter either 1 or 2.")
+                    continue
+                break
+            except KeyboardInterrupt:
+                print_warning("\nOperation cancelled by user.")
+                sys.exit(0)
+
+    keyword_batch = None
+    if args.keywords_file:
+        try:
+            keyword_batch = read_keywords_file(args.keywords_file)
+        except OSError as e:
+            print_error(f"Could not read keywords file: {e}")
+            return
+        if not keyword_batch:
+            print_error(f"No search terms found in {args.keywords_file}.")
+            return
+    if args.profiles_file and not os.path.isfile(args.profiles_file):
+        print_error(f"Profiles file not found: {args.profiles_file}")
+        return
+    # Search terms are not needed when working through a list of profiles
+    no_search = bool(keyword_batch or args.profiles_file)
+
     # Default values
     default_keywords = "python developer"
     default_max_requests = 30
@@ -992,29 +3008,34 @@ def main():
     # Use default values if quick start is selected
     if quick_choice in ['', '1']:
         print_info("\nStarting with default settings...")
-        if not args.keywords:
+        if not args.keywords and not no_search:
             args.keywords = default_keywords
-        if not args.max_requests:
+        if args.max_requests is None:
             args.max_requests = default_max_requests
         if not args.note:
             args.note = default_note
         
-        # Show browser by default
-        effective_headless_mode = False
-        print_info(f"Search Term: {args.keywords}")
+        # Show browser unless --headless or LINKEDAUTO_HEADLESS asks otherwise
+        effective_headless_mode = args.headless
+        if keyword_batch:
+            print_info(f"Search Terms: {len(keyword_batch)} from {args.keywords_file}")
+        elif args.profiles_file:
+            print_info(f"Profiles: {args.profiles_file}")
+        else:
+            print_info(f"Search Term: {args.keywords}")
         print_info(f"Maximum Requests: {args.max_requests}")
         if args.use_notes and args.note:
             print_info(f"Connection Note: {args.note[:50]}...")
         else:
             print_info("Connection Note: Not using notes (default)")
-        print_info("Browser will run in visible mode.")
+        print_info(f"Browser will run in {'headless' if effective_headless_mode else 'visible'} mode.")
         print_success("\nStarting process...\n")
     else:
         # Normal flow
         effective_headless_mode = args.headless
         
         # Ask about headless mode if not set via command line
-        if not args.headless and '--headless' not in sys.argv:
+        if not args.headless and '--headless' not in sys.argv and not args.non_interactive:
             while True:
                 try:
                     headless_choice = input("\nDo you want to run the browser in background (headless mode)? "
@@ -1031,14 +3052,18 @@ def main():
                     print_warning("\nOperation cancelled by user.")
                     sys.exit(0)
 
+    if args.non_interactive:
+        search_term = None if no_search else args.keywords or default_keywords
+        max_requests = args.max_requests if args.max_requests is not None else default_max_requests
+        connection_note = args.note or default_note
     # Only ask for user input in custom mode
-    if quick_choice not in ['', '1']:
+    elif quick_choice not in ['', '1']:
         print_highlight("\n=== LinkedIn Connection Bot ===")
         print_info("This script searches LinkedIn and")
         print_info("sends connection requests to found profiles.\n")
         
         # If keywords not provided via CLI, ask for "Enter" prompt
-        fully_interactive_setup = not (args.keywords or args.max_requests is not None or args.note)
+        fully_interactive_setup = not (args.keywords or no_search or args.max_requests is not None or args.note)
         if fully_interactive_setup:
             while True:
                 try:
@@ -1052,7 +3077,7 @@ def main():
                     sys.exit(0)
 
         try:
-            search_term = args.keywords or get_user_input(
+            search_term = None if no_search else args.keywords or get_user_input(
                 "\nEnter your search term",
                 default_keywords
             )
@@ -1071,24 +3096,58 @@ def main():
     else:
         # Set values for quick start
         search_term = args.keywords or default_keywords
-        max_requests = args.max_requests or default_max_requests
+        max_requests = args.max_requests
         connection_note = args.note or default_note
 
     connector = None
+    profiler = DriverProfiler() if args.profile else None
     try:
         # Create connector without initializing browser
-        connector = LinkedInConnector(headless=effective_headless_mode, connection_note=connection_note)
-        
-        # Setup login method and initialize browser
-        connector.setup_login()
+        connector = LinkedInConnector(headless=effective_headless_mode, connection_note=connection_note,
+                                      use_notes=args.use_notes,
+                                      session_dir=args.session_dir,
+                                      ledger_path=None if args.no_ledger else args.ledger,
+                                      checkpoint_dir=args.checkpoint_dir,
+                                      profiler=profiler,
+                                      selector_stats_path=args.selector_stats,
+                                      block_resources=args.block_resources,
+                                      max_browser_rss_mb=args.max_browser_rss_mb,
+                                      search_filters=search_filters,
+                                      card_rules=card_rules,
+                                      cookie_jar=cookie_jar)
         
-        if not connector.login():
-            print_error("Login failed. Terminating program.")
-            return
-
-        print_highlight(f"\n=== Sending connection requests for '{search_term}' (Max: {max_requests}) ===")
-        
-        request_count = connector.send_connection_requests_from_search(search_term, max_requests)
+        # Skip the login flow entirely when a saved session is still valid
+        if not connector.restore_session():
+            # Setup login method and initialize browser
+            connector.setup_login(method=args.login_method, email=args.email, password=args.password,
+                                  interactive=not args.non_interactive)
+            
+            if not connector.login():
+                print_error("Login failed. Terminating program.")
+                return
+
+        if keyword_batch:
+            # One browser session and one request budget for the whole batch
+            print_highlight(f"\n=== Sending connection requests for {len(keyword_batch)} search terms (Max: {max_requests}) ===")
+            results = connector.send_connection_requests_for_keywords(keyword_batch, max_requests, resume=args.resume)
+            print_keyword_summary(results)
+            request_count = sum(result['sent'] for result in results)
+        elif args.profiles_file:
+            results = ProfileResults(args.profiles_results or f"{os.path.splitext(args.profiles_file)[0]}_results.csv")
+            done_before = results.load()
+            if done_before:
+                print_info(f"{done_before} profiles were already handled in earlier runs and will be skipped.")
+            print_highlight(f"\n=== Sending connection requests to profiles from {args.profiles_file} (Max: {max_requests}) ===")
+            try:
+                counts = connector.send_connection_requests_from_profiles(iter_profile_urls(args.profiles_file),
+                                                                          max_requests, results)
+            finally:
+                results.close()
+            print_profile_summary(counts, results.path)
+            request_count = counts.get('sent', 0)
+        else:
+            print_highlight(f"\n=== Sending connection requests for '{search_term}' (Max: {max_requests}) ===")
+            request_count = connector.send_connection_requests_from_search(search_term, max_requests, resume=args.resume)
 
         print_success(f"\nTotal {request_count} connection requests sent.")
         if connector._limit_reported:
@@ -1105,8 +3164,18 @@ def main():
     except Exception as e:
         print_error(f"Unexpected error in main program: {str(e)}")
     finally:
-        if connector and connector.driver:
+        if connector:
             connector.close()
+            print_resource_summary(connector)
+            if card_rules:
+                print_rule_summary(card_rules)
+        if profiler:
+            profiler.print_summary()
+            try:
+                profiler.write_report(args.profile_report)
+                print_info(f"Profile report written to {args.profile_report}")
+            except OSError as e:
+                print_error(f"Could not write profile report: {e}")
         print_info("Program terminated.")
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+import linkedAuto
+from tests.fake_webdriver import FakeWebDriver, FakeElement, NoSleepTime
+
+# Substrings of the registry's selector candidates, mapped to how the fake DOM answers them
+MODAL_ROUTES = {
+    "artdeco-modal--layer-default": lambda scope: scope.find_all(cls="artdeco-modal--layer-default"),
+    "without a note": lambda scope: scope.find_all(tag="button", text="send_without_note"),
+    "Add a note": lambda scope: scope.find_all(tag="button", text="add_note"),
+    "custom-message": lambda scope: scope.find_all(tag="textarea"),
+    "artdeco-modal__actionbar": lambda scope: scope.find_all(tag="button", text="send"),
+    "artdeco-modal__content": lambda scope: scope.find_all(cls="artdeco-modal__content"),
+    "artdeco-toast-item--error": lambda scope: scope.find_all(cls="artdeco-toast-item--error"),
+    "artdeco-modal__dismiss": lambda scope: scope.find_all(tag="button", text="dismiss"),
+    "li.active": lambda scope: scope.find_all(tag="button", text="next"),
+}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Turn linkedAuto's human-like pauses into no-ops"""
+    monkeypatch.setattr(linkedAuto, "time", NoSleepTime())
+
+
+@pytest.fixture
+def driver():
+    """Fake driver on a search results page whose modal, popup and pagination selectors resolve"""
+    fake = FakeWebDriver(url="https://www.linkedin.com/search/results/people/?keywords=python")
+    for pattern, finder in MODAL_ROUTES.items():
+        fake.route(pattern, finder)
+    return fake
+
+
+@pytest.fixture
+def make_connector():
+    """Return a factory building a connector on a fake driver with short waits and a clean command count"""
+    def factory(driver, **kwargs):
+        connector = linkedAuto.LinkedInConnector(driver=driver, **kwargs)
+        # Keep misses fast; every lookup still polls at least once
+        connector.short_wait = WebDriverWait(driver, 0.05, poll_frequency=0.01)
+        connector.wait = WebDriverWait(driver, 0.05, poll_frequency=0.01)
+        connector.SCROLL_SETTLE_TIMEOUT = 0.05
+        driver.reset_commands()
+        return connector
+    return factory
+
+
+def add_modal(driver, *buttons, hidden_note=False):
+    """Open a connection modal with the given buttons and return it
+
+    Buttons are named after their registry targets ("send_without_note", "add_note",
+    "note_field", "send"). Clicking a send button closes the modal and clicking
+    "add_note" shows the note field, which starts hidden when hidden_note is set.
+    """
+    modal = driver.dom.append(FakeElement("div", attrs={"class": "artdeco-modal artdeco-modal--layer-default"}))
+    note_field = None
+    if "note_field" in buttons:
+        note_field = modal.append(FakeElement("textarea", attrs={"id": "custom-message"}, displayed=not hidden_note))
+
+    def close(drv, element):
+        modal.remove()
+
+    def reveal(drv, element):
+        if note_field is not None:
+            note_field.displayed = True
+
+    for name in buttons:
+        if name in ("send_without_note", "send"):
+            modal.append(FakeElement("button", text=name, on_click=close))
+        elif name == "add_note":
+            modal.append(FakeElement("button", text=name, on_click=reveal))
+    modal.append(FakeElement("button", text="dismiss", on_click=close))
+    return modal
+
+
+def script_calls(driver, marker):
+    """Count the execute_script calls whose source contains marker"""
+    return sum(1 for command, params in driver.command_log
+               if command == "w3cExecuteScript" and marker in params["script"])
@@ -0,0 +1,453 @@
+"""In-memory stand-in for Selenium's Chrome WebDriver
+
+Lets LinkedInConnector's control flow (modal fallbacks, limit detection, pagination,
+error recovery) run without a browser, and counts every WebDriver command it issues so
+a test or benchmark can assert how many round trips an operation costs.
+
+The page is a small tree of FakeElement nodes. Selectors are not evaluated; instead,
+routes map a selector (or any substring of it) to a function that picks elements out of
+the tree, and script handlers stand in for execute_script calls. Lookups through
+LinkedInConnector's SelectorRegistry (single and first-of-several lookups) are answered
+from the routes as well, trying each candidate selector in turn:
+
+    driver = FakeWebDriver(url="https://www.linkedin.com/search/results/people/?keywords=x")
+    modal = driver.dom.append(FakeElement("div", attrs={"class": "artdeco-modal artdeco-modal--layer-default"}))
+    send = modal.append(FakeElement("button", text="Send without a note",
+                                    on_click=lambda driver, element: modal.remove()))
+    driver.route("artdeco-modal--layer-default", lambda scope: scope.find_all(cls="artdeco-modal--layer-default"))
+    driver.route("without a note", lambda scope: [send])
+    driver.on_script("scrollHeight", lambda driver, *args: {"cards": 10, "actionable": 3, "height": 2000})
+
+    connector = LinkedInConnector(driver=driver)
+    connector.short_wait = WebDriverWait(driver, 0.1)   # keep misses fast
+    assert connector._handle_connection_modal()
+    print(driver.commands)                              # Counter of WebDriver commands
+
+Every public method goes through execute(command, params) using Selenium's command
+names, exactly like the real driver, so a profiler that wraps execute() sees the same
+traffic from both.
+"""
+
+import itertools
+import time
+from collections import Counter
+from html import escape
+
+from selenium.common.exceptions import (NoSuchElementException, ElementClickInterceptedException,
+                                        ElementNotInteractableException, NoSuchWindowException)
+from selenium.webdriver.remote.command import Command
+
+# Selenium answers is_displayed() with an injected atom script; the fake uses a named command
+IS_ELEMENT_DISPLAYED = "isElementDisplayed"
+
+
+class NoSleepTime:
+    """Stand-in for the time module inside linkedAuto whose sleep() returns immediately"""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+
+class FakeElement:
+    """One node of the in-memory DOM"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, tag, text="", attrs=None, children=None, displayed=True, enabled=True,
+                 on_click=None, intercept_click=False):
+        """Create a node
+
+        Args:
+            tag (str): Tag name
+            text (str): Text directly inside the node
+            attrs (dict, optional): HTML attributes; "class" is a space separated list
+            children (list, optional): Child FakeElements
+            displayed (bool): Whether the node is rendered
+            enabled (bool): Whether the node accepts clicks
+            on_click (callable, optional): Called as on_click(driver, element) to script
+                state changes such as opening a modal or navigating
+            intercept_click (bool): Raise ElementClickInterceptedException on click
+        """
+        self.id = f"fake-{next(self._ids)}"
+        self.tag_name = tag
+        self.own_text = text
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = None
+        self.displayed = displayed
+        self.enabled = enabled
+        self.on_click = on_click
+        self.intercept_click = intercept_click
+        self.value = ""
+        self.driver = None
+        for child in children or []:
+            self.append(child)
+
+    # --- tree manipulation, free of WebDriver commands ---
+
+    def append(self, child):
+        """Attach child as the last child and return it"""
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def remove(self):
+        """Detach this node from the tree"""
+        if self.parent:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    def iter(self):
+        """Yield this node and all its descendants in document order"""
+        yield self
+        for child in self.children:
+            yield from child.iter()
+
+    def find_all(self, tag=None, text=None, cls=None, predicate=None, **attrs):
+        """Return descendants matching every given criterion
+
+        Args:
+            tag (str, optional): Tag name
+            text (str, optional): Exact own text
+            cls (str, optional): Class token the node must carry
+            predicate (callable, optional): Extra test taking the node
+            **attrs: Exact attribute values (use aria_label for aria-label)
+        """
+        matches = []
+        for node in itertools.islice(self.iter(), 1, None):
+            if tag and node.tag_name != tag:
+                continue
+            if text is not None and node.own_text != text:
+                continue
+            if cls and cls not in node.attrs.get("class", "").split():
+                continue
+            if any(node.attrs.get(name.replace("_", "-")) != value for name, value in attrs.items()):
+                continue
+            if predicate and not predicate(node):
+                continue
+            matches.append(node)
+        return matches
+
+    @property
+    def attached(self):
+        node = self
+        while node.parent:
+            node = node.parent
+        return isinstance(node, FakeDocument)
+
+    @property
+    def visible(self):
+        node = self
+        while node:
+            if not node.displayed:
+                return False
+            node = node.parent
+        return self.attached
+
+    @property
+    def rendered_text(self):
+        if not self.visible:
+            return ""
+        parts = [self.own_text] + [child.rendered_text for child in self.children]
+        return "\n".join(part for part in parts if part)
+
+    def outer_html(self):
+        attributes = "".join(f' {name}="{escape(str(value))}"' for name, value in self.attrs.items())
+        inner = escape(self.own_text) + "".join(child.outer_html() for child in self.children)
+        return f"<{self.tag_name}{attributes}>{inner}</{self.tag_name}>"
+
+    # --- WebElement API, each call is one counted command ---
+
+    def _execute(self, command, **params):
+        return self.driver.execute(command, dict(params, id=self.id))["value"]
+
+    @property
+    def text(self):
+        return self._execute(Command.GET_ELEMENT_TEXT)
+
+    def is_displayed(self):
+        return self._execute(IS_ELEMENT_DISPLAYED)
+
+    def is_enabled(self):
+        return self._execute(Command.IS_ELEMENT_ENABLED)
+
+    def get_attribute(self, name):
+        return self._execute(Command.GET_ELEMENT_ATTRIBUTE, name=name)
+
+    def click(self):
+        self._execute(Command.CLICK_ELEMENT)
+
+    def clear(self):
+        self._execute(Command.CLEAR_ELEMENT)
+
+    def send_keys(self, *value):
+        self._execute(Command.SEND_KEYS_TO_ELEMENT, text="".join(str(part) for part in value))
+
+    def find_element(self, by, value):
+        return self.driver._first(self._execute(Command.FIND_CHILD_ELEMENTS, using=by, value=value), by, value)
+
+    def find_elements(self, by, value):
+        return self._execute(Command.FIND_CHILD_ELEMENTS, using=by, value=value)
+
+    def __repr__(self):
+        return f"<FakeElement {self.tag_name} {self.id} {self.own_text[:30]!r}>"
+
+
+class FakeDocument(FakeElement):
+    """Root of the in-memory DOM"""
+
+    def __init__(self, lang="en"):
+        super().__init__("html", attrs={"lang": lang})
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+
+    def new_window(self, type_hint=None):
+        self._driver.execute(Command.NEW_WINDOW, {"type": type_hint})
+
+
+class FakeWebDriver:
+    """Selenium-compatible driver whose page lives in memory; see the module docstring"""
+
+    def __init__(self, url="about:blank", lang="en"):
+        self.dom = FakeDocument(lang)
+        self.current_window_handle = "window-1"
+        self.window_handles = ["window-1"]
+        self.commands = Counter()
+        self.command_log = []
+        self.service = None
+        self.switch_to = _FakeSwitchTo(self)
+        self._url = url
+        self._routes = []
+        self._scripts = []
+        self._navigation_handler = None
+        self._window_ids = itertools.count(2)
+        self._elements = {}
+        self.cookies = {}
+        self.quit_called = False
+
+    # --- scripting the fake ---
+
+    def route(self, pattern, finder):
+        """Resolve selectors containing pattern with finder(scope) -> list of FakeElements"""
+        self._routes.append((pattern, finder))
+
+    def on_script(self, pattern, handler):
+        """Answer execute_script calls whose source contains pattern with handler(driver, *args)"""
+        self._scripts.append((pattern, handler))
+
+    def on_navigate(self, handler):
+        """Call handler(driver, url) on every get(), e.g. to load a different DOM"""
+        self._navigation_handler = handler
+
+    def load(self, *children, lang=None):
+        """Replace the whole page with the given top-level elements"""
+        self.dom = FakeDocument(lang or self.dom.attrs.get("lang", "en"))
+        for child in children:
+            self.dom.append(child)
+        return self.dom
+
+    @property
+    def command_count(self):
+        return sum(self.commands.values())
+
+    def reset_commands(self):
+        """Forget all counted commands"""
+        self.commands.clear()
+        self.command_log.clear()
+
+    # --- the single entry point, as in selenium's RemoteWebDriver ---
+
+    def execute(self, driver_command, params=None):
+        params = params or {}
+        self.commands[driver_command] += 1
+        self.command_log.append((driver_command, params))
+        handler = getattr(self, f"_cmd_{driver_command}", None)
+        if handler is None:
+            return {"value": None}
+        return {"value": handler(**params)}
+
+    def _element(self, element_id):
+        return self._elements[element_id]
+
+    def _bind(self, elements):
+        for element in elements:
+            element.driver = self
+            self._elements[element.id] = element
+        return elements
+
+    def _resolve(self, scope, by, value):
+        if by == "id":
+            return self._bind(scope.find_all(id=value))
+        for pattern, finder in self._routes:
+            if pattern in value:
+                found = finder(scope) if callable(finder) else list(finder)
+                return self._bind([element for element in found if element.attached])
+        return []
+
+    def _first(self, elements, by, value):
+        if not elements:
+            raise NoSuchElementException(f"Fake DOM has no match for {by}={value}")
+        return elements[0]
+
+    def _cmd_get(self, url):
+        self._url = url
+        if self._navigation_handler:
+            self._navigation_handler(self, url)
+
+    def _cmd_getCurrentUrl(self):
+        return self._url
+
+    def _cmd_getTitle(self):
+        return ""
+
+    def _cmd_getPageSource(self):
+        return self.dom.outer_html()
+
+    def _cmd_findElements(self, using, value):
+        return self._resolve(self.dom, using, value)
+
+    def _cmd_findChildElements(self, id, using, value):
+        return self._resolve(self._element(id), using, value)
+
+    def _cmd_w3cExecuteScript(self, script, args):
+        for pattern, handler in self._scripts:
+            if pattern in script:
+                result = handler(self, *args)
+                if isinstance(result, list):
+                    self._bind([item for item in result if isinstance(item, FakeElement)])
+                    for item in result:
+                        if isinstance(item, dict):
+                            self._bind([v for v in item.values() if isinstance(v, FakeElement)])
+                return result
+        if "selectorCandidates" in script and "watches" in script:
+            return self._lookup_first(*args)
+        if "selectorCandidates" in script:
+            return self._lookup_candidates(*args)
+        return None
+
+    def _lookup_candidates(self, candidates, scope=None, clickable=True):
+        # Answers SelectorRegistry lookups through the routes, candidate by candidate
+        for index, (kind, query) in enumerate(candidates):
+            for element in self._resolve(scope or self.dom, kind, query):
+                if not clickable or (element.visible and element.enabled):
+                    return [index, element]
+        return None
+
+    def _lookup_first(self, watches, scope_candidates=None):
+        # Answers SelectorRegistry.find_first the same way, watch by watch in priority order
+        scope = None
+        if scope_candidates:
+            scope_hit = self._lookup_candidates(scope_candidates, None, False)
+            scope = scope_hit[1] if scope_hit else None
+        for index, (candidates, scoped, clickable) in enumerate(watches):
+            if scoped and scope_candidates and scope is None:
+                continue
+            hit = self._lookup_candidates(candidates, scope if scoped else None, clickable)
+            if hit:
+                return [index, hit[0], hit[1], scope]
+        return None
+
+    def _cmd_getElementText(self, id):
+        return self._element(id).rendered_text
+
+    def _cmd_isElementDisplayed(self, id):
+        return self._element(id).visible
+
+    def _cmd_isElementEnabled(self, id):
+        return self._element(id).enabled
+
+    def _cmd_getElementAttribute(self, id, name):
+        element = self._element(id)
+        return element.value if name == "value" else element.attrs.get(name)
+
+    def _cmd_clickElement(self, id):
+        element = self._element(id)
+        if element.intercept_click:
+            raise ElementClickInterceptedException(f"Click on {element!r} intercepted")
+        if not element.visible or not element.enabled:
+            raise ElementNotInteractableException(f"{element!r} is not interactable")
+        if element.on_click:
+            element.on_click(self, element)
+
+    def _cmd_clearElement(self, id):
+        self._element(id).value = ""
+
+    def _cmd_sendKeysToElement(self, id, text):
+        self._element(id).value += text
+
+    def _cmd_newWindow(self, type):
+        handle = f"window-{next(self._window_ids)}"
+        self.window_handles.append(handle)
+        self.current_window_handle = handle
+        return {"handle": handle, "type": type}
+
+    def _cmd_switchToWindow(self, handle):
+        if handle not in self.window_handles:
+            raise NoSuchWindowException(handle)
+        self.current_window_handle = handle
+
+    def _cmd_close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def _cmd_addCookie(self, cookie):
+        self.cookies[cookie["name"]] = dict(cookie)
+
+    def _cmd_getCookies(self):
+        return [dict(cookie) for cookie in self.cookies.values()]
+
+    def _cmd_quit(self):
+        self.quit_called = True
+
+    # --- WebDriver API ---
+
+    @property
+    def current_url(self):
+        return self.execute(Command.GET_CURRENT_URL)["value"]
+
+    @property
+    def title(self):
+        return self.execute(Command.GET_TITLE)["value"]
+
+    @property
+    def page_source(self):
+        return self.execute(Command.GET_PAGE_SOURCE)["value"]
+
+    def get(self, url):
+        self.execute(Command.GET, {"url": url})
+
+    def find_element(self, by, value):
+        return self._first(self.find_elements(by, value), by, value)
+
+    def find_elements(self, by, value):
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"]
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})["value"]
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def add_cookie(self, cookie_dict):
+        self.execute(Command.ADD_COOKIE, {"cookie": cookie_dict})
+
+    def get_cookies(self):
+        return self.execute(Command.GET_ALL_COOKIES)["value"]
+
+    def set_window_size(self, width, height):
+        self.execute(Command.SET_WINDOW_RECT, {"width": width, "height": height})
+
+    def close(self):
+        self.execute(Command.CLOSE)
+
+    def quit(self):
+        self.execute(Command.QUIT)
@@ -0,0 +1,27 @@
+"""Search checkpoints for --resume"""
+
+import os
+
+from linkedAuto import SearchCheckpoint
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = SearchCheckpoint(str(tmp_path), "Python Developer", "me@example.com")
+    assert not checkpoint.load()
+    checkpoint.last_page = 3
+    checkpoint.handled = {"urn:li:1", "urn:li:2"}
+    checkpoint.requests_sent = 7
+    checkpoint.save()
+    assert not os.path.exists(f"{checkpoint.path}.tmp")
+
+    # Keywords are matched case-insensitively
+    restored = SearchCheckpoint(str(tmp_path), "python developer ", "me@example.com")
+    assert restored.load()
+    assert (restored.last_page, restored.handled, restored.requests_sent) == (3, {"urn:li:1", "urn:li:2"}, 7)
+
+
+def test_checkpoint_is_per_account_and_filters(tmp_path):
+    base = SearchCheckpoint(str(tmp_path), "python", "a@example.com")
+    assert base.path != SearchCheckpoint(str(tmp_path), "python", "b@example.com").path
+    assert base.path != SearchCheckpoint(str(tmp_path), "python", "a@example.com", {"network": ["S"]}).path
+    assert base.path == SearchCheckpoint(str(tmp_path), "python", "a@example.com", {}).path
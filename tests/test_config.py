@@ -0,0 +1,100 @@
+"""Config file handling and unattended login"""
+
+import argparse
+
+import pytest
+
+import linkedAuto
+
+
+def _args(**overrides):
+    values = {dest: None for dest, _ in linkedAuto.CONFIG_OPTIONS.values()}
+    values.update(headless=False, use_notes=False, block_resources=False, non_interactive=False)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_config_fills_only_unset_options():
+    args = _args(max_requests=0, keywords="go developer")
+    linkedAuto.apply_config(args, {"LINKEDAUTO_MAX_REQUESTS": "30", "LINKEDAUTO_HEADLESS": "yes",
+                                   "LINKEDAUTO_KEYWORDS_FILE": "keywords.txt", "LINKEDAUTO_EMAIL": "a@example.com"})
+    # 0 on the command line is a value, not "unset"
+    assert args.max_requests == 0
+    assert args.headless is True
+    assert args.email == "a@example.com"
+    # A target given on the command line replaces every configured target
+    assert args.keywords_file is None
+
+
+def test_config_rejects_bad_values():
+    with pytest.raises(ValueError, match="LINKEDAUTO_MAX_REQUESTS"):
+        linkedAuto.apply_config(_args(), {"LINKEDAUTO_MAX_REQUESTS": "many"})
+
+
+def test_environment_wins_over_config_file(tmp_path, monkeypatch):
+    path = tmp_path / "linkedauto.env"
+    path.write_text("LINKEDAUTO_KEYWORDS=from file\nLINKEDAUTO_MAX_REQUESTS=5\n", encoding="utf-8")
+    monkeypatch.setenv("LINKEDAUTO_KEYWORDS", "from env")
+    config = linkedAuto.load_config(str(path))
+    assert config["LINKEDAUTO_KEYWORDS"] == "from env"
+    assert config["LINKEDAUTO_MAX_REQUESTS"] == "5"
+    with pytest.raises(OSError):
+        linkedAuto.load_config(str(tmp_path / "missing.env"))
+
+
+def test_non_interactive_login_without_credentials_raises(driver):
+    connector = linkedAuto.LinkedInConnector(driver=driver)
+    with pytest.raises(ValueError, match="LINKEDAUTO_EMAIL"):
+        connector.setup_login(interactive=False)
+    with pytest.raises(ValueError, match="LINKEDAUTO_PASSWORD"):
+        connector.setup_login(email="a@example.com", interactive=False)
+
+
+def test_non_interactive_browser_login_must_be_explicit(driver):
+    connector = linkedAuto.LinkedInConnector(driver=driver)
+    connector.setup_login(method="browser", interactive=False)
+    assert driver.current_url.endswith("/login")
+
+
+class _RecordingConnector:
+    """Stands in for LinkedInConnector in main() and records what it was asked to do"""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.searches = []
+        self._limit_reported = False
+        self.created.append(self)
+
+    def restore_session(self):
+        return True
+
+    def send_connection_requests_from_search(self, keywords, max_requests, resume=False):
+        self.searches.append((keywords, max_requests))
+        return 0
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("argv, environment, expected", [
+    (["-m", "0"], {}, (0, False)),
+    (["--headless"], {}, (30, True)),
+    ([], {"LINKEDAUTO_HEADLESS": "yes", "LINKEDAUTO_MAX_REQUESTS": "0"}, (0, True)),
+])
+def test_quick_start_keeps_cli_and_config_values(tmp_path, monkeypatch, argv, environment, expected):
+    monkeypatch.chdir(tmp_path)
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr("sys.argv", ["linkedAuto.py", *argv])
+    monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+    monkeypatch.setattr(linkedAuto, "setup_logging", lambda **kwargs: None)
+    monkeypatch.setattr(linkedAuto, "print_resource_summary", lambda connector: None)
+    monkeypatch.setattr(linkedAuto, "LinkedInConnector", _RecordingConnector)
+    _RecordingConnector.created.clear()
+
+    linkedAuto.main()
+
+    connector, = _RecordingConnector.created
+    assert (connector.searches[0][1], connector.kwargs["headless"]) == expected
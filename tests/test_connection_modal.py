@@ -0,0 +1,86 @@
+"""WebDriver round trips of the connection modal flow"""
+
+from tests.conftest import add_modal, script_calls
+from tests.fake_webdriver import FakeElement
+
+LIMIT_TEXT = "You've reached the weekly invitation limit. Please try again next week."
+
+
+def test_send_without_note_is_one_lookup_and_one_click(driver, make_connector):
+    modal = add_modal(driver, "send_without_note", "add_note", "send")
+    connector = make_connector(driver)
+
+    assert connector._handle_connection_modal()
+    assert not modal.attached
+    assert driver.commands == {"w3cExecuteScript": 1, "clickElement": 1}
+
+
+def test_note_is_typed_after_add_note(driver, make_connector):
+    modal = add_modal(driver, "send_without_note", "add_note", "note_field", "send", hidden_note=True)
+    connector = make_connector(driver, use_notes=True, connection_note="Hello, let's connect")
+
+    assert connector._handle_connection_modal()
+    assert modal.find_all(tag="textarea")[0].value == "Hello, let's connect"
+    assert not modal.attached
+    # One wait for the outcome, then the note field and the send button
+    assert driver.commands["w3cExecuteScript"] == 3
+    assert driver.commands["clickElement"] == 2
+
+
+def test_notes_mode_falls_back_to_send_without_note(driver, make_connector):
+    modal = add_modal(driver, "send_without_note")
+    connector = make_connector(driver, use_notes=True, connection_note="Hello")
+
+    assert connector._handle_connection_modal()
+    assert not modal.attached
+    assert driver.commands == {"w3cExecuteScript": 1, "clickElement": 1}
+
+
+def test_limit_popup_ends_the_wait_and_is_reported(driver, make_connector):
+    driver.dom.append(FakeElement("div", text=LIMIT_TEXT, attrs={"class": "artdeco-modal__content"}))
+    connector = make_connector(driver)
+
+    assert not connector._handle_connection_modal()
+    assert connector._limit_reported
+    # A single outcome wait, without first waiting out the modal lookup
+    assert script_calls(driver, "watches") == 1
+
+
+def test_limit_popup_wins_over_modal_buttons(driver, make_connector):
+    modal = add_modal(driver, "send_without_note")
+    driver.dom.append(FakeElement("div", text=LIMIT_TEXT, attrs={"class": "artdeco-modal__content"}))
+    connector = make_connector(driver)
+
+    assert not connector._handle_connection_modal()
+    assert connector._limit_reported
+    # The send button was never clicked, so the modal is still open
+    assert modal.attached
+
+
+def test_unconfirmed_limit_text_does_not_stop_the_modal(driver, make_connector):
+    modal = add_modal(driver, "send_without_note")
+    modal.append(FakeElement("div", text="Personalized invitations have a monthly limit on free accounts.",
+                             attrs={"class": "artdeco-modal__content"}))
+    connector = make_connector(driver)
+
+    assert connector._handle_connection_modal()
+    assert not connector._limit_reported
+    assert not modal.attached
+
+
+def test_error_toast_closes_the_modal(driver, make_connector):
+    modal = add_modal(driver, "send")
+    driver.dom.append(FakeElement("div", text="Something went wrong", attrs={"class": "artdeco-toast-item--error"}))
+    connector = make_connector(driver)
+
+    assert not connector._handle_connection_modal()
+    assert not modal.attached
+    assert not connector._limit_reported
+
+
+def test_missing_modal_times_out_and_records_misses(driver, make_connector):
+    connector = make_connector(driver)
+
+    assert not connector._handle_connection_modal()
+    assert "clickElement" not in driver.commands
+    assert connector.selectors.stats["send_without_note"]["misses"] == 1
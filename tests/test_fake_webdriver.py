@@ -0,0 +1,51 @@
+"""The fake driver itself: routes, script handlers and command counting"""
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+
+def test_routes_answer_lookups_and_count_commands():
+    driver = FakeWebDriver()
+    button = driver.dom.append(FakeElement("button", text="Connect"))
+    driver.route("Connect", lambda scope: scope.find_all(tag="button"))
+
+    assert driver.find_elements(By.XPATH, "//button[contains(., 'Connect')]") == [button]
+    assert driver.find_element(By.XPATH, "//button[contains(., 'Connect')]").text == "Connect"
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(By.XPATH, "//button[contains(., 'Follow')]")
+    assert driver.commands == {"findElements": 3, "getElementText": 1}
+
+
+def test_detached_elements_are_not_found():
+    driver = FakeWebDriver()
+    modal = driver.dom.append(FakeElement("div", attrs={"class": "artdeco-modal"}))
+    driver.route("artdeco-modal", lambda scope: [modal])
+    modal.remove()
+    assert driver.find_elements(By.CSS_SELECTOR, "div.artdeco-modal") == []
+
+
+def test_clicks_and_scripts_run_their_handlers():
+    driver = FakeWebDriver()
+    clicked = []
+    driver.dom.append(FakeElement("button", text="Send", on_click=lambda drv, element: clicked.append(element)))
+    driver.route("Send", lambda scope: scope.find_all(tag="button"))
+    driver.on_script("scrollHeight", lambda drv, *args: {"height": 1000, "args": list(args)})
+
+    button = driver.find_element(By.XPATH, "//button[.='Send']")
+    button.click()
+    assert clicked == [button]
+    assert driver.commands["clickElement"] == 1
+    assert driver.execute_script("return document.body.scrollHeight", 1, 2) == {"height": 1000, "args": [1, 2]}
+    assert driver.execute_script("return 1") is None
+
+    driver.reset_commands()
+    assert driver.command_count == 0 and driver.command_log == []
+
+
+def test_cookies_round_trip():
+    driver = FakeWebDriver()
+    driver.add_cookie({"name": "li_at", "value": "token", "domain": ".linkedin.com"})
+    assert [cookie["value"] for cookie in driver.get_cookies()] == ["token"]
@@ -0,0 +1,27 @@
+"""Persistent invitation ledger"""
+
+from linkedAuto import InvitationLedger
+
+
+def test_ledger_normalizes_and_updates(tmp_path):
+    ledger = InvitationLedger(str(tmp_path / "ledger.db"))
+    ledger.record("https://www.linkedin.com/in/Ada/?trk=x", "failed", "python")
+    assert ledger.status("https://www.linkedin.com/in/ada/") == "failed"
+    assert not ledger.is_done("https://www.linkedin.com/in/ada/")
+
+    ledger.record("https://www.linkedin.com/in/ada/", "sent")
+    assert ledger.is_done("https://www.linkedin.com/in/ADA")
+    keyword = ledger.connection.execute("SELECT keyword FROM invitations").fetchone()[0]
+    assert keyword == "python"
+    assert ledger.status("not a profile") is None
+    ledger.close()
+
+
+def test_ledger_survives_reopening(tmp_path):
+    path = str(tmp_path / "ledger.db")
+    ledger = InvitationLedger(path)
+    ledger.record("https://www.linkedin.com/in/grace/", "pending")
+    ledger.close()
+    reopened = InvitationLedger(path)
+    assert reopened.is_done("https://www.linkedin.com/in/grace/")
+    reopened.close()
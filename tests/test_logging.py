@@ -0,0 +1,28 @@
+"""Queue-backed structured logging"""
+
+import atexit
+import json
+
+import linkedAuto
+
+
+def test_json_log_keeps_the_exception_field(tmp_path, monkeypatch):
+    monkeypatch.setattr(linkedAuto.logger, "handlers", [])
+    log_file = tmp_path / "bot.log"
+    listener = linkedAuto.setup_logging(log_file=str(log_file), log_format="json")
+    monkeypatch.setattr(listener, "handlers", listener.handlers[:1])   # file only, keep stderr quiet
+    try:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            linkedAuto.logger.error("Request %s failed", 3, exc_info=True, extra={"phase": "search"})
+    finally:
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+    entry = json.loads(log_file.read_text(encoding="utf-8").splitlines()[0])
+    assert entry["message"] == "Request 3 failed"
+    assert entry["phase"] == "search"
+    assert "RuntimeError: boom" in entry["exception"]
+    for handler in listener.handlers:
+        handler.close()
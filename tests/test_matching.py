@@ -0,0 +1,109 @@
+"""PhraseMatcher, locale packs and CardRules"""
+
+import json
+
+import pytest
+
+import linkedAuto
+from linkedAuto import CardRules, PhraseMatcher
+
+
+def test_phrase_matcher_finds_every_category():
+    matcher = PhraseMatcher({"limit": ["weekly invitation limit"], "weekly_limit": ["weekly invitation limit"],
+                             "pending": ["pending"]})
+    assert matcher.match("You've reached the WEEKLY invitation limit") == {"limit", "weekly_limit"}
+    assert matcher.match("Invitation Pending") == {"pending"}
+    assert matcher.match("nothing here") == set()
+
+
+def test_phrase_matcher_folds_turkish_i():
+    matcher = PhraseMatcher({"limit": ["haftalık davet sınırı"]})
+    assert matcher.match("HAFTALIK DAVET SINIRINA ulaştınız") == {"limit"}
+    assert PhraseMatcher.fold("İSTANBUL ıI") == "istanbul ii"
+
+
+def test_phrase_matcher_reports_phrases_inside_longer_ones():
+    matcher = PhraseMatcher({"limit": ["limit has been reached"], "short": ["limit"]})
+    assert matcher.match("the limit has been reached") == {"limit", "short"}
+
+
+def test_phrases_fold_like_the_browser():
+    # The browser lowercases page text with toLowerCase(), which keeps ß
+    matcher = PhraseMatcher({"limit": ["Größe"]})
+    assert matcher.pattern == "größe"
+    assert matcher.match("GRÖßE der Einladungen") == {"limit"}
+
+
+def test_locale_packs_load_and_merge():
+    packs = linkedAuto.load_locale_packs()
+    assert {"en", "tr"} <= set(packs)
+    merged = linkedAuto.merge_locale_packs(packs)
+    assert set(packs["en"]["phrases"]["limit"]) <= set(merged["phrases"]["limit"])
+    assert set(packs["tr"]["phrases"]["limit"]) <= set(merged["phrases"]["limit"])
+
+
+def _rules(tmp_path, data):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_card_rules_compile_to_script_rules(tmp_path):
+    rules = CardRules(_rules(tmp_path, {
+        "include": [{"name": "python", "field": "headline", "keywords": ["Python", "Django"]},
+                    {"field": "location", "regex": "İstanbul|izmir"}],
+        "exclude": [{"name": "recruiters", "field": "headline", "keywords": "İşe alım"}]
+    }))
+    assert rules.script_rules() == [
+        [True, "headline", "python|django"],
+        [True, "location", "istanbul|izmir"],
+        [False, "headline", r"işe\ alim"],
+    ]
+    assert [name for name, _, _ in rules.report()] == ["python", "include rule #2 (location)", "recruiters"]
+
+
+def test_card_rule_keywords_fold_like_the_browser(tmp_path):
+    rules = CardRules(_rules(tmp_path, {"include": [{"field": "headline", "keywords": ["Straße"]}]}))
+    assert rules.script_rules() == [[True, "headline", "straße"]]
+
+
+def test_card_rules_count_hits_and_skips(tmp_path):
+    rules = CardRules(_rules(tmp_path, {"include": [{"field": "name", "keywords": ["ada"]}],
+                                        "exclude": [{"field": "headline", "regex": "recruit"}]}))
+    rules.record([{"allowed": True, "rule_hits": [0]}, {"allowed": False, "rule_hits": [0, 1]},
+                  {"allowed": False, "rule_hits": []}])
+    assert [hits for _, _, hits in rules.report()] == [2, 1]
+    assert (rules.cards_seen, rules.cards_skipped) == (3, 2)
+
+
+@pytest.mark.parametrize("data", [
+    [],
+    {"includes": []},
+    {"include": [{"field": "title", "regex": "x"}]},
+    {"include": [{"field": "name"}]},
+    {"include": [{"field": "name", "regex": "x", "keywords": ["x"]}]},
+    {"include": [{"field": "name", "keywords": ["", "  "]}]},
+    {"include": [{"field": "name", "regex": "("}]},
+])
+def test_card_rules_reject_invalid_files(tmp_path, data):
+    with pytest.raises(ValueError):
+        CardRules(_rules(tmp_path, data))
+
+
+@pytest.mark.parametrize("regex", ["(?>python)", "a++", "x(?#c)", "(?P<n>x)", "(?i)x", r"\Ax", "a{2}+", "(?(1)a|b)"])
+def test_card_rules_reject_python_only_regex(tmp_path, regex):
+    with pytest.raises(ValueError, match="browser"):
+        CardRules(_rules(tmp_path, {"exclude": [{"field": "name", "regex": regex}]}))
+
+
+@pytest.mark.parametrize("regex", [r"c\++", "[+]+", "(?:py)+", "(?<=x)y", r"\d+\s*", "a*?"])
+def test_card_rules_accept_portable_regex(tmp_path, regex):
+    CardRules(_rules(tmp_path, {"exclude": [{"field": "name", "regex": regex}]}))
+
+
+def test_connector_rejects_rules_the_browser_refuses(tmp_path, driver):
+    rules = CardRules(_rules(tmp_path, {"exclude": [{"name": "odd", "field": "name", "regex": "x"}]}))
+    driver.on_script("errors.push", lambda drv, script_rules: [[0, "Invalid group"]])
+    with pytest.raises(ValueError, match="odd: Invalid group"):
+        linkedAuto.LinkedInConnector(driver=driver, card_rules=rules)
+
@@ -0,0 +1,48 @@
+"""Profile URL normalization and streamed profile lists"""
+
+import csv
+
+import pytest
+
+from linkedAuto import ProfileResults, iter_profile_urls, normalize_profile_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/in/Ada-Lovelace/?miniProfileUrn=x", "https://www.linkedin.com/in/ada-lovelace/"),
+    ("linkedin.com/in/ada", None),
+    ("http://tr.linkedin.com/in/ada/details/experience/", "https://www.linkedin.com/in/ada/"),
+    ("https://www.linkedin.com/in/%C3%A7a%C4%9Flar/", "https://www.linkedin.com/in/çağlar/"),
+    ("https://www.linkedin.com/company/acme/", None),
+    ("", None),
+])
+def test_normalize_profile_url(url, expected):
+    assert normalize_profile_url(url) == expected
+
+
+def test_iter_profile_urls_reads_any_column_and_dedupes(tmp_path):
+    path = tmp_path / "leads.csv"
+    path.write_text("﻿name,profile\n"
+                    "Ada,https://www.linkedin.com/in/ada/\n"
+                    "\n"
+                    "Ada again,https://www.linkedin.com/in/ADA?trk=x\n"
+                    "Grace,note,www.linkedin.com/in/grace\n"
+                    "No profile,https://example.com\n", encoding="utf-8")
+    assert list(iter_profile_urls(str(path))) == ["https://www.linkedin.com/in/ada/",
+                                                  "https://www.linkedin.com/in/grace/"]
+
+
+def test_profile_results_skip_done_profiles_on_restart(tmp_path):
+    path = str(tmp_path / "results" / "leads_results.csv")
+    results = ProfileResults(path)
+    results.record("https://www.linkedin.com/in/ada/", "sent")
+    results.record("https://www.linkedin.com/in/grace/", "failed")
+    results.close()
+
+    with open(path, encoding="utf-8", newline="") as results_file:
+        rows = list(csv.reader(results_file))
+    assert rows[0] == list(ProfileResults.FIELDS)
+    assert len(rows) == 3
+
+    restarted = ProfileResults(path)
+    assert restarted.load() == 1
+    assert restarted.processed == {"https://www.linkedin.com/in/ada/"}
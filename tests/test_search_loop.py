@@ -0,0 +1,135 @@
+"""WebDriver round trips of the search loop and pagination"""
+
+import pytest
+
+import linkedAuto
+from tests.conftest import add_modal, script_calls
+from tests.fake_webdriver import FakeElement
+
+
+def _results_page(driver, profiles, limit_probe=None):
+    """Put one Connect button per profile on the page and answer the search loop's scripts"""
+    cards = []
+    for slug in profiles:
+        button = driver.dom.append(FakeElement(
+            "button", text="Connect", on_click=lambda drv, element: add_modal(drv, "send_without_note")))
+        cards.append({"id": f"urn:li:{slug}", "href": f"https://www.linkedin.com/in/{slug}/", "label": "Connect",
+                      "visible": True, "enabled": True, "rule_hits": [], "allowed": True, "element": button})
+    driver.on_script("rule_hits", lambda drv, *args: cards)
+    driver.on_script("scrollHeight", lambda drv, *args: {"cards": len(cards), "actionable": len(cards), "height": 1000})
+    driver.on_script("__linkedautoState", limit_probe or (lambda drv, *args: False))
+    return cards
+
+
+def test_search_sends_to_every_card(driver, make_connector):
+    _results_page(driver, ["ada", "grace", "linus"])
+    connector = make_connector(driver)
+
+    assert connector.send_connection_requests_from_search("python", max_requests=10) == 3
+    assert not driver.dom.find_all(cls="artdeco-modal")
+
+
+def test_next_page_round_trips(driver, make_connector):
+    clicked = []
+    driver.dom.append(FakeElement("button", text="next", on_click=lambda drv, element: clicked.append(element)))
+    connector = make_connector(driver)
+
+    assert connector._go_to_next_search_page()
+    assert clicked
+    # Traffic sample, button lookup and scroll into view, then the click
+    assert driver.commands == {"w3cExecuteScript": 3, "clickElement": 1}
+
+
+def test_last_page_has_no_next_button(driver, make_connector):
+    connector = make_connector(driver)
+
+    assert not connector._go_to_next_search_page()
+    assert "clickElement" not in driver.commands
+
+
+def test_checkpoint_keeps_the_requests_sent_before_ctrl_c(driver, make_connector, tmp_path):
+    cards = _results_page(driver, ["ada", "grace"])
+
+    def interrupt(drv, element):
+        raise KeyboardInterrupt
+    cards[1]["element"].on_click = interrupt
+    connector = make_connector(driver, checkpoint_dir=str(tmp_path))
+
+    with pytest.raises(KeyboardInterrupt):
+        connector.send_connection_requests_from_search("python", max_requests=10)
+    checkpoint = linkedAuto.SearchCheckpoint(str(tmp_path), "python", "default")
+    assert checkpoint.load()
+    assert (checkpoint.requests_sent, checkpoint.handled) == (1, {"urn:li:ada"})
+
+def _scrolls(driver):
+    return sum(1 for command, params in driver.command_log
+               if command == "w3cExecuteScript" and "scrollHeight" in params["script"] and params["args"][2])
+
+
+def test_scroll_stops_once_enough_buttons_are_loaded(driver, make_connector):
+    _results_page(driver, ["ada", "grace", "linus"])
+    connector = make_connector(driver)
+    connector.send_connection_requests_from_search("python", max_requests=2)
+    assert _scrolls(driver) == 0
+
+
+def test_skipped_cards_cost_no_limit_probes(driver, make_connector, tmp_path):
+    cards = _results_page(driver, ["ada", "grace", "linus"])
+    cards[1]["allowed"] = False
+    connector = make_connector(driver, ledger_path=str(tmp_path / "ledger.db"))
+    connector.ledger.record("https://www.linkedin.com/in/ada/", "sent")
+    driver.reset_commands()
+
+    assert connector.send_connection_requests_from_search("python", max_requests=10) == 1
+    # One probe after loading the page and one before the only card that is acted on, and
+    # no limit popup lookups while the probe finds no limit
+    assert script_calls(driver, "__linkedautoState") == 2
+    assert "findElements" not in driver.commands
+    assert connector.ledger.is_done("https://www.linkedin.com/in/linus/")
+    connector.ledger.close()
+
+
+def test_resume_does_not_skip_positional_ids(driver, make_connector, tmp_path):
+    cards = _results_page(driver, ["ada"])
+    cards[0].update(id="index-0", href=None)
+    connector = make_connector(driver, checkpoint_dir=str(tmp_path))
+
+    assert connector.send_connection_requests_from_search("python", max_requests=10) == 1
+    checkpoint = linkedAuto.SearchCheckpoint(str(tmp_path), "python", "default")
+    assert checkpoint.load()
+    assert "index-0" not in checkpoint.handled
+
+
+def test_scroll_stop_counts_only_cards_that_are_acted_on(driver, make_connector, tmp_path):
+    _results_page(driver, ["ada", "grace", "linus"])
+    connector = make_connector(driver, ledger_path=str(tmp_path / "ledger.db"))
+    # An empty ledger skips nothing, so the early stop still applies
+    connector.send_connection_requests_from_search("python", max_requests=2)
+    assert _scrolls(driver) == 0
+
+    # The first run put ada and grace in the ledger, leaving one loaded button to click
+    driver.reset_commands()
+    connector.send_connection_requests_from_search("python", max_requests=2)
+    assert _scrolls(driver) >= 1
+    connector.ledger.close()
+
+
+def test_limit_probe_closes_the_limit_popup(driver, make_connector):
+    popups = []
+
+    def limit_after_first_request(drv, *args):
+        if drv.commands["clickElement"] < 2:
+            return False
+        if not popups:
+            popup = drv.dom.append(FakeElement("div", text="You've reached the weekly invitation limit.",
+                                               attrs={"class": "artdeco-modal__content"}))
+            popup.append(FakeElement("button", text="dismiss", on_click=lambda drv, element: popup.remove()))
+            popups.append(popup)
+        return True
+
+    _results_page(driver, ["ada", "grace"], limit_probe=limit_after_first_request)
+    connector = make_connector(driver)
+
+    assert connector.send_connection_requests_from_search("python", max_requests=10) == 1
+    assert connector._limit_reported
+    assert not popups[0].attached
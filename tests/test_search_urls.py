@@ -0,0 +1,41 @@
+"""build_search_url and parse_search_filters"""
+
+from urllib.parse import urlparse, parse_qsl
+
+import pytest
+
+from linkedAuto import build_search_url, parse_search_filters
+
+BASE_URL = "https://www.linkedin.com"
+
+
+def test_search_url_escapes_keywords():
+    url = build_search_url(BASE_URL, "C++ & C# geliştirici")
+    assert url.startswith(f"{BASE_URL}/search/results/people/?")
+    assert dict(parse_qsl(urlparse(url).query)) == {"keywords": "C++ & C# geliştirici"}
+    assert " " not in url and "+" not in urlparse(url).query
+
+
+def test_search_url_adds_page_only_after_the_first():
+    assert "page=" not in build_search_url(BASE_URL, "python", page=1)
+    assert dict(parse_qsl(urlparse(build_search_url(BASE_URL, "python", page=4)).query))["page"] == "4"
+
+
+def test_search_url_encodes_filters_as_json_lists():
+    url = build_search_url(BASE_URL, "python", filters={"network": ["S", "O"], "geoUrn": ["103644278"]})
+    query = dict(parse_qsl(urlparse(url).query))
+    assert query["network"] == '["S","O"]'
+    assert query["geoUrn"] == '["103644278"]'
+    assert query["origin"] == "FACETED_SEARCH"
+
+
+def test_parse_search_filters_maps_degrees_and_ids():
+    assert parse_search_filters("2, 3rd+,2", "103644278", " 1441 ,1035") == {
+        "network": ["S", "O"], "geoUrn": ["103644278"], "currentCompany": ["1441", "1035"]}
+    assert parse_search_filters() == {}
+
+
+@pytest.mark.parametrize("kwargs", [{"network": "4"}, {"geo_urn": "istanbul"}, {"current_company": "12a"}])
+def test_parse_search_filters_rejects_bad_values(kwargs):
+    with pytest.raises(ValueError):
+        parse_search_filters(**kwargs)
@@ -0,0 +1,37 @@
+"""Encrypted session cookie file"""
+
+import os
+
+import pytest
+
+
+def test_encrypted_cookie_jar_round_trip(tmp_path):
+    pytest.importorskip("cryptography")
+    from linkedAuto import EncryptedCookieJar
+
+    path = str(tmp_path / "session.enc")
+    cookies = [{"name": "li_at", "value": "SECRET-TOKEN", "domain": ".linkedin.com"}]
+    jar = EncryptedCookieJar(path, "correct horse")
+    assert jar.load() is None
+    jar.save(cookies)
+
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    with open(path, encoding="utf-8") as jar_file:
+        assert "SECRET-TOKEN" not in jar_file.read()
+    assert EncryptedCookieJar(path, "correct horse").load() == cookies
+    with pytest.raises(ValueError, match="cannot be decrypted"):
+        EncryptedCookieJar(path, "wrong key").load()
+    with pytest.raises(ValueError):
+        EncryptedCookieJar(path, "")
+
+
+def test_profile_session_is_checked_when_the_session_file_is_missing(tmp_path, driver, make_connector):
+    pytest.importorskip("cryptography")
+    from linkedAuto import EncryptedCookieJar
+
+    jar = EncryptedCookieJar(str(tmp_path / "missing.enc"), "correct horse")
+    connector = make_connector(driver, session_dir=str(tmp_path / "profile"), cookie_jar=jar)
+
+    # The fake stays on whatever page it is sent to, like a still logged-in profile
+    assert connector.restore_session()
+    assert driver.current_url.endswith("/feed/")